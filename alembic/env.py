@@ -13,7 +13,11 @@ from app.core.config import settings
 
 # 2. Import *ALL* your models so Alembic sees them
 from app.models.company import Company
-from app.models.job import Job
+from app.models.job import Job, JobSimhashBand
+from app.models.enrichment_task import EnrichmentTask
+from app.models.search_result import CachedSearchResult
+from app.models.saved_search import SavedSearch, SearchNotification
+from app.models.scrape_run import ScrapeRun
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
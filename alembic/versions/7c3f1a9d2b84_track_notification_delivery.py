@@ -0,0 +1,55 @@
+"""Track notification delivery per notification
+
+Revision ID: 7c3f1a9d2b84
+Revises: 5e8d1a3f7c02
+Create Date: 2026-10-19 23:12:47.206514
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3f1a9d2b84'
+down_revision: Union[str, Sequence[str], None] = '5e8d1a3f7c02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('search_notifications', sa.Column('delivered_at', sa.DateTime(), nullable=True))
+    # Notifications at or below a user's cursor were acknowledged
+    op.execute(
+        "UPDATE search_notifications AS n SET delivered_at = c.updated_at "
+        "FROM notification_cursors AS c WHERE c.user_id = n.user_id AND n.id <= c.last_notification_id"
+    )
+    op.drop_index('ix_search_notifications_user_id_id', table_name='search_notifications')
+    op.create_index(
+        'ix_search_notifications_user_id_id_undelivered', 'search_notifications', ['user_id', 'id'],
+        unique=False, postgresql_where=sa.text('delivered_at IS NULL'),
+    )
+    op.drop_table('notification_cursors')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_table('notification_cursors',
+    sa.Column('user_id', sa.String(length=255), nullable=False),
+    sa.Column('last_notification_id', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    # A cursor can only approximate per-notification delivery: the newest delivered id
+    op.execute(
+        "INSERT INTO notification_cursors (user_id, last_notification_id) "
+        "SELECT user_id, max(id) FROM search_notifications WHERE delivered_at IS NOT NULL GROUP BY user_id"
+    )
+    op.drop_index(
+        'ix_search_notifications_user_id_id_undelivered', table_name='search_notifications',
+        postgresql_where=sa.text('delivered_at IS NULL'),
+    )
+    op.create_index('ix_search_notifications_user_id_id', 'search_notifications', ['user_id', 'id'], unique=False)
+    op.drop_column('search_notifications', 'delivered_at')
@@ -0,0 +1,46 @@
+"""Add config validation state
+
+Revision ID: a41c2e9b7f10
+Revises: 6857b601401e
+Create Date: 2026-10-19 09:12:04.318227
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41c2e9b7f10'
+down_revision: Union[str, Sequence[str], None] = '6857b601401e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("ALTER TYPE companystatus ADD VALUE IF NOT EXISTS 'PENDING_VALIDATION'")
+
+    op.add_column('companies', sa.Column('config_fingerprint', sa.String(length=64), nullable=True))
+    op.add_column('companies', sa.Column('is_config_valid', sa.Boolean(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('companies', 'is_config_valid')
+    op.drop_column('companies', 'config_fingerprint')
+
+    # Postgres cannot drop a single enum value, so rebuild the type without it
+    op.execute("ALTER TYPE companystatus RENAME TO companystatus_old")
+    op.execute("CREATE TYPE companystatus AS ENUM('UNCONFIGURED', 'ACTIVE', 'INACTIVE', 'ERROR')")
+    op.alter_column('companies', 'status', server_default=None)
+    op.execute("""
+        ALTER TABLE companies ALTER COLUMN status TYPE companystatus
+        USING CASE
+            WHEN status::text = 'PENDING_VALIDATION' THEN 'UNCONFIGURED'::companystatus
+            ELSE status::text::companystatus
+        END
+    """)
+    op.alter_column('companies', 'status', server_default='UNCONFIGURED')
+    op.execute("DROP TYPE companystatus_old")
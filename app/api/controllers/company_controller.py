@@ -1,17 +1,19 @@
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
 from app.models.company import CompanyStatus, ATSProvider
-from app.schemas.company import CompanyCreate, CompanyResponse, CompanyUpdate
+from app.schemas.company import CompanyCreate, CompanyImportReport, CompanyResponse, CompanyUpdate
 from app.services.company_service import (
     create_company, 
     get_companies, 
     get_company_by_id, 
     delete_company, 
     update_company,
+    import_companies,
+    parse_import_rows,
 )
 
 router = APIRouter()
@@ -41,14 +43,29 @@ async def list_companies(
 @router.post("/", response_model=CompanyResponse, status_code=status.HTTP_201_CREATED)
 async def create_new_company(
     company_in: CompanyCreate, 
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new company.
+    Provider config is validated in the background; until then the status is PENDING_VALIDATION.
     """
-    return await create_company(db, company_in)
+    return await create_company(db, company_in, background_tasks)
 
 
+@router.post("/import", response_model=CompanyImportReport)
+async def import_company_list(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Bulk import companies from a JSON array, JSONL or CSV body (chosen by Content-Type).
+    Returns a per-row report; provider configs are validated in the background.
+    """
+    rows = parse_import_rows(request.headers.get("content-type", "application/json"), await request.body())
+    return await import_companies(db, rows, background_tasks)
+
 
 @router.get("/{company_id}", response_model=CompanyResponse)
 async def read_company(company_id: UUID, db: AsyncSession = Depends(get_db)):
@@ -61,12 +78,14 @@ async def read_company(company_id: UUID, db: AsyncSession = Depends(get_db)):
 async def update_company_details(
     company_id: UUID, 
     company_in: CompanyUpdate, 
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """
     Update company details (name, credentials, status).
+    Only a changed ATS provider or config triggers a (background) revalidation.
     """
-    return await update_company(db, company_id, company_in)
+    return await update_company(db, company_id, company_in, background_tasks)
 
 
 @router.delete("/{company_id}", status_code=status.HTTP_204_NO_CONTENT)
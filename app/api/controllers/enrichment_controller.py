@@ -0,0 +1,40 @@
+from uuid import UUID
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.schemas.enrichment_task import EnrichmentBulkRequest, EnrichmentTaskResponse
+from app.services.enrichment_service import (
+    create_bulk_enrichment_task,
+    create_company_enrichment_task,
+    get_enrichment_task,
+)
+from app.workers.enrichment_worker import enrichment_workers
+
+router = APIRouter()
+
+
+@router.post("/companies/{company_id}", response_model=EnrichmentTaskResponse, status_code=status.HTTP_202_ACCEPTED)
+async def enrich_company(company_id: UUID, db: AsyncSession = Depends(get_db)):
+    """
+    Queue enrichment for a single company. Poll the returned task for the result.
+    """
+    task = await create_company_enrichment_task(db, company_id)
+    enrichment_workers.submit(task.id, [company_id])
+    return task
+
+@router.post("/bulk", response_model=EnrichmentTaskResponse, status_code=status.HTTP_202_ACCEPTED)
+async def enrich_companies(request: EnrichmentBulkRequest, db: AsyncSession = Depends(get_db)):
+    """
+    Queue enrichment for many companies (by default every UNCONFIGURED one).
+    """
+    task = await create_bulk_enrichment_task(db, request)
+    enrichment_workers.submit(task.id, [UUID(cid) for cid in task.company_ids])
+    return task
+
+@router.get("/tasks/{task_id}", response_model=EnrichmentTaskResponse)
+async def read_enrichment_task(task_id: UUID, db: AsyncSession = Depends(get_db)):
+    """
+    Get progress and per-company results of an enrichment task.
+    """
+    return await get_enrichment_task(db, task_id)
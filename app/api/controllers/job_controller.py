@@ -0,0 +1,90 @@
+from typing import List, Literal, Optional
+from uuid import UUID
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.models.job import JobStatus, UserVerdict
+from app.schemas.job import JobListItem, JobResponse, JobVerdictBatch, SimilarJob
+from app.services.job_service import get_job_by_id, get_job_duplicates, get_jobs, get_similar_jobs
+from app.services.relevance_service import record_verdicts
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[JobListItem])
+async def list_jobs(
+    company_id: Optional[UUID] = None,
+    status: Optional[JobStatus] = None,
+    user_verdict: Optional[UserVerdict] = None,
+    q: Optional[str] = None,
+    dedupe: bool = False,
+    sort: Literal["newest", "relevance"] = "newest",
+    country: Optional[str] = Query(None, min_length=2, max_length=2),
+    near: Optional[str] = None,
+    radius_km: float = Query(25, gt=0, le=20000),
+    skip: int = 0,
+    limit: int = 100,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    List jobs, newest first. `q` searches titles and plain-text descriptions.
+    With `dedupe`, near-duplicate postings are collapsed into their oldest (canonical) job.
+    `sort=relevance` orders by the score learned from user verdicts (unscored jobs last).
+    `country` filters by ISO country code; `near` (a city name or "lat,lon") with `radius_km`
+    keeps jobs whose normalized city lies within that distance.
+    """
+    return await get_jobs(
+        db,
+        skip=skip,
+        limit=limit,
+        company_id=company_id,
+        status=status,
+        user_verdict=user_verdict,
+        q=q,
+        dedupe=dedupe,
+        sort=sort,
+        country_code=country,
+        near=near,
+        radius_km=radius_km,
+    )
+
+@router.post("/verdicts", response_model=List[JobListItem])
+async def set_job_verdicts(
+    batch: JobVerdictBatch,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Set user verdicts for a batch of jobs (null clears one).
+    The relevance model is updated on the new verdicts in the background.
+    """
+    return await record_verdicts(db, batch.verdicts, background_tasks)
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def read_job(job_id: UUID, db: AsyncSession = Depends(get_db)):
+    """
+    Get a job with its sanitized description.
+    """
+    return await get_job_by_id(db, job_id)
+
+@router.get("/{job_id}/duplicates", response_model=List[JobListItem])
+async def list_job_duplicates(job_id: UUID, db: AsyncSession = Depends(get_db)):
+    """
+    Other postings of the same role (near-duplicate title and description), across companies.
+    """
+    return await get_job_duplicates(db, job_id)
+
+@router.get("/{job_id}/similar", response_model=List[SimilarJob])
+async def list_similar_jobs(
+    job_id: UUID,
+    k: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    "More like this": the k most similar non-archived jobs by title and description, across companies.
+    """
+    return [
+        SimilarJob(**JobListItem.model_validate(job).model_dump(), similarity=score)
+        for job, score in await get_similar_jobs(db, job_id, k)
+    ]
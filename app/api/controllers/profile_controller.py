@@ -0,0 +1,24 @@
+from typing import List
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.schemas.profile import ProfileInfo
+from app.services.profile_service import get_profile, list_profiles
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[ProfileInfo])
+def list_stored_profiles():
+    """
+    Stored profiles of API requests and scrape runs, newest first.
+    """
+    return list_profiles()
+
+@router.get("/{profile_id}", response_class=PlainTextResponse)
+def read_profile(profile_id: str):
+    """
+    A profile as folded stacks, one "frame;frame;frame count" line per stack,
+    for flamegraph.pl or speedscope.
+    """
+    return PlainTextResponse(get_profile(profile_id))
@@ -0,0 +1,61 @@
+from typing import List
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.schemas.saved_search import NotificationAck, NotificationResponse, SavedSearchCreate, SavedSearchResponse
+from app.services.saved_search_service import (
+    acknowledge_notifications,
+    create_saved_search,
+    delete_saved_search,
+    get_pending_notifications,
+    get_saved_searches,
+)
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[SavedSearchResponse])
+async def list_saved_searches(user_id: str, db: AsyncSession = Depends(get_db)):
+    """
+    List a user's saved searches.
+    """
+    return await get_saved_searches(db, user_id)
+
+@router.post("/", response_model=SavedSearchResponse, status_code=status.HTTP_201_CREATED)
+async def create_new_saved_search(search_in: SavedSearchCreate, db: AsyncSession = Depends(get_db)):
+    """
+    Save a search. All keywords must appear in the job title (or description unless `title_only`);
+    `city` and `company_id` narrow it further. New and changed jobs from scrapes are matched
+    against it and produce notifications.
+    """
+    return await create_saved_search(db, search_in)
+
+@router.get("/notifications", response_model=List[NotificationResponse])
+async def list_notifications(
+    user_id: str,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Undelivered notifications of a user, oldest first.
+    Acknowledge them by id once delivered.
+    """
+    return await get_pending_notifications(db, user_id, limit)
+
+@router.post("/notifications/ack")
+async def acknowledge_user_notifications(ack: NotificationAck, db: AsyncSession = Depends(get_db)):
+    """
+    Mark the listed notifications as delivered. Ids that are unknown, another user's
+    or already delivered are ignored.
+    """
+    acknowledged = await acknowledge_notifications(db, ack.user_id, ack.notification_ids)
+    return {"user_id": ack.user_id, "acknowledged": acknowledged}
+
+@router.delete("/{saved_search_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_existing_saved_search(saved_search_id: UUID, db: AsyncSession = Depends(get_db)):
+    """
+    Delete a saved search and its notifications.
+    """
+    await delete_saved_search(db, saved_search_id)
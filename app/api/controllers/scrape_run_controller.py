@@ -0,0 +1,58 @@
+from typing import List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.models.company import ATSProvider
+from app.schemas.scrape_run import CompanyCostGrowth, ScrapeRunResponse, ScrapeRunTrend
+from app.services.scrape_run_service import (
+    TrendBucket,
+    TrendGroup,
+    get_cost_growth,
+    get_recent_runs,
+    get_trends,
+)
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[ScrapeRunResponse])
+async def list_scrape_runs(
+    company_id: Optional[UUID] = None,
+    provider: Optional[ATSProvider] = None,
+    failed_only: bool = False,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Most recent scrape runs, newest first, with their cost and outcome.
+    """
+    return await get_recent_runs(db, limit, company_id, provider, failed_only)
+
+@router.get("/trends", response_model=List[ScrapeRunTrend])
+async def read_scrape_run_trends(
+    group_by: TrendGroup = "provider",
+    bucket: TrendBucket = "day",
+    days: int = Query(30, ge=1, le=365),
+    company_id: Optional[UUID] = None,
+    provider: Optional[ATSProvider] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Runs, failures, requests, bytes, pages, timings and job counts per company or
+    provider and per hour, day or week over the last `days`.
+    """
+    return await get_trends(db, group_by, days, bucket, company_id, provider)
+
+@router.get("/cost-growth", response_model=List[CompanyCostGrowth])
+async def read_company_cost_growth(
+    days: int = Query(7, ge=1, le=180),
+    limit: int = Query(20, ge=1, le=500),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Companies whose mean bytes per run grew the most in the last `days` compared with
+    the `days` before: candidates for a longer scrape interval.
+    """
+    return await get_cost_growth(db, days, limit)
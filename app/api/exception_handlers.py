@@ -3,7 +3,16 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from loguru import logger
 
-from app.core.exceptions import CompanyNotFoundError, CompanyAlreadyExistsError, CompanyValidationError
+from app.core.exceptions import (
+    CompanyNotFoundError,
+    CompanyAlreadyExistsError,
+    CompanyValidationError,
+    EnrichmentTaskNotFoundError,
+    JobNotFoundError,
+    LocationNotFoundError,
+    ProfileNotFoundError,
+    SavedSearchNotFoundError,
+)
 
 
 def register_exception_handlers(app: FastAPI):
@@ -26,7 +35,27 @@ def register_exception_handlers(app: FastAPI):
     async def company_validation_handler(request: Request, exc: CompanyValidationError):
         return JSONResponse(status_code=400, content={"detail": str(exc)})
 
+    @app.exception_handler(EnrichmentTaskNotFoundError)
+    async def enrichment_task_not_found_handler(request: Request, exc: EnrichmentTaskNotFoundError):
+        return JSONResponse(status_code=404, content={"detail": str(exc)})
+
+    @app.exception_handler(JobNotFoundError)
+    async def job_not_found_handler(request: Request, exc: JobNotFoundError):
+        return JSONResponse(status_code=404, content={"detail": str(exc)})
+
+    @app.exception_handler(LocationNotFoundError)
+    async def location_not_found_handler(request: Request, exc: LocationNotFoundError):
+        return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+    @app.exception_handler(SavedSearchNotFoundError)
+    async def saved_search_not_found_handler(request: Request, exc: SavedSearchNotFoundError):
+        return JSONResponse(status_code=404, content={"detail": str(exc)})
+
+    @app.exception_handler(ProfileNotFoundError)
+    async def profile_not_found_handler(request: Request, exc: ProfileNotFoundError):
+        return JSONResponse(status_code=404, content={"detail": str(exc)})
+
     @app.exception_handler(Exception)
     async def generic_error_handler(request: Request, exc: Exception):
-        logger.error(f"Unhandled error on {request.method} {request.url}: {exc}")
+        logger.error("Unhandled error on {} {}: {}", request.method, request.url, exc)
         return JSONResponse(status_code=500, content={"detail": "Internal server error"})
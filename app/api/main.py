@@ -1,15 +1,34 @@
-from fastapi import FastAPI
+import time
+from uuid import uuid4
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from loguru import logger
 
+from app.core import metrics, profiler, tracing
+from app.core.log import configure_logging
 from app.core.config import settings
-from app.api.controllers import company_controller
+from app.api.controllers import (
+    company_controller,
+    enrichment_controller,
+    job_controller,
+    profile_controller,
+    saved_search_controller,
+    scrape_run_controller,
+)
 from app.api.exception_handlers import register_exception_handlers
+from app.db import query_tracker
 from app import models
+from app.workers.cpu_stage import cpu_stage
+from app.workers.enrichment_worker import enrichment_workers
+from app.services.similarity_service import similarity_index
 
 
 import sys
 
+configure_logging()
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
 )
@@ -24,11 +43,89 @@ app.add_middleware(
 
 register_exception_handlers(app)
 
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    started = time.perf_counter()
+    status = "500"
+    try:
+        response = await call_next(request)
+        status = str(response.status_code)
+        return response
+    finally:
+        # Route templates ("/api/jobs/{job_id}") keep label cardinality bounded
+        route = getattr(request.scope.get("route"), "path", "unmatched")
+        metrics.http_requests.inc(request.method, route, status)
+        metrics.http_request_duration.observe(time.perf_counter() - started, request.method, route)
+
+
+@app.middleware("http")
+async def track_request_queries(request: Request, call_next):
+    with query_tracker.track_queries("request", f"{request.method} {request.url.path}") as stats:
+        response = await call_next(request)
+    if settings.DEBUG:
+        response.headers["X-DB-Statements"] = str(stats.statements)
+        response.headers["X-DB-Time-Ms"] = f"{stats.seconds * 1000:.1f}"
+        if stats.repeated:
+            response.headers["X-DB-Repeated-Statements"] = ",".join(stats.repeated)
+    return response
+
+
+@app.middleware("http")
+async def profile_request(request: Request, call_next):
+    requested = request.headers.get("X-Profile") == "1" or request.query_params.get("profile") in ("1", "true")
+    if not (settings.PROFILING_ENABLED and requested):
+        return await call_next(request)
+
+    with profiler.profiling("request", uuid4(), f"{request.method} {request.url.path}") as profile:
+        response = await call_next(request)
+    response.headers["X-Profile-Id"] = profile.id
+    return response
+
+
+@app.middleware("http")
+async def trace_request(request: Request, call_next):
+    with tracing.span(
+        f"{request.method} {request.url.path}", kind="SERVER", traceparent=request.headers.get("traceparent"),
+        **{"http.request.method": request.method, "url.path": request.url.path},
+    ) as span:
+        response = await call_next(request)
+        # Named after the route template once routing has happened
+        route = getattr(request.scope.get("route"), "path", None)
+        if route:
+            span.rename(f"{request.method} {route}")
+            span.set_attribute("http.route", route)
+        span.set_attribute("http.response.status_code", response.status_code)
+    if span.traceparent:
+        response.headers["traceparent"] = span.traceparent
+    return response
+
+
 app.include_router(company_controller.router, prefix="/api/companies", tags=["companies"])
+app.include_router(enrichment_controller.router, prefix="/api/enrichment", tags=["enrichment"])
+app.include_router(job_controller.router, prefix="/api/jobs", tags=["jobs"])
+app.include_router(profile_controller.router, prefix="/api/profiles", tags=["profiles"])
+app.include_router(saved_search_controller.router, prefix="/api/saved-searches", tags=["saved searches"])
+app.include_router(scrape_run_controller.router, prefix="/api/scrape-runs", tags=["scrape runs"])
 
 @app.on_event("startup")
 async def startup_event():
     logger.info("Starting Finder API...")
+    cpu_stage.start()
+    await enrichment_workers.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await enrichment_workers.stop()
+    cpu_stage.stop()
+    if similarity_index.dirty:
+        similarity_index.save()
+    # Drains the enqueued sink
+    await logger.complete()
+
+@app.get("/metrics", include_in_schema=False)
+def read_metrics():
+    return PlainTextResponse(metrics.registry.render(), media_type="text/plain; version=0.0.4")
 
 @app.get("/")
 def read_root():
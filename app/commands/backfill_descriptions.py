@@ -0,0 +1,28 @@
+"""
+Derives sanitized HTML, plain text and snippets for jobs stored before the
+derivation pipeline existed (or for all jobs with --force).
+
+    python -m app.commands.backfill_descriptions --batch-size 500
+"""
+import argparse
+import asyncio
+
+from app.core.log import configure_logging
+from app.services.job_service import backfill_descriptions
+from app.workers.cpu_stage import cpu_stage
+
+
+async def main(args: argparse.Namespace) -> None:
+    try:
+        updated = await backfill_descriptions(batch_size=args.batch_size, force=args.force)
+        print(f"Backfilled {updated} jobs")
+    finally:
+        cpu_stage.stop()
+
+
+if __name__ == "__main__":
+    configure_logging()
+    parser = argparse.ArgumentParser(description="Backfill derived job description fields")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--force", action="store_true", help="Recompute jobs that already have derived fields")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,27 @@
+"""
+Computes SimHash fingerprints and duplicate links for jobs stored before
+duplicate detection existed. Run after backfill_descriptions.
+
+    python -m app.commands.backfill_fingerprints --batch-size 500
+"""
+import argparse
+import asyncio
+
+from app.core.log import configure_logging
+from app.services.duplicate_service import backfill_fingerprints
+from app.workers.cpu_stage import cpu_stage
+
+
+async def main(args: argparse.Namespace) -> None:
+    try:
+        indexed = await backfill_fingerprints(batch_size=args.batch_size)
+        print(f"Fingerprinted {indexed} jobs")
+    finally:
+        cpu_stage.stop()
+
+
+if __name__ == "__main__":
+    configure_logging()
+    parser = argparse.ArgumentParser(description="Backfill job SimHash fingerprints")
+    parser.add_argument("--batch-size", type=int, default=500)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,27 @@
+"""
+Normalizes the location (canonical city, country, coordinates) of jobs stored
+before location normalization existed, or after changing GAZETTEER_PATH, and
+re-resolves the city of saved searches to the same canonical names.
+
+    python -m app.commands.backfill_locations --batch-size 1000
+"""
+import argparse
+import asyncio
+
+from app.core.log import configure_logging
+from app.services.location_service import backfill_locations
+from app.services.saved_search_service import backfill_search_cities
+
+
+async def main(args: argparse.Namespace) -> None:
+    updated = await backfill_locations(batch_size=args.batch_size)
+    print(f"Normalized locations for {updated} jobs")
+    searches = await backfill_search_cities()
+    print(f"Normalized cities of {searches} saved searches")
+
+
+if __name__ == "__main__":
+    configure_logging()
+    parser = argparse.ArgumentParser(description="Backfill normalized job locations")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,28 @@
+"""
+Rebuilds the "more like this" similarity index from every non-archived job.
+Scrapes keep the index up to date incrementally; use this after deploying,
+after backfill_descriptions, or if the index file was lost.
+
+    python -m app.commands.rebuild_similarity_index --batch-size 1000
+"""
+import argparse
+import asyncio
+
+from app.core.log import configure_logging
+from app.services.similarity_service import rebuild_index
+from app.workers.cpu_stage import cpu_stage
+
+
+async def main(args: argparse.Namespace) -> None:
+    try:
+        indexed = await rebuild_index(batch_size=args.batch_size)
+        print(f"Indexed {indexed} jobs")
+    finally:
+        cpu_stage.stop()
+
+
+if __name__ == "__main__":
+    configure_logging()
+    parser = argparse.ArgumentParser(description="Rebuild the job similarity index")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,35 @@
+"""
+Records a live scrape of one tenant into a cassette, for offline scraper tests and
+benchmarks (see app/providers/cassettes.py). Secret query parameters and the config's
+token are scrubbed from the file. Nothing is written to the database.
+
+    python -m app.commands.record_cassette COMEET '{"uid": "...", "token": "..."}' tests/providers/cassettes/acme.json
+"""
+import argparse
+import asyncio
+import json
+
+from app.core.log import configure_logging
+from app.models.company import ATSProvider, Company
+from app.providers.cassettes import use_cassette
+from app.providers.scrapers.factory import ScraperFactory
+
+
+async def main(args: argparse.Namespace) -> None:
+    config = json.loads(args.config)
+    company = Company(name=args.name, ats_provider=ATSProvider(args.provider.upper()), metadata_config=config)
+    scraper = ScraperFactory.get_scraper(company)
+
+    with use_cassette(args.path, mode="record", secrets=[config.get("token")]) as cassette:
+        jobs = await scraper.fetch_jobs()
+    print(f"Recorded {len(cassette.interactions)} exchanges ({len(jobs)} jobs) to {args.path}")
+
+
+if __name__ == "__main__":
+    configure_logging()
+    parser = argparse.ArgumentParser(description="Record a provider scrape into a cassette")
+    parser.add_argument("provider", help="ATS provider, e.g. COMEET, WORKDAY, WORKABLE")
+    parser.add_argument("config", help="Company metadata config as JSON")
+    parser.add_argument("path", help="Cassette file to write")
+    parser.add_argument("--name", default="cassette", help="Company name used in logs")
+    asyncio.run(main(parser.parse_args()))
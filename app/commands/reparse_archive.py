@@ -0,0 +1,46 @@
+"""
+Rebuilds jobs from archived provider responses after a parser fix, without
+provider traffic: each company's newest complete archived run is re-parsed and
+applied through the normal scrape upsert path. Runs are archived with
+RESPONSE_ARCHIVE_ENABLED (or archive=True per scrape). Companies scraped since
+their newest complete archived run are skipped and listed.
+
+    python -m app.commands.reparse_archive [--company-id UUID ...]
+"""
+import argparse
+import asyncio
+from uuid import UUID
+
+from app.core.exceptions import StaleArchivedRunError
+from app.core.log import configure_logging
+from app.services.scraping_service import reparse_archive
+from app.workers.cpu_stage import cpu_stage
+
+
+async def main(args: argparse.Namespace) -> None:
+    try:
+        results = await reparse_archive(company_ids=args.company_id)
+    finally:
+        cpu_stage.stop()
+
+    skipped = {company_id: e for company_id, e in results.items() if isinstance(e, StaleArchivedRunError)}
+    failed = {
+        company_id: e for company_id, e in results.items()
+        if isinstance(e, Exception) and company_id not in skipped
+    }
+    for company_id, e in skipped.items():
+        print(f"{company_id}: skipped: {e}")
+    for company_id, e in failed.items():
+        print(f"{company_id}: {e}")
+    new_jobs = sum(count for count in results.values() if not isinstance(count, Exception))
+    print(
+        f"Re-parsed {len(results) - len(failed) - len(skipped)} of {len(results)} companies "
+        f"({new_jobs} new jobs, {len(skipped)} skipped with stale archives)"
+    )
+
+
+if __name__ == "__main__":
+    configure_logging()
+    parser = argparse.ArgumentParser(description="Re-parse archived provider responses into jobs")
+    parser.add_argument("--company-id", type=UUID, action="append", help="Repeatable; every archived company by default")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,24 @@
+"""
+Rebuilds the relevance model from every job with a user verdict and re-scores
+all NEW jobs. Verdicts set through the API already update the model incrementally;
+use this after bulk verdict imports or to start over.
+
+    python -m app.commands.retrain_relevance
+"""
+import argparse
+import asyncio
+
+from app.core.log import configure_logging
+from app.services.relevance_service import retrain
+
+
+async def main(args: argparse.Namespace) -> None:
+    trained = await retrain(batch_size=args.batch_size)
+    print(f"Trained relevance model on {trained} verdicts")
+
+
+if __name__ == "__main__":
+    configure_logging()
+    parser = argparse.ArgumentParser(description="Retrain the job relevance model")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    asyncio.run(main(parser.parse_args()))
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -10,6 +12,83 @@ class Settings(BaseSettings):
     RABBITMQ_USER: str
     RABBITMQ_PASS: str
     RABBITMQ_URL: str
+
+    LOG_LEVEL: str = "INFO"
+    # One JSON object per record, with bound fields (like the scrape_run summary) as keys
+    LOG_JSON: bool = False
+    # Records below ERROR per call site (or bound key) per window; the rest are dropped and counted
+    LOG_RATE_LIMIT: int = 20
+    LOG_RATE_WINDOW: float = 60
+
+    VALIDATION_CACHE_POSITIVE_TTL: int = 3600
+    VALIDATION_CACHE_NEGATIVE_TTL: int = 300
+    VALIDATION_CACHE_MAX_SIZE: int = 1024
+
+    COMPANY_IMPORT_BATCH_SIZE: int = 500
+    COMPANY_IMPORT_MAX_ROWS: int = 10000
+    COMPANY_IMPORT_VALIDATION_CONCURRENCY: int = 5
+
+    SCRAPE_FLEET_CONCURRENCY: int = 8
+
+    # Conditional list requests (ETag / Last-Modified / body digest) per company endpoint;
+    # validators older than the max age are ignored, so every tenant is fully re-scraped at least that often
+    # (detail-only edits do not show in list responses)
+    RESPONSE_VALIDATION_ENABLED: bool = True
+    RESPONSE_VALIDATOR_MAX_AGE: int = 86400
+
+    # Raw provider responses of every scrape run (or per call with archive=True), for
+    # app.commands.reparse_archive; see app/providers/archive.py
+    RESPONSE_ARCHIVE_ENABLED: bool = False
+    RESPONSE_ARCHIVE_DIR: str = "data/responses"
+    RESPONSE_ARCHIVE_RUNS_PER_COMPANY: int = 3
+
+    # tracemalloc accounting of every scrape run (or per call with memory=True); see app/core/memory.py
+    SCRAPE_MEMORY_TRACKING: bool = False
+    SCRAPE_MEMORY_FRAMES: int = 10
+    SCRAPE_MEMORY_TOP_SITES: int = 10
+
+    # Adds X-DB-* statement summaries to API responses
+    DEBUG: bool = False
+    # A statement shape running more often than this in one request or scrape run is an N+1;
+    # it is logged, or raised as RepeatedQueryError when strict (for tests)
+    QUERY_REPEAT_THRESHOLD: int = 20
+    QUERY_REPEAT_STRICT: bool = False
+
+    # Lets API callers request a profile with "X-Profile: 1" or "?profile=1"
+    PROFILING_ENABLED: bool = False
+    PROFILE_INTERVAL_MS: float = 5
+    PROFILE_DIR: str = "data/profiles"
+    PROFILE_MAX_FILES: int = 200
+
+    # Span tracing of requests, scrape runs and enrichment; one OTLP/JSON file per trace
+    TRACING_ENABLED: bool = False
+    TRACE_DIR: str = "data/traces"
+    TRACE_MAX_FILES: int = 1000
+
+    CPU_STAGE_WORKERS: int = 2
+    CPU_STAGE_BATCH_SIZE: int = 100
+    CPU_STAGE_MAX_PENDING_BATCHES: int = 8
+
+    RELEVANCE_MODEL_PATH: str = "data/relevance_model.joblib"
+    RELEVANCE_SCORE_BATCH_SIZE: int = 1000
+    # Verdict batches within this many seconds share one re-score of NEW jobs
+    RELEVANCE_RESCORE_DELAY: float = 30
+    # Changed or cleared verdicts within this many seconds share one full retrain
+    RELEVANCE_RETRAIN_DELAY: float = 300
+
+    SIMILARITY_INDEX_PATH: str = "data/job_similarity.npz"
+    SIMILARITY_INDEX_NPROBE: int = 8
+    SIMILARITY_INDEX_TRAIN_THRESHOLD: int = 20000
+    SIMILARITY_INDEX_SAVE_EVERY: int = 500
+
+    # TSV of cities (see app/providers/scrapers/locations.py); the bundled gazetteer when unset
+    GAZETTEER_PATH: Optional[str] = None
+
+    ENRICHMENT_WORKERS: int = 2
+    ENRICHMENT_RATE_PER_MINUTE: float = 12
+    ENRICHMENT_RATE_LIMIT_COOLDOWN: int = 120
+    ENRICHMENT_MAX_ATTEMPTS: int = 3
+    ENRICHMENT_SEARCH_CACHE_TTL: int = 7 * 24 * 3600
     
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
@@ -14,18 +14,28 @@ class FatalProviderError(ProviderError):
     """Permanent issues (404, 403, Bad Config)"""
     pass
 
+class ContentNotModifiedError(ProviderError):
+    """Raised by a scrape whose list responses match the stored validators; there is nothing to update."""
+    pass
+
 class EnrichmentError(JobFinderError):
     """Base class for enrichment errors"""
     pass
 
 class EnrichmentRateLimitError(EnrichmentError):
     """Raised when an external service rate limits the request"""
-    pass
+    def __init__(self, message: str, retry_after: float | None = None):
+        self.retry_after = retry_after
+        super().__init__(message)
 
 class EnrichmentNotFoundError(EnrichmentError):
     """Raised when data cannot be found"""
     pass
 
+class EnrichmentTaskNotFoundError(EnrichmentError):
+    """Raised when an enrichment task is not found"""
+    pass
+
 class CompanyAlreadyExistsError(JobFinderError):
     """Raised when a company already exists."""
     pass
@@ -36,4 +46,32 @@ class CompanyNotFoundError(JobFinderError):
 
 class CompanyValidationError(JobFinderError):
     """Raised when a company status transition is invalid."""
-    pass
\ No newline at end of file
+    pass
+
+class JobNotFoundError(JobFinderError):
+    """Raised when a job is not found."""
+    pass
+
+class LocationNotFoundError(JobFinderError):
+    """Raised when a place cannot be resolved in the gazetteer."""
+    pass
+
+class SavedSearchNotFoundError(JobFinderError):
+    """Raised when a saved search is not found."""
+    pass
+
+class ArchivedRunNotFoundError(JobFinderError):
+    """Raised when a company has no complete archived scrape run to re-parse."""
+    pass
+
+class StaleArchivedRunError(JobFinderError):
+    """Raised when a company's newest complete archived run is older than its last applied scrape."""
+    pass
+
+class ProfileNotFoundError(JobFinderError):
+    """Raised when a stored profile is not found."""
+    pass
+
+class RepeatedQueryError(JobFinderError):
+    """Raised in strict mode when one statement shape repeats too often in a unit of work (N+1)."""
+    pass
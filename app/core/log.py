@@ -0,0 +1,83 @@
+"""
+Logging setup. Records go through one loguru sink that is enqueued (written by a
+background thread, so the event loop never blocks on log I/O) and filtered before
+they are queued:
+
+- ERROR and above, and structured event records (bound with `event=...`, like the
+  per-run scrape_run summary), always pass.
+- other records are rate limited per key, LOG_RATE_LIMIT per LOG_RATE_WINDOW
+  seconds. The key is `logger.bind(key=...)` or else the call site. The first record
+  of a key after a suppressed window notes how many were dropped.
+- records bound with `sample=p` pass with probability p.
+
+Hot paths log with brace-style arguments (`logger.debug("offset {}", offset)`), which
+loguru only formats for records at or above the configured level.
+"""
+import random
+import sys
+import threading
+import time
+from typing import Any, Dict, Hashable, List
+
+from loguru import logger
+
+from app.core import metrics
+from app.core.config import settings
+
+ERROR_LEVEL = 40
+
+dropped_records = metrics.counter(
+    "jobfinder_log_records_dropped", "Log records dropped before the sink: rate_limited or sampled.", ["reason"],
+)
+
+
+class RecordFilter:
+    """Per-key fixed-window rate limit plus opt-in sampling; errors and events always pass."""
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        # key -> [window start, records passed, records suppressed]
+        self._windows: Dict[Hashable, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, record: Dict[str, Any]) -> bool:
+        if record["level"].no >= ERROR_LEVEL or "event" in record["extra"]:
+            return True
+
+        sample = record["extra"].get("sample")
+        if sample is not None and random.random() >= sample:
+            dropped_records.inc("sampled")
+            return False
+
+        key = record["extra"].get("key") or (record["name"], record["line"])
+        now = time.monotonic()
+        with self._lock:
+            state = self._windows.get(key)
+            if state is None or now - state[0] >= self.window:
+                suppressed = state[2] if state else 0
+                self._windows[key] = [now, 1, 0]
+            elif state[1] < self.limit:
+                state[1] += 1
+                return True
+            else:
+                state[2] += 1
+                dropped_records.inc("rate_limited")
+                return False
+
+        if suppressed:
+            record["extra"]["suppressed"] = suppressed
+            record["message"] += f" ({suppressed} similar records suppressed)"
+        return True
+
+
+def configure_logging() -> None:
+    """Replaces loguru's default synchronous stderr sink with the enqueued, filtered one."""
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level=settings.LOG_LEVEL,
+        serialize=settings.LOG_JSON,
+        enqueue=True,
+        filter=RecordFilter(settings.LOG_RATE_LIMIT, settings.LOG_RATE_WINDOW),
+    )
@@ -0,0 +1,99 @@
+"""
+Optional memory accounting for scrape runs. For an instrumented run, tracemalloc is
+started (if it isn't already) with its peak reset, and on exit the run's stats get:
+the traced peak above the starting level, the top allocation sites still holding
+memory at the checkpoint (after fetch, when every parsed posting is alive; the end of
+the run without one), attributed to the innermost frame in app code, and the growth of
+live gc-tracked objects per type. tracemalloc and gc are process-wide, so instrumented
+runs are serialized by a lock, and concurrent uninstrumented work is counted with them.
+"""
+import asyncio
+import gc
+import tracemalloc
+from collections import Counter
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.run_stats import ScrapeRunStats
+
+_APP_ROOT = str(Path(__file__).resolve().parents[1])
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, __file__),
+)
+
+_lock = asyncio.Lock()
+_checkpoint: ContextVar[Optional[Dict[str, tracemalloc.Snapshot]]] = ContextVar("memory_checkpoint", default=None)
+
+
+def _object_counts() -> Counter:
+    return Counter(type(obj).__qualname__ for obj in gc.get_objects())
+
+
+def _site(traceback: tracemalloc.Traceback) -> str:
+    """Innermost frame in app code ("app/providers/scrapers/comeet_scraper.py:71"), else the innermost frame."""
+    # Frames are ordered oldest first
+    for frame in reversed(traceback):
+        if frame.filename.startswith(_APP_ROOT):
+            return f"app{frame.filename[len(_APP_ROOT):]}:{frame.lineno}"
+    frame = traceback[-1]
+    return f"{frame.filename}:{frame.lineno}"
+
+
+def top_allocations(snapshot: tracemalloc.Snapshot, baseline: tracemalloc.Snapshot, limit: int) -> List[Dict]:
+    """Sites whose held memory grew most since `baseline`, grouped by `_site`."""
+    sizes: Counter = Counter()
+    counts: Counter = Counter()
+    for stat in snapshot.filter_traces(_IGNORED).compare_to(baseline.filter_traces(_IGNORED), "traceback"):
+        if stat.size_diff > 0:
+            site = _site(stat.traceback)
+            sizes[site] += stat.size_diff
+            counts[site] += stat.count_diff
+    return [{"site": site, "size_bytes": size, "count": counts[site]} for site, size in sizes.most_common(limit)]
+
+
+def checkpoint() -> None:
+    """Marks the point of the instrumented run whose allocations are reported (no-op otherwise)."""
+    snapshots = _checkpoint.get()
+    if snapshots is not None and "checkpoint" not in snapshots:
+        snapshots["checkpoint"] = tracemalloc.take_snapshot()
+
+
+@asynccontextmanager
+async def track_memory(stats: ScrapeRunStats) -> AsyncIterator[None]:
+    """Records peak memory, top allocation sites and retained objects of the enclosed run on `stats`."""
+    async with _lock:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(settings.SCRAPE_MEMORY_FRAMES)
+        tracemalloc.reset_peak()
+        baseline_bytes, _ = tracemalloc.get_traced_memory()
+        objects_before = _object_counts()
+        snapshots = {"baseline": tracemalloc.take_snapshot()}
+        token = _checkpoint.set(snapshots)
+        try:
+            yield
+        finally:
+            _checkpoint.reset(token)
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            snapshot = snapshots.get("checkpoint") or tracemalloc.take_snapshot()
+            if started_tracing:
+                tracemalloc.stop()
+
+            stats.memory_peak_bytes = max(0, peak_bytes - baseline_bytes)
+            stats.memory_top_allocations = top_allocations(
+                snapshot, snapshots["baseline"], settings.SCRAPE_MEMORY_TOP_SITES
+            )
+            # Drop the snapshots before counting so they don't show up as retained
+            del snapshot
+            snapshots.clear()
+            growth = _object_counts()
+            growth.subtract(objects_before)
+            stats.memory_retained_objects = {
+                name: count for name, count in growth.most_common(settings.SCRAPE_MEMORY_TOP_SITES) if count > 0
+            }
@@ -0,0 +1,260 @@
+"""
+In-process metrics in the Prometheus text exposition format, served at /metrics.
+Recording is a dict lookup and an addition under a lock, cheap enough for
+per-request and per-statement hot paths; rendering happens only when scraped.
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+# Seconds; covers fast DB statements up to slow multi-page scrapes
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Sequence[str]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(label) for label in labels)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines += [f"{name}{labels} {_format_value(value)}" for name, labels, value in self.samples()]
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [(f"{self.name}_total", _format_labels(self.labelnames, key), value) for key, value in items]
+
+
+class Gauge(Metric):
+    """A settable value, or one read from `function` at render time (e.g. pool usage)."""
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        function: Optional[Callable[[], float]] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._function = function
+
+    def set(self, value: float, *labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def value(self, *labels: str) -> float:
+        if self._function is not None:
+            return self._function()
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        if self._function is not None:
+            try:
+                return [(self.name, "", self._function())]
+            except Exception:
+                return []
+        with self._lock:
+            items = sorted(self._values.items())
+        return [(self.name, _format_labels(self.labelnames, key), value) for key, value in items]
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [non-cumulative bucket counts..., +Inf count], sum
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+            counts[index] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labels)
+
+    def count(self, *labels: str) -> int:
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        with self._lock:
+            items = sorted((key, list(counts), self._sums[key]) for key, counts in self._counts.items())
+
+        samples = []
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                samples.append((
+                    f"{self.name}_bucket", _format_labels((*self.labelnames, "le"), (*key, le)), cumulative
+                ))
+            labels = _format_labels(self.labelnames, key)
+            samples.append((f"{self.name}_sum", labels, total))
+            samples.append((f"{self.name}_count", labels, cumulative))
+        return samples
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+registry = Registry()
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+    return registry.register(Counter(name, documentation, labelnames))
+
+
+def gauge(
+    name: str, documentation: str, labelnames: Sequence[str] = (), function: Optional[Callable[[], float]] = None
+) -> Gauge:
+    return registry.register(Gauge(name, documentation, labelnames, function))
+
+
+def histogram(
+    name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+) -> Histogram:
+    return registry.register(Histogram(name, documentation, labelnames, buckets))
+
+
+# --- Providers ---------------------------------------------------------------
+
+provider_requests = counter(
+    "jobfinder_provider_requests", "HTTP requests to ATS providers by status code ('error' for transport failures).",
+    ["provider", "method", "status"],
+)
+provider_request_duration = histogram(
+    "jobfinder_provider_request_duration_seconds", "Latency of HTTP requests to ATS providers.", ["provider"],
+)
+
+# --- Scrapes -----------------------------------------------------------------
+
+scrape_runs = counter("jobfinder_scrape_runs", "Company scrape runs by result.", ["provider", "result"])
+scrape_duration = histogram("jobfinder_scrape_duration_seconds", "Duration of a company scrape run.", ["provider"])
+scrape_memory_peak = histogram(
+    "jobfinder_scrape_memory_peak_bytes", "Traced memory peak of memory-instrumented scrape runs.", ["provider"],
+    buckets=tuple(2 ** power for power in range(20, 34)),
+)
+scrape_jobs = counter(
+    "jobfinder_scrape_jobs", "Jobs seen by scrape runs: parsed, created, updated, changed, archived.",
+    ["provider", "outcome"],
+)
+
+# --- Enrichment --------------------------------------------------------------
+
+enrichment_runs = counter("jobfinder_enrichment_runs", "Company enrichment runs by result.", ["provider", "result"])
+enrichment_duration = histogram(
+    "jobfinder_enrichment_duration_seconds", "Duration of a company enrichment run.", ["provider"],
+)
+enrichment_searches = counter(
+    "jobfinder_enrichment_searches", "Discovery searches by source: cache, live or failed.", ["source"],
+)
+enrichment_rate_limits = counter(
+    "jobfinder_enrichment_rate_limits", "Search rate-limit events: 'limited' (429) or 'cooldown' (skipped).", ["event"],
+)
+
+# --- Database ----------------------------------------------------------------
+
+db_statement_duration = histogram(
+    "jobfinder_db_statement_duration_seconds", "Duration of SQL statements by verb.", ["operation"],
+)
+db_sessions_active = gauge("jobfinder_db_sessions_active", "Request-scoped DB sessions currently open.")
+db_session_duration = histogram(
+    "jobfinder_db_session_duration_seconds", "Lifetime of request-scoped DB sessions by outcome.", ["outcome"],
+)
+
+# --- API ---------------------------------------------------------------------
+
+http_requests = counter("jobfinder_http_requests", "API requests by route template and status.", ["method", "route", "status"])
+http_request_duration = histogram(
+    "jobfinder_http_request_duration_seconds", "API request latency by route template.", ["method", "route"],
+)
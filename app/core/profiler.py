@@ -0,0 +1,251 @@
+"""
+Opt-in sampling profiler for API requests and scrape runs. While a unit is profiled,
+a background thread wakes every PROFILE_INTERVAL_MS and records, for each of the unit's
+tasks, either its stack on the event loop thread (when it is the running task) or its
+await chain ending in "[waiting]" (when suspended), so network and DB waits show up
+next to JSON decoding, validation and flushes. Tasks spawned inside the unit are tracked
+through a task factory. Profiles are saved as folded stacks (flamegraph.pl, speedscope)
+keyed by run id. No thread runs and nothing is sampled unless a unit is being profiled.
+"""
+import asyncio
+import json
+import re
+import sys
+import threading
+import time
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from types import FrameType
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID
+
+from loguru import logger
+
+from app.core.config import settings
+
+WAITING = "[waiting]"
+_PROFILE_ID = re.compile(r"^[a-z]+-[0-9a-f-]{36}$")
+_PACKAGE_ROOT = str(Path(__file__).resolve().parents[2])
+
+
+@lru_cache(maxsize=4096)
+def _short_path(filename: str) -> str:
+    for marker in ("site-packages/", "lib/python"):
+        if marker in filename:
+            return filename.split(marker, 1)[1]
+    return filename[len(_PACKAGE_ROOT) + 1:] if filename.startswith(_PACKAGE_ROOT) else filename
+
+
+def _label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({_short_path(code.co_filename)})"
+
+
+def _coroutine_frame(awaitable: Any) -> Optional[FrameType]:
+    return getattr(awaitable, "cr_frame", None) or getattr(awaitable, "gi_frame", None) or getattr(awaitable, "ag_frame", None)
+
+
+def _awaited(awaitable: Any) -> Any:
+    return getattr(awaitable, "cr_await", None) or getattr(awaitable, "gi_yieldfrom", None) or getattr(awaitable, "ag_await", None)
+
+
+def _running_stack(frame: Optional[FrameType], task: asyncio.Task) -> List[str]:
+    """Thread stack of the running task, root first, cut at the task's coroutine."""
+    root = _coroutine_frame(task.get_coro())
+    stack = []
+    while frame is not None:
+        stack.append(_label(frame))
+        if frame is root:
+            break
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _waiting_stack(task: asyncio.Task) -> List[str]:
+    """Await chain of a suspended task, root first, ending in WAITING."""
+    stack = []
+    awaitable = task.get_coro()
+    while awaitable is not None:
+        frame = _coroutine_frame(awaitable)
+        if frame is None:
+            break
+        stack.append(_label(frame))
+        awaitable = _awaited(awaitable)
+    stack.append(WAITING)
+    return stack
+
+
+class Profile:
+    def __init__(
+        self, kind: str, run_id: UUID, name: str, loop: asyncio.AbstractEventLoop, root: Optional[asyncio.Task]
+    ):
+        self.kind = kind
+        self.run_id = run_id
+        self.name = name
+        self.loop = loop
+        self.thread_id = threading.get_ident()
+        self.tasks: "weakref.WeakSet[asyncio.Task]" = weakref.WeakSet([root] if root else [])
+        self.stacks: Counter = Counter()
+        self.started_at = datetime.now(timezone.utc)
+        self._started = time.perf_counter()
+        self.wall_seconds = 0.0
+
+    @property
+    def id(self) -> str:
+        return f"{self.kind}-{self.run_id}"
+
+    def sample(self, frames: Dict[int, FrameType]) -> None:
+        running = asyncio.current_task(self.loop)
+        for task in list(self.tasks):
+            if task.done():
+                continue
+            if task is running:
+                stack = _running_stack(frames.get(self.thread_id), task)
+            else:
+                stack = _waiting_stack(task)
+            if stack:
+                self.stacks[";".join(stack)] += 1
+
+    def finish(self) -> None:
+        self.wall_seconds = time.perf_counter() - self._started
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def summary(self) -> Dict[str, Any]:
+        samples = sum(self.stacks.values())
+        waiting = sum(count for stack, count in self.stacks.items() if stack.endswith(WAITING))
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "run_id": str(self.run_id),
+            "name": self.name,
+            "started_at": self.started_at.isoformat(),
+            "wall_seconds": self.wall_seconds,
+            "samples": samples,
+            "waiting_samples": waiting,
+        }
+
+
+class _Sampler:
+    """One daemon thread sampling every active profile; it exits when none is left."""
+
+    def __init__(self):
+        self._profiles: set = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, profile: Profile) -> None:
+        with self._lock:
+            self._profiles.add(profile)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="profiler-sampler", daemon=True)
+                self._thread.start()
+
+    def discard(self, profile: Profile) -> None:
+        with self._lock:
+            self._profiles.discard(profile)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(settings.PROFILE_INTERVAL_MS / 1000)
+            with self._lock:
+                profiles = list(self._profiles)
+                if not profiles:
+                    self._thread = None
+                    return
+            frames = sys._current_frames()
+            for profile in profiles:
+                try:
+                    profile.sample(frames)
+                except Exception:
+                    # The loop thread moved on while a stack was being read; skip this sample
+                    continue
+
+
+_sampler = _Sampler()
+_active_profile: ContextVar[Optional[Profile]] = ContextVar("active_profile", default=None)
+
+
+def _install_task_factory(loop: asyncio.AbstractEventLoop) -> None:
+    """Wraps the loop's task factory so tasks created inside a profiled unit join its profile."""
+    previous = loop.get_task_factory()
+    if getattr(previous, "profiler", False):
+        return
+
+    def factory(loop, coro, **kwargs):
+        task = previous(loop, coro, **kwargs) if previous else asyncio.Task(coro, loop=loop, **kwargs)
+        profile = _active_profile.get()
+        if profile is not None:
+            profile.tasks.add(task)
+        return task
+
+    factory.profiler = True
+    loop.set_task_factory(factory)
+
+
+class ProfileStore:
+    """Folded-stack files with a JSON summary beside each, pruned to the newest `max_profiles`."""
+
+    def __init__(self, directory: Path, max_profiles: int):
+        self.directory = directory
+        self.max_profiles = max_profiles
+
+    def save(self, profile: Profile) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{profile.id}.folded"
+        path.write_text(profile.folded())
+        (self.directory / f"{profile.id}.json").write_text(json.dumps(profile.summary()))
+        self._prune()
+        return path
+
+    def list(self) -> List[Dict[str, Any]]:
+        summaries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                summaries.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                continue
+        return sorted(summaries, key=lambda summary: summary["started_at"], reverse=True)
+
+    def read(self, profile_id: str) -> Optional[str]:
+        if not _PROFILE_ID.match(profile_id):
+            return None
+        path = self.directory / f"{profile_id}.folded"
+        return path.read_text() if path.exists() else None
+
+    def _prune(self) -> None:
+        summaries = sorted(self.directory.glob("*.json"), key=lambda path: path.stat().st_mtime, reverse=True)
+        for path in summaries[self.max_profiles:]:
+            path.unlink(missing_ok=True)
+            path.with_suffix(".folded").unlink(missing_ok=True)
+
+
+profile_store = ProfileStore(Path(settings.PROFILE_DIR), settings.PROFILE_MAX_FILES)
+
+
+@contextmanager
+def profiling(kind: str, run_id: UUID, name: str, store: Optional[ProfileStore] = None) -> Iterator[Profile]:
+    """Samples the current task, and tasks it spawns, until exit; then saves the profile."""
+    loop = asyncio.get_running_loop()
+    _install_task_factory(loop)
+    profile = Profile(kind, run_id, name, loop, asyncio.current_task())
+    token = _active_profile.set(profile)
+    _sampler.add(profile)
+    try:
+        yield profile
+    finally:
+        _sampler.discard(profile)
+        _active_profile.reset(token)
+        profile.finish()
+        try:
+            (store or profile_store).save(profile)
+            logger.info("Saved profile {} of {} ({} samples)", profile.id, name, sum(profile.stacks.values()))
+        except OSError as e:
+            logger.warning("Could not save profile {}: {}", profile.id, e)
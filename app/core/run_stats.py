@@ -0,0 +1,91 @@
+"""
+Per-run accounting for scrapes. A run installs a ScrapeRunStats in a context
+variable; the provider HTTP transport, the scrapers and the DB engine hooks add to
+whichever run is active in their task (tasks spawned by the run inherit it), and do
+nothing outside of one.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+
+@dataclass
+class ScrapeRunStats:
+    http_requests: int = 0
+    bytes_downloaded: int = 0
+    pages: int = 0
+    parse_seconds: float = 0.0
+    db_statements: int = 0
+    db_seconds: float = 0.0
+
+    jobs_parsed: int = 0
+    new_count: int = 0
+    updated_count: int = 0
+    changed_count: int = 0
+    archived_count: int = 0
+    # The list responses matched the stored validators, so nothing was parsed or written
+    not_modified: bool = False
+    # Reported in the run's log summary only, not stored on the ledger
+    duplicate_count: int = 0
+    notification_count: int = 0
+
+    # Set by memory accounting (app/core/memory.py) when the run is instrumented
+    memory_peak_bytes: Optional[int] = None
+    memory_top_allocations: Optional[List[Dict]] = None
+    memory_retained_objects: Optional[Dict[str, int]] = None
+
+
+_current_run: ContextVar[Optional[ScrapeRunStats]] = ContextVar("current_scrape_run", default=None)
+
+
+def current_run() -> Optional[ScrapeRunStats]:
+    return _current_run.get()
+
+
+@contextmanager
+def track_run() -> Iterator[ScrapeRunStats]:
+    stats = ScrapeRunStats()
+    token = _current_run.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_run.reset(token)
+
+
+def record_request() -> None:
+    stats = _current_run.get()
+    if stats is not None:
+        stats.http_requests += 1
+
+
+def record_bytes(num_bytes: int) -> None:
+    stats = _current_run.get()
+    if stats is not None:
+        stats.bytes_downloaded += num_bytes
+
+
+def record_page() -> None:
+    stats = _current_run.get()
+    if stats is not None:
+        stats.pages += 1
+
+
+def record_statement(seconds: float) -> None:
+    stats = _current_run.get()
+    if stats is not None:
+        stats.db_statements += 1
+        stats.db_seconds += seconds
+
+
+@contextmanager
+def parse_timer() -> Iterator[None]:
+    """Adds the block's wall time to the active run's parse time."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats = _current_run.get()
+        if stats is not None:
+            stats.parse_seconds += time.perf_counter() - start
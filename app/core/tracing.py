@@ -0,0 +1,230 @@
+"""
+Lightweight in-process span tracing, shaped like OpenTelemetry (trace/span ids, parent
+links, kinds, attributes, status). The current span lives in a context variable, so
+spans opened in tasks spawned by gather or create_task nest under their creator. When
+a root span ends, its trace is written as one OTLP/JSON file with a summary of the
+critical path and per-stage concurrency. With TRACING_ENABLED off, span() returns a
+shared no-op.
+"""
+import json
+import os
+import re
+import time
+from contextvars import ContextVar, Token
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from app.core.config import settings
+
+# OTLP enum values
+SPAN_KINDS = {"INTERNAL": 1, "SERVER": 2, "CLIENT": 3}
+STATUS_UNSET, STATUS_OK, STATUS_ERROR = 0, 1, 2
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+
+def _new_id(num_bytes: int) -> str:
+    return os.urandom(num_bytes).hex()
+
+
+class Span:
+    __slots__ = (
+        "name", "kind", "attributes", "trace_id", "span_id", "parent_span_id",
+        "start_ns", "end_ns", "status_code", "status_message", "is_root", "_spans", "_token",
+    )
+
+    def __init__(self, name: str, kind: str, attributes: Dict[str, Any], traceparent: Optional[str] = None):
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes
+        self.span_id = _new_id(8)
+        self.status_code = STATUS_UNSET
+        self.status_message = ""
+        self.start_ns = self.end_ns = 0
+        self._token: Optional[Token] = None
+
+        parent = _current_span.get()
+        remote = _TRACEPARENT.match(traceparent or "")
+        # A local root collects the spans of its trace and exports them when it ends
+        self.is_root = parent is None
+        if parent is not None:
+            self.trace_id, self.parent_span_id, self._spans = parent.trace_id, parent.span_id, parent._spans
+        elif remote:
+            # Continues the caller's trace
+            self.trace_id, self.parent_span_id, self._spans = remote.group(1), remote.group(2), []
+        else:
+            self.trace_id, self.parent_span_id, self._spans = _new_id(16), None, []
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def rename(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> "Span":
+        self.start_ns = time.time_ns()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.end_ns = time.time_ns()
+        _current_span.reset(self._token)
+        if exc is not None:
+            self.status_code = STATUS_ERROR
+            self.status_message = str(exc)[:500]
+            self.attributes["exception.type"] = type(exc).__name__
+        self._spans.append(self)
+        if self.is_root:
+            exporter.export(self._spans)
+        return False
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": SPAN_KINDS.get(self.kind, 1),
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in self.attributes.items()],
+            "status": {"code": self.status_code, "message": self.status_message} if self.status_code else {},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        return span
+
+
+class _NoopSpan:
+    traceparent = None
+    is_root = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def rename(self, name: str) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NOOP = _NoopSpan()
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def span(name: str, kind: str = "INTERNAL", traceparent: Optional[str] = None, **attributes: Any):
+    """
+    A span for a `with` block, child of the current span. Without a current span it starts
+    a trace (continuing `traceparent`, a W3C header value, when given).
+    """
+    if not settings.TRACING_ENABLED:
+        return _NOOP
+    return Span(name, kind, attributes, traceparent)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _critical_path(spans: List[Span], root: Span) -> List[Dict[str, Any]]:
+    """From the root down, the child that finished last at each level: what the run waited on."""
+    children: Dict[str, List[Span]] = {}
+    for item in spans:
+        if item.parent_span_id:
+            children.setdefault(item.parent_span_id, []).append(item)
+    path, current = [], root
+    while current is not None:
+        path.append({"name": current.name, "duration_ms": (current.end_ns - current.start_ns) / 1e6})
+        candidates = children.get(current.span_id)
+        current = max(candidates, key=lambda item: item.end_ns) if candidates else None
+    return path
+
+
+def _concurrency(spans: List[Span]) -> Dict[str, Dict[str, float]]:
+    """Per span name: count, total time, peak overlap and mean overlap (total time / covered time)."""
+    by_name: Dict[str, List[Span]] = {}
+    for item in spans:
+        by_name.setdefault(item.name, []).append(item)
+
+    stats = {}
+    for name, items in by_name.items():
+        events = sorted([(item.start_ns, 1) for item in items] + [(item.end_ns, -1) for item in items])
+        open_spans = peak = covered = 0
+        previous = events[0][0]
+        for at, delta in events:
+            if open_spans:
+                covered += at - previous
+            open_spans += delta
+            peak = max(peak, open_spans)
+            previous = at
+        total = sum(item.end_ns - item.start_ns for item in items)
+        stats[name] = {
+            "count": len(items),
+            "total_ms": total / 1e6,
+            "max_concurrency": peak,
+            "mean_concurrency": round(total / covered, 2) if covered else 1.0,
+        }
+    return stats
+
+
+class JsonFileExporter:
+    """Writes each finished trace to `<trace_id>-<root span id>.json`, keeping the newest `max_files`."""
+
+    def __init__(self, directory: Path, max_files: int):
+        self.directory = directory
+        self.max_files = max_files
+
+    def export(self, spans: List[Span]) -> Optional[Path]:
+        root = spans[-1]
+        document = {
+            "resourceSpans": [{
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": settings.PROJECT_NAME}}]},
+                "scopeSpans": [{
+                    "scope": {"name": "jobfinder"},
+                    "spans": [item.to_otlp() for item in sorted(spans, key=lambda item: item.start_ns)],
+                }],
+            }],
+            "summary": {
+                "name": root.name,
+                "duration_ms": (root.end_ns - root.start_ns) / 1e6,
+                "span_count": len(spans),
+                "critical_path": _critical_path(spans, root),
+                "stages": _concurrency(spans),
+            },
+        }
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / f"{root.trace_id}-{root.span_id}.json"
+            path.write_text(json.dumps(document))
+            self._prune()
+            return path
+        except OSError as e:
+            logger.warning("Could not export trace {}: {}", root.trace_id, e)
+            return None
+
+    def _prune(self) -> None:
+        paths = sorted(self.directory.glob("*.json"), key=lambda path: path.stat().st_mtime, reverse=True)
+        for path in paths[self.max_files:]:
+            path.unlink(missing_ok=True)
+
+
+exporter = JsonFileExporter(Path(settings.TRACE_DIR), settings.TRACE_MAX_FILES)
@@ -0,0 +1,106 @@
+"""
+Statement accounting per unit of work: an API request or a scrape run. The engine
+hooks in app/db/session.py report every statement to the unit active in the current
+context. Statements are fingerprinted by shape (bind parameters and literals removed),
+so an N+1 pattern shows up as one shape executing many times and is flagged once it
+passes QUERY_REPEAT_THRESHOLD executions.
+"""
+import hashlib
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, Tuple
+
+from loguru import logger
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.exceptions import RepeatedQueryError
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_PARAMETER = re.compile(r"\$\d+|%\(\w+\)s|%s|\b\d+(?:\.\d+)?\b")
+# "IN (?, ?, ?)" and "VALUES (?, ?), (?, ?)" keep one shape whatever their length
+_ITEM = r"\?(?:::\w+(?:\[\])?)?"
+_ROW = rf"\(\s*{_ITEM}(?:\s*,\s*{_ITEM})*\s*\)"
+_PARAMETER_LIST = re.compile(rf"{_ROW}(?:\s*,\s*{_ROW})*")
+_WHITESPACE = re.compile(r"\s+")
+
+statements_per_unit = metrics.histogram(
+    "jobfinder_db_statements_per_unit", "SQL statements executed per API request or scrape run.", ["unit"],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 5000),
+)
+repeated_statements = metrics.counter(
+    "jobfinder_db_repeated_statements",
+    "Statement shapes executed more than QUERY_REPEAT_THRESHOLD times in one unit of work.", ["unit"],
+)
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> Tuple[str, str]:
+    """(shape, digest) of a statement: 'SELECT ... WHERE id = $1' and '... id = $7' share a shape."""
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _PARAMETER.sub("?", shape)
+    shape = _PARAMETER_LIST.sub("(?)", shape)
+    shape = _WHITESPACE.sub(" ", shape).strip()
+    return shape, hashlib.sha1(shape.encode()).hexdigest()[:12]
+
+
+@dataclass
+class QueryStats:
+    unit: str
+    name: str
+    statements: int = 0
+    seconds: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+    # digest -> shape of statements that passed the repeat threshold
+    repeated: Dict[str, str] = field(default_factory=dict)
+
+
+_current_unit: ContextVar[Optional[QueryStats]] = ContextVar("current_query_unit", default=None)
+
+
+def current_unit() -> Optional[QueryStats]:
+    return _current_unit.get()
+
+
+@contextmanager
+def track_queries(unit: str, name: str) -> Iterator[QueryStats]:
+    """
+    Counts the statements of the enclosed unit of work ("request" or "scrape") named `name`.
+    A unit nested in another (a scrape triggered by a request) adds its totals to the outer one.
+    """
+    parent = _current_unit.get()
+    stats = QueryStats(unit, name)
+    token = _current_unit.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_unit.reset(token)
+        statements_per_unit.observe(stats.statements, unit)
+        if parent is not None:
+            parent.statements += stats.statements
+            parent.seconds += stats.seconds
+
+
+def record_statement(statement: str, seconds: float) -> None:
+    stats = _current_unit.get()
+    if stats is None:
+        return
+    stats.statements += 1
+    stats.seconds += seconds
+
+    shape, digest = fingerprint(statement)
+    stats.shapes[digest] += 1
+    if stats.shapes[digest] == settings.QUERY_REPEAT_THRESHOLD + 1:
+        stats.repeated[digest] = shape
+        repeated_statements.inc(stats.unit)
+        message = (
+            f"{stats.unit} {stats.name}: statement {digest} ran more than "
+            f"{settings.QUERY_REPEAT_THRESHOLD} times (likely N+1): {shape[:300]}"
+        )
+        if settings.QUERY_REPEAT_STRICT:
+            raise RepeatedQueryError(message)
+        logger.warning(message)
@@ -1,6 +1,11 @@
+import time
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from app.core import metrics, run_stats
 from app.core.config import settings
+from app.db import query_tracker
 
 
 engine = create_async_engine(
@@ -20,13 +25,41 @@ class Base(DeclarativeBase):
     pass
 
 
+STATEMENT_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "BEGIN", "COMMIT", "ROLLBACK"}
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _start_statement_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("statement_start", []).append(time.perf_counter())
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _record_statement_time(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["statement_start"].pop()
+    operation = statement.lstrip()[:8].split(None, 1)[0].upper() if statement.strip() else ""
+    metrics.db_statement_duration.observe(elapsed, operation if operation in STATEMENT_OPERATIONS else "OTHER")
+    run_stats.record_statement(elapsed)
+    query_tracker.record_statement(statement, elapsed)
+
+
+metrics.gauge("jobfinder_db_pool_size", "Connections kept in the pool.", function=lambda: engine.pool.size())
+metrics.gauge("jobfinder_db_pool_checked_out", "Pool connections in use.", function=lambda: engine.pool.checkedout())
+metrics.gauge("jobfinder_db_pool_overflow", "Connections open beyond the pool size.", function=lambda: max(0, engine.pool.overflow()))
+
+
 async def get_db():
+    start = time.perf_counter()
+    outcome = "commit"
+    metrics.db_sessions_active.inc()
     async with AsyncSessionLocal() as session:
         try:
             yield session
             await session.commit()
         except Exception:
+            outcome = "rollback"
             await session.rollback()
             raise
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+            metrics.db_sessions_active.dec()
+            metrics.db_session_duration.observe(time.perf_counter() - start, outcome)
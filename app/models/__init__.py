@@ -1,2 +1,7 @@
 from app.models.company import Company
-from app.models.job import Job
+from app.models.job import Job, JobSimhashBand
+from app.models.enrichment_task import EnrichmentTask
+from app.models.search_result import CachedSearchResult
+from app.models.response_validator import ResponseValidator
+from app.models.saved_search import SavedSearch, SearchNotification
+from app.models.scrape_run import ScrapeRun
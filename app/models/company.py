@@ -2,7 +2,7 @@ import enum
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, Enum as SQLEnum, String, func
+from sqlalchemy import Boolean, DateTime, Enum as SQLEnum, String, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -21,6 +21,7 @@ class CompanyStatus(str, enum.Enum):
     ACTIVE = "ACTIVE"
     INACTIVE = "INACTIVE"
     ERROR = "ERROR"
+    PENDING_VALIDATION = "PENDING_VALIDATION"
 
 class Company(Base):
     __tablename__ = "companies"
@@ -35,6 +36,11 @@ class Company(Base):
     last_scanned_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     
     metadata_config: Mapped[dict] = mapped_column(JSONB, default={}) 
+    config_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    is_config_valid: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
+    # While PENDING_VALIDATION: the status to resolve from, and the status requested by the pending writes
+    pending_base_status: Mapped[CompanyStatus | None] = mapped_column(SQLEnum(CompanyStatus), nullable=True)
+    pending_requested_status: Mapped[CompanyStatus | None] = mapped_column(SQLEnum(CompanyStatus), nullable=True)
     
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime, onupdate=func.now(), server_default=func.now())
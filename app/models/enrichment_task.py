@@ -0,0 +1,35 @@
+import enum
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import DateTime, Enum as SQLEnum, Integer, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+class EnrichmentTaskStatus(str, enum.Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+
+class EnrichmentTask(Base):
+    __tablename__ = "enrichment_tasks"
+
+    id: Mapped[UUID] = mapped_column(default=uuid4, primary_key=True)
+    status: Mapped[EnrichmentTaskStatus] = mapped_column(
+        SQLEnum(EnrichmentTaskStatus), default=EnrichmentTaskStatus.PENDING, index=True
+    )
+
+    company_ids: Mapped[list] = mapped_column(JSONB, default=list)
+    total: Mapped[int] = mapped_column(Integer, default=0)
+    processed: Mapped[int] = mapped_column(Integer, default=0)
+    succeeded: Mapped[int] = mapped_column(Integer, default=0)
+    failed: Mapped[int] = mapped_column(Integer, default=0)
+
+    # company_id -> {"status": "...", "company_status": "...", "error": "..."}
+    results: Mapped[dict] = mapped_column(JSONB, default=dict)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
@@ -2,7 +2,7 @@ import enum
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, Enum as SQLEnum, ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy import BigInteger, DateTime, Enum as SQLEnum, Float, ForeignKey, Index, Integer, SmallInteger, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -29,10 +29,21 @@ class Job(Base):
     title: Mapped[str] = mapped_column(String, index=True)
     location: Mapped[str | None] = mapped_column(String, nullable=True)
     city: Mapped[str | None] = mapped_column(String, nullable=True)
+    # Normalized against the gazetteer at ingest; location_key ("IL:Tel Aviv") backs radius filters
+    country_code: Mapped[str | None] = mapped_column(String(2), nullable=True, index=True)
+    latitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    longitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    location_key: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
     url: Mapped[str] = mapped_column(String, nullable=False)
     
     raw_data: Mapped[dict] = mapped_column(JSONB, nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    description_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    description_snippet: Mapped[str | None] = mapped_column(String(300), nullable=True)
+    description_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+    simhash: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    duplicate_of_id: Mapped[UUID | None] = mapped_column(ForeignKey("jobs.id", ondelete="SET NULL"), nullable=True, index=True)
     
     published_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
@@ -40,9 +51,23 @@ class Job(Base):
     
     status: Mapped[JobStatus] = mapped_column(SQLEnum(JobStatus), default=JobStatus.NEW, index=True)
     user_verdict: Mapped[UserVerdict | None] = mapped_column(SQLEnum(UserVerdict), nullable=True)
+    relevance_score: Mapped[float | None] = mapped_column(Float, nullable=True, index=True)
 
     company = relationship("Company", back_populates="jobs")
 
     __table_args__ = (
         UniqueConstraint("company_id", "external_id", name="uq_company_job"),
-    )
\ No newline at end of file
+    )
+
+
+class JobSimhashBand(Base):
+    """LSH index over Job.simhash: one row per (job, band)."""
+    __tablename__ = "job_simhash_bands"
+
+    job_id: Mapped[UUID] = mapped_column(ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    band: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    value: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("ix_job_simhash_bands_band_value", "band", "value"),
+    )
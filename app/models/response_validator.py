@@ -0,0 +1,27 @@
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+class ResponseValidator(Base):
+    """
+    Validators of the last applied response of one provider list endpoint of a
+    company: the ETag and Last-Modified it carried and a digest of its body.
+    """
+    __tablename__ = "response_validators"
+
+    id: Mapped[UUID] = mapped_column(default=uuid4, primary_key=True)
+    company_id: Mapped[UUID] = mapped_column(ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    endpoint: Mapped[str] = mapped_column(String, nullable=False)
+
+    etag: Mapped[str | None] = mapped_column(String, nullable=True)
+    last_modified: Mapped[str | None] = mapped_column(String, nullable=True)
+    body_digest: Mapped[str] = mapped_column(String, nullable=False)
+    fetched_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("company_id", "endpoint", name="uq_response_validator_endpoint"),
+    )
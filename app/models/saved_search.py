@@ -0,0 +1,57 @@
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Index, String, UniqueConstraint, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.session import Base
+
+class SavedSearch(Base):
+    """
+    A stored job alert. `anchor` is the single most selective condition of the query
+    (a keyword token, city or company); new jobs are only checked against searches
+    whose anchor they contain, so matching cost scales with candidates, not all searches.
+    """
+    __tablename__ = "saved_searches"
+
+    id: Mapped[UUID] = mapped_column(default=uuid4, primary_key=True)
+    user_id: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    name: Mapped[str] = mapped_column(String, nullable=False)
+
+    keywords: Mapped[list] = mapped_column(JSONB, nullable=False, default=list)
+    title_only: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    city: Mapped[str | None] = mapped_column(String, nullable=True)
+    company_id: Mapped[UUID | None] = mapped_column(ForeignKey("companies.id", ondelete="CASCADE"), nullable=True)
+    active_companies_only: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+
+    anchor: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+
+class SearchNotification(Base):
+    """
+    A job matched by a saved search. Delivery is tracked per notification (`delivered_at`),
+    not by a cursor over ids: ids are assigned at insert, so a transaction that commits late
+    can add ids below ones already delivered.
+    """
+    __tablename__ = "search_notifications"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    user_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    saved_search_id: Mapped[UUID] = mapped_column(ForeignKey("saved_searches.id", ondelete="CASCADE"), nullable=False)
+    job_id: Mapped[UUID] = mapped_column(ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    # Set when the user acknowledges the notification
+    delivered_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    job = relationship("Job")
+
+    __table_args__ = (
+        UniqueConstraint("saved_search_id", "job_id", name="uq_search_notification_job"),
+        # Only undelivered rows are read per user
+        Index(
+            "ix_search_notifications_user_id_id_undelivered", "user_id", "id",
+            postgresql_where=text("delivered_at IS NULL"),
+        ),
+    )
@@ -0,0 +1,52 @@
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import BigInteger, Boolean, DateTime, Enum as SQLEnum, Float, ForeignKey, Index, Integer, String, false
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+from app.models.company import ATSProvider
+
+class ScrapeRun(Base):
+    """
+    Ledger row of one company scrape: what it cost (requests, bytes, pages, parse and
+    DB time) and what it found. Written in its own transaction, so failed runs are kept.
+    """
+    __tablename__ = "scrape_runs"
+
+    id: Mapped[UUID] = mapped_column(default=uuid4, primary_key=True)
+    company_id: Mapped[UUID] = mapped_column(ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    provider: Mapped[ATSProvider] = mapped_column(SQLEnum(ATSProvider), nullable=False)
+
+    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    finished_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    duration_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    http_requests: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    bytes_downloaded: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    pages: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    parse_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    db_statements: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    db_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    jobs_parsed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    new_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    changed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    archived_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # The company's list responses matched their stored validators; nothing was parsed or written
+    not_modified: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default=false())
+
+    # Exception class name of a failed run, None on success
+    error_class: Mapped[str | None] = mapped_column(String, nullable=True)
+
+    # Memory accounting of instrumented runs: traced peak, [{site, size_bytes, count}], {type: growth}
+    memory_peak_bytes: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    memory_top_allocations: Mapped[list | None] = mapped_column(JSONB, nullable=True)
+    memory_retained_objects: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+
+    __table_args__ = (
+        Index("ix_scrape_runs_company_id_started_at", "company_id", "started_at"),
+        Index("ix_scrape_runs_provider_started_at", "provider", "started_at"),
+    )
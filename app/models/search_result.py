@@ -0,0 +1,22 @@
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import DateTime, String, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+class CachedSearchResult(Base):
+    __tablename__ = "search_result_cache"
+
+    id: Mapped[UUID] = mapped_column(default=uuid4, primary_key=True)
+    query: Mapped[str] = mapped_column(String, nullable=False)
+    company_name: Mapped[str] = mapped_column(String, nullable=False)
+
+    hrefs: Mapped[list] = mapped_column(JSONB, nullable=False, default=list)
+    fetched_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("query", "company_name", name="uq_search_query_company"),
+    )
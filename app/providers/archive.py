@@ -0,0 +1,208 @@
+"""
+Archive of raw provider responses, for re-parsing scrapes offline. While a scrape
+records (`response_archive.recording(...)`), the provider HTTP transport adds every
+exchange to the recording: the request (method, URL and a digest of its body) and the
+response status, headers and raw body. On exit the bodies are stored zlib-compressed
+under their SHA-256, so runs whose responses did not change share one copy, and the run
+gets a JSON manifest.
+
+Per company the newest RESPONSE_ARCHIVE_RUNS_PER_COMPANY manifests are kept, plus the
+newest complete one (a run whose jobs were applied); `collect_garbage` removes bodies
+no manifest refers to. ReplayTransport serves a manifest's exchanges back to the
+provider clients.
+"""
+import hashlib
+import json
+import zlib
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set
+from uuid import UUID
+
+import httpx
+from loguru import logger
+
+from app.core.config import settings
+
+# Response headers needed to decode and re-validate a replayed body
+_KEPT_HEADERS = ("content-type", "content-encoding", "etag", "last-modified")
+
+
+def request_key(method: str, url: str, content: bytes) -> str:
+    """Identity of a request for replay: method, full URL and a digest of the body."""
+    return f"{method} {url} {hashlib.sha256(content).hexdigest()[:16]}"
+
+
+class Recording:
+    """The exchanges of one scrape run, held in memory until the run ends."""
+
+    def __init__(self, run_id: UUID, company_id: UUID, company_name: str, provider: str):
+        self.run_id = run_id
+        self.company_id = company_id
+        self.company_name = company_name
+        self.provider = provider
+        self.started_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        # Set by the scraping service once the run's jobs were applied
+        self.complete = False
+        self.exchanges: List[Dict[str, Any]] = []
+        self.bodies: Dict[str, bytes] = {}
+
+    def add(self, request: httpx.Request, response: httpx.Response, body: bytes, decoded: bool = False) -> None:
+        """Adds an exchange with its raw body, or its already `decoded` one (then stored without Content-Encoding)."""
+        digest = hashlib.sha256(body).hexdigest()
+        self.bodies[digest] = body
+        headers = {name: response.headers[name] for name in _KEPT_HEADERS if name in response.headers}
+        if decoded:
+            headers.pop("content-encoding", None)
+        self.exchanges.append({
+            "key": request_key(request.method, str(request.url), request.content),
+            "status_code": response.status_code,
+            "headers": headers,
+            "body": digest,
+        })
+
+    def manifest(self) -> Dict[str, Any]:
+        return {
+            "run_id": str(self.run_id),
+            "company_id": str(self.company_id),
+            "company_name": self.company_name,
+            "provider": self.provider,
+            "started_at": self.started_at.isoformat(),
+            "complete": self.complete,
+            "exchanges": self.exchanges,
+        }
+
+
+_recording: ContextVar[Optional[Recording]] = ContextVar("response_recording", default=None)
+
+
+def current_recording() -> Optional[Recording]:
+    return _recording.get()
+
+
+class ResponseArchive:
+    """`objects/<sha[:2]>/<sha>.z` bodies and `runs/<company id>/<run id>.json` manifests under `directory`."""
+
+    def __init__(self, directory: Path, runs_per_company: int):
+        self.directory = directory
+        self.runs_per_company = runs_per_company
+
+    @contextmanager
+    def recording(self, run_id: UUID, company_id: UUID, company_name: str, provider: str) -> Iterator[Recording]:
+        """Records the current task's provider exchanges (and its subtasks'); saves them on exit."""
+        recording = Recording(run_id, company_id, company_name, provider)
+        token = _recording.set(recording)
+        try:
+            yield recording
+        finally:
+            _recording.reset(token)
+            if recording.exchanges:
+                try:
+                    self.save(recording)
+                except OSError as e:
+                    logger.warning("Could not archive responses of run {}: {}", run_id, e)
+
+    def save(self, recording: Recording) -> Path:
+        for digest, body in recording.bodies.items():
+            path = self._object_path(digest)
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(zlib.compress(body))
+
+        company_dir = self.directory / "runs" / str(recording.company_id)
+        company_dir.mkdir(parents=True, exist_ok=True)
+        path = company_dir / f"{recording.run_id}.json"
+        path.write_text(json.dumps(recording.manifest()))
+        self._prune(company_dir)
+        return path
+
+    def _object_path(self, digest: str) -> Path:
+        return self.directory / "objects" / digest[:2] / f"{digest}.z"
+
+    def _manifests(self, company_dir: Path) -> List[Dict[str, Any]]:
+        manifests = []
+        for path in company_dir.glob("*.json"):
+            try:
+                manifests.append({**json.loads(path.read_text()), "path": path})
+            except (OSError, ValueError):
+                continue
+        return sorted(manifests, key=lambda manifest: manifest["started_at"], reverse=True)
+
+    def _prune(self, company_dir: Path) -> None:
+        manifests = self._manifests(company_dir)
+        keep = {manifest["run_id"] for manifest in manifests[:self.runs_per_company]}
+        newest_complete = next((manifest for manifest in manifests if manifest["complete"]), None)
+        if newest_complete is not None:
+            keep.add(newest_complete["run_id"])
+        for manifest in manifests:
+            if manifest["run_id"] not in keep:
+                manifest["path"].unlink(missing_ok=True)
+
+    def companies(self) -> List[UUID]:
+        """Companies with at least one archived run."""
+        runs = self.directory / "runs"
+        if not runs.exists():
+            return []
+        return [UUID(path.name) for path in runs.iterdir() if path.is_dir() and any(path.glob("*.json"))]
+
+    def latest(self, company_id: UUID) -> Optional[Dict[str, Any]]:
+        """The manifest of the company's newest complete run."""
+        company_dir = self.directory / "runs" / str(company_id)
+        if not company_dir.exists():
+            return None
+        return next((manifest for manifest in self._manifests(company_dir) if manifest["complete"]), None)
+
+    def body(self, digest: str) -> bytes:
+        return zlib.decompress(self._object_path(digest).read_bytes())
+
+    def collect_garbage(self) -> int:
+        """Removes bodies no manifest refers to. Returns how many were removed."""
+        referenced: Set[str] = set()
+        for manifest_path in (self.directory / "runs").glob("*/*.json"):
+            try:
+                referenced.update(exchange["body"] for exchange in json.loads(manifest_path.read_text())["exchanges"])
+            except (OSError, ValueError, KeyError):
+                # An unreadable manifest may still refer to anything; keep every body
+                return 0
+        removed = 0
+        for path in (self.directory / "objects").glob("*/*.z"):
+            if path.stem not in referenced:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def replay_transport(self, manifest: Dict[str, Any]) -> "ReplayTransport":
+        return ReplayTransport(self, manifest)
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Answers requests from an archived run. A request made several times gets the
+    recorded responses in order, then the last one again; an unrecorded request fails
+    like a connection error.
+    """
+
+    def __init__(self, archive: ResponseArchive, manifest: Dict[str, Any]):
+        self._archive = archive
+        self._exchanges: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        for exchange in manifest["exchanges"]:
+            self._exchanges[exchange["key"]].append(exchange)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        recorded = self._exchanges.get(request_key(request.method, str(request.url), request.content))
+        if not recorded:
+            raise httpx.ConnectError(f"No archived response for {request.method} {request.url}", request=request)
+        exchange = recorded.popleft() if len(recorded) > 1 else recorded[0]
+        return httpx.Response(
+            exchange["status_code"],
+            headers=exchange["headers"],
+            content=self._archive.body(exchange["body"]),
+            request=request,
+        )
+
+
+response_archive = ResponseArchive(Path(settings.RESPONSE_ARCHIVE_DIR), settings.RESPONSE_ARCHIVE_RUNS_PER_COMPANY)
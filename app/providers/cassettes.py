@@ -0,0 +1,269 @@
+"""
+Record/replay of provider traffic in cassette files, for deterministic offline
+scraper and enricher tests and benchmarks. Inside `use_cassette(path)` every provider
+client sends through the cassette: in "record" mode requests go to the real transport
+and each exchange is kept with its latency; in "replay" mode they are answered from the
+file, optionally with the recorded latency (scaled by `latency_scale`); "auto" replays
+an existing file and records a missing one.
+
+Secrets never reach the file: values of SECRET_PARAMS query parameters, and any literal
+`secrets` passed in, are replaced with SCRUBBED in URLs, bodies, headers and call results
+(values found in query parameters are scrubbed from response bodies too, e.g. a token
+embedded in a careers page). Fields are scrubbed before the file is serialized, so JSON
+escaping can't hide a secret and replacements never touch the file's own syntax. Values
+shorter than MIN_SECRET_LENGTH are only replaced as query parameters: replacing them in
+free text would corrupt unrelated content. Only the response headers needed to replay are
+kept. Requests are matched on their scrubbed form, so a replay with real credentials finds
+its exchanges.
+
+Sources that are not httpx clients (the DuckDuckGo search client) go through
+`recorded_call`, whose results are kept in the same file.
+"""
+import asyncio
+import base64
+import json
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Literal, Optional, Set, TypeVar, Union
+
+import httpx
+
+from app.providers.archive import request_key
+from app.providers.http import TransportFactory, use_transport
+
+T = TypeVar("T")
+Mode = Literal["record", "replay", "auto"]
+
+SCRUBBED = "SCRUBBED"
+MIN_SECRET_LENGTH = 6
+SECRET_PARAMS = frozenset({"token", "access_token", "api_key", "apikey", "key", "secret", "password"})
+_KEPT_HEADERS = ("content-type", "etag", "last-modified", "location")
+
+
+class Cassette:
+    """The recorded exchanges and call results of one file."""
+
+    def __init__(self, path: Path, mode: str, secrets: Iterable[str] = ()):
+        self.path = path
+        self.mode = mode
+        self.secrets: Set[str] = set()
+        for secret in secrets:
+            self.add_secret(secret)
+        self.interactions: List[Dict[str, Any]] = []
+        self.calls: Dict[str, Dict[str, Any]] = defaultdict(dict)
+
+    @classmethod
+    def load(cls, path: Path, secrets: Iterable[str] = ()) -> "Cassette":
+        cassette = cls(path, "replay", secrets)
+        document = json.loads(path.read_text())
+        cassette.interactions = document["interactions"]
+        cassette.calls.update(document.get("calls", {}))
+        return cassette
+
+    def add_secret(self, secret: Optional[str]) -> None:
+        if secret and len(secret) >= MIN_SECRET_LENGTH:
+            self.secrets.add(secret)
+
+    def save(self) -> None:
+        # Scrubbed only now, with every secret seen during the recording
+        document = {
+            "version": 1,
+            "recorded_at": datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
+            "interactions": [self._scrub_interaction(interaction) for interaction in self.interactions],
+            "calls": self._scrub_data(self.calls),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(document, indent=1))
+
+    def scrub_url(self, url: httpx.URL) -> str:
+        secret_params = [(name, value) for name, value in url.params.multi_items() if name.lower() in SECRET_PARAMS]
+        if self.mode == "record":
+            for _, value in secret_params:
+                self.add_secret(value)
+        for name, _ in secret_params:
+            url = url.copy_set_param(name, SCRUBBED)
+        return self.scrub(str(url))
+
+    def scrub(self, text: str) -> str:
+        # Longest first, so a secret containing another is replaced whole
+        for secret in sorted(self.secrets, key=len, reverse=True):
+            text = text.replace(secret, SCRUBBED)
+        return text
+
+    def _scrub_bytes(self, content: bytes) -> bytes:
+        for secret in sorted(self.secrets, key=len, reverse=True):
+            content = content.replace(secret.encode(), SCRUBBED.encode())
+        return content
+
+    def _scrub_data(self, value: Any) -> Any:
+        """Scrubs every string in a JSON-serializable value, dict keys included."""
+        if isinstance(value, str):
+            return self.scrub(value)
+        if isinstance(value, dict):
+            return {self._scrub_data(key): self._scrub_data(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self._scrub_data(item) for item in value]
+        return value
+
+    def _scrub_interaction(self, interaction: Dict[str, Any]) -> Dict[str, Any]:
+        request, response = interaction["request"], interaction["response"]
+        body = response["body"]
+        if response["body_encoding"] == "base64":
+            body = base64.b64encode(self._scrub_bytes(base64.b64decode(body))).decode()
+        else:
+            body = self.scrub(body)
+        return {
+            "request": {**request, "url": self.scrub(request["url"]), "body": self.scrub(request["body"])},
+            "response": {
+                **response,
+                "headers": {name: self.scrub(value) for name, value in response["headers"].items()},
+                "body": body,
+            },
+            "elapsed_ms": interaction["elapsed_ms"],
+        }
+
+    def key(self, request: httpx.Request) -> str:
+        body = self.scrub(request.content.decode("utf-8", "replace")).encode()
+        return request_key(request.method, self.scrub_url(request.url), body)
+
+    def record(self, request: httpx.Request, response: httpx.Response, elapsed: float) -> None:
+        try:
+            body, encoding = response.content.decode("utf-8"), "text"
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(response.content).decode(), "base64"
+        self.interactions.append({
+            "request": {
+                "method": request.method,
+                "url": self.scrub_url(request.url),
+                "body": request.content.decode("utf-8", "replace"),
+            },
+            "response": {
+                "status_code": response.status_code,
+                "headers": {name: response.headers[name] for name in _KEPT_HEADERS if name in response.headers},
+                "body": body,
+                "body_encoding": encoding,
+            },
+            "elapsed_ms": round(elapsed * 1000, 3),
+        })
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Sends through `transport` and adds each exchange, with its decoded body, to the cassette."""
+
+    def __init__(self, cassette: Cassette, transport: httpx.AsyncBaseTransport):
+        self._cassette = cassette
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        start = time.perf_counter()
+        response = await self._transport.handle_async_request(request)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        self._cassette.record(request, response, time.perf_counter() - start)
+
+        # Decoded, so the body is served as recorded
+        headers = [(name, value) for name, value in response.headers.multi_items()
+                   if name.lower() not in ("content-encoding", "content-length", "transfer-encoding")]
+        return httpx.Response(response.status_code, headers=headers, content=response.content, request=request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class CassetteTransport(httpx.AsyncBaseTransport):
+    """
+    Answers requests from a cassette, after `latency_scale` times the recorded latency.
+    A request made several times gets the recorded responses in order, then the last one
+    again; an unrecorded request fails like a connection error.
+    """
+
+    def __init__(self, cassette: Cassette, latency_scale: float = 0.0):
+        self._cassette = cassette
+        self._latency_scale = latency_scale
+        self._interactions: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        for interaction in cassette.interactions:
+            request = interaction["request"]
+            key = request_key(request["method"], request["url"], request["body"].encode())
+            self._interactions[key].append(interaction)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        recorded = self._interactions.get(self._cassette.key(request))
+        if not recorded:
+            raise httpx.ConnectError(
+                f"No recorded response for {request.method} {request.url} in {self._cassette.path}", request=request
+            )
+        interaction = recorded.popleft() if len(recorded) > 1 else recorded[0]
+        if self._latency_scale > 0:
+            await asyncio.sleep(interaction["elapsed_ms"] / 1000 * self._latency_scale)
+
+        response = interaction["response"]
+        body = response["body"]
+        content = base64.b64decode(body) if response["body_encoding"] == "base64" else body.encode()
+        return httpx.Response(response["status_code"], headers=response["headers"], content=content, request=request)
+
+
+_active: ContextVar[Optional[Cassette]] = ContextVar("active_cassette", default=None)
+
+
+def recorded_call(source: str, key: str, call: Callable[[], T]) -> T:
+    """
+    `call()`, recorded under (source, key) on a recording cassette or answered from a
+    replaying one; results must be JSON-serializable. Outside of a cassette, just `call()`.
+    """
+    cassette = _active.get()
+    if cassette is None:
+        return call()
+    if cassette.mode == "replay":
+        # Keys are saved scrubbed
+        recorded = cassette.calls.get(source, {})
+        scrubbed = cassette.scrub(key)
+        if scrubbed not in recorded:
+            raise LookupError(f"No recorded {source} call for {key!r} in {cassette.path}")
+        return recorded[scrubbed]
+    result = call()
+    cassette.calls[source][key] = result
+    return result
+
+
+@contextmanager
+def use_cassette(
+    path: Union[str, Path],
+    mode: Mode = "auto",
+    latency_scale: float = 0.0,
+    secrets: Iterable[str] = (),
+    transport_factory: Optional[TransportFactory] = None,
+) -> Iterator[Cassette]:
+    """
+    Routes provider clients (and recorded calls) created in this context through a cassette.
+    Recording sends through `transport_factory()` (real HTTP by default) and saves the file
+    when the block completes without error.
+    """
+    path = Path(path)
+    if mode == "auto":
+        mode = "replay" if path.exists() else "record"
+
+    if mode == "replay":
+        cassette = Cassette.load(path, secrets)
+        replay = CassetteTransport(cassette, latency_scale)
+        factory: TransportFactory = lambda: replay
+    else:
+        cassette = Cassette(path, "record", secrets)
+        inner = transport_factory or httpx.AsyncHTTPTransport
+        factory = lambda: RecordingTransport(cassette, inner())
+
+    token = _active.set(cassette)
+    try:
+        with use_transport(factory):
+            yield cassette
+    finally:
+        _active.reset(token)
+    if mode == "record":
+        cassette.save()
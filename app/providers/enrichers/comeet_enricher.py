@@ -1,12 +1,20 @@
 from app.providers.enrichers.base import BaseEnricher
 from app.models.company import Company
 from app.schemas.company import CompanyUpdate
+from app.core import metrics
+from app.core.config import settings
 from app.core.exceptions import EnrichmentRateLimitError
+from app.db.session import AsyncSessionLocal
+from app.providers.cassettes import recorded_call
+from app.providers.http import provider_client
 from app.providers.scrapers.comeet_scraper import ComeetScraper
+from app.repositories import search_cache_repository as search_cache_repo
 import re
+import time
 import asyncio
+import threading
 import httpx
-from typing import Optional, Dict, Any, NamedTuple
+from typing import Optional, Dict, Any, List, NamedTuple
 from ddgs import DDGS
 from loguru import logger
 
@@ -23,6 +31,13 @@ class ComeetEnricher(BaseEnricher):
     RE_ATS_TOKEN   = r"""token["']?\s*[:=]\s*["']([^"']+)["']"""
     RE_OG_LOGO     = r'<meta[^>]+property="og:image"[^>]+content="([^"]+)"'
 
+    SEARCH_PACING_SECONDS = 1.0
+
+    # Shared by every enricher in the process: one search client, one cooldown after a 429
+    _ddgs: Optional[DDGS] = None
+    _ddgs_lock = threading.Lock()
+    _cooldown_until: float = 0.0
+
     async def enrich(self, company: Company) -> Optional[CompanyUpdate]:
         if not company.name: return
 
@@ -31,7 +46,7 @@ class ComeetEnricher(BaseEnricher):
 
         update_payload = self._calculate_diff(company, source_data)
         if update_payload:
-            logger.success(f"[{company.name}] Updates identified: {list(update_payload.keys())}")
+            logger.success("[{}] Updates identified: {}", company.name, list(update_payload.keys()))
             return CompanyUpdate(**update_payload)
 
         return
@@ -44,7 +59,7 @@ class ComeetEnricher(BaseEnricher):
         if existing_uid:
             data = await self._scrape_page(existing_uid, name)
             if data: return data
-            logger.warning(f"[{name}] Stored UID {existing_uid} is stale/invalid.")
+            logger.warning("[{}] Stored UID {} is stale/invalid.", name, existing_uid)
 
         return await self._discover_via_search(name)
 
@@ -52,15 +67,15 @@ class ComeetEnricher(BaseEnricher):
         url = f"{self.CAREERS_BASE}/{company_name}/{uid}"
         
         try:
-            async with httpx.AsyncClient(follow_redirects=True, timeout=10.0) as client:
+            async with provider_client("ComeetCareers", follow_redirects=True, timeout=10.0) as client:
                 resp = await client.get(url)
                 resp.raise_for_status()
                 
                 token = self._parse(self.RE_ATS_TOKEN, resp.text)
                 if not token: return
 
-                if not await ComeetScraper.is_valid_config({"uid": uid, "token": token}):
-                    logger.warning(f"[{company_name}] Scraped token for UID {uid}, but API validation failed.")
+                if not await ComeetScraper.validate_config({"uid": uid, "token": token}):
+                    logger.warning("[{}] Scraped token for UID {}, but API validation failed.", company_name, uid)
                     return
 
                 return ComeetSourceData(
@@ -70,44 +85,133 @@ class ComeetEnricher(BaseEnricher):
                     logo_url=self._parse(self.RE_OG_LOGO, resp.text)
                 )
         except httpx.HTTPStatusError as e:
-            logger.warning(f"[{company_name}] HTTP {e.response.status_code} accessing {url}")
+            logger.warning("[{}] HTTP {} accessing {}", company_name, e.response.status_code, url)
             return
         except httpx.RequestError as e:
-            logger.error(f"[{company_name}] Network error scraping {url}: {e}")
+            logger.error("[{}] Network error scraping {}: {}", company_name, url, e)
             return
         except Exception as e:
-            logger.error(f"[{company_name}] Unexpected error scraping {url}: {e}")
+            logger.error("[{}] Unexpected error scraping {}: {}", company_name, url, e)
             return
 
     async def _discover_via_search(self, company_name: str) -> Optional[ComeetSourceData]:
+        """
+        Runs the search queries in order and validates every candidate UID concurrently,
+        overlapping validation with the remaining searches. Returns the first valid
+        candidate in discovery order.
+        """
         queries = [
             f"jobs at {company_name} site:comeet.com",
             f"site:comeet.com/jobs/{company_name}",
             f"site:comeet.com inurl:jobs {company_name}"
         ]
-        
-        for query in queries:
-            try:
-                await asyncio.sleep(1.0)
-                results = await asyncio.to_thread(lambda: list(DDGS().text(query, max_results=5)))
-            except Exception as e:
-                err_msg = str(e).lower()
-                if "429" in err_msg or "too many requests" in err_msg:
-                     raise EnrichmentRateLimitError(f"DuckDuckGo rate limit for {company_name}")
-                logger.warning(f"Discovery query '{query}' failed for {company_name}: {e}")
-                continue
-                
-            uid_pattern = self.RE_COMPANY_UID.format(company_name=re.escape(company_name))
-            
-            for res in results:
-                match = re.search(uid_pattern, res.get("href", ""), re.IGNORECASE)
-                if match:
-                    uid = match.group(1).rstrip(".")
-                    data = await self._scrape_page(uid, company_name)
-                    if data: return data
-        
+        candidates: Dict[str, asyncio.Task] = {}
+        rate_limited: Optional[EnrichmentRateLimitError] = None
+
+        try:
+            for query in queries:
+                if any(self._is_valid_candidate(task) for task in candidates.values()):
+                    break
+
+                try:
+                    hrefs = await self._search(query, company_name)
+                except EnrichmentRateLimitError as e:
+                    # Candidates already found may still resolve; only surface the limit if they don't
+                    if not candidates: raise
+                    rate_limited = e
+                    break
+
+                for uid in self._extract_uids(hrefs, company_name):
+                    if uid not in candidates:
+                        candidates[uid] = asyncio.create_task(self._scrape_page(uid, company_name))
+
+            for task in candidates.values():
+                data = await task
+                if data: return data
+        finally:
+            for task in candidates.values():
+                task.cancel()
+
+        if rate_limited: raise rate_limited
         return
 
+    async def _search(self, query: str, company_name: str) -> List[str]:
+        """Returns result hrefs for a query, from the persistent cache when fresh."""
+        cached = await self._get_cached_search(query, company_name)
+        if cached is not None:
+            metrics.enrichment_searches.inc("cache")
+            return cached
+
+        cls = type(self)
+        remaining = cls._cooldown_until - time.monotonic()
+        if remaining > 0:
+            metrics.enrichment_rate_limits.inc("cooldown")
+            raise EnrichmentRateLimitError(
+                f"DuckDuckGo cooling down for {remaining:.0f}s, skipping {company_name}", retry_after=remaining
+            )
+
+        try:
+            await asyncio.sleep(self.SEARCH_PACING_SECONDS)
+            results = await asyncio.to_thread(self._ddgs_text, query)
+        except Exception as e:
+            err_msg = str(e).lower()
+            if "429" in err_msg or "too many requests" in err_msg:
+                cooldown = settings.ENRICHMENT_RATE_LIMIT_COOLDOWN
+                cls._cooldown_until = time.monotonic() + cooldown
+                metrics.enrichment_rate_limits.inc("limited")
+                raise EnrichmentRateLimitError(f"DuckDuckGo rate limit for {company_name}", retry_after=cooldown)
+            logger.warning("Discovery query '{}' failed for {}: {}", query, company_name, e)
+            metrics.enrichment_searches.inc("failed")
+            return []
+
+        metrics.enrichment_searches.inc("live")
+        hrefs = [res.get("href", "") for res in results if res.get("href")]
+        await self._store_search(query, company_name, hrefs)
+        return hrefs
+
+    @classmethod
+    def _ddgs_text(cls, query: str) -> List[Dict[str, Any]]:
+        # Not an httpx client, so cassettes record and replay the results instead
+        return recorded_call("ddgs.text", query, lambda: cls._ddgs_search(query))
+
+    @classmethod
+    def _ddgs_search(cls, query: str) -> List[Dict[str, Any]]:
+        with cls._ddgs_lock:
+            if cls._ddgs is None:
+                cls._ddgs = DDGS()
+            return list(cls._ddgs.text(query, max_results=5))
+
+    @staticmethod
+    async def _get_cached_search(query: str, company_name: str) -> Optional[List[str]]:
+        try:
+            async with AsyncSessionLocal() as db:
+                return await search_cache_repo.get_fresh(db, query, company_name, settings.ENRICHMENT_SEARCH_CACHE_TTL)
+        except Exception as e:
+            logger.warning("Search cache lookup failed for '{}': {}", query, e)
+            return
+
+    @staticmethod
+    async def _store_search(query: str, company_name: str, hrefs: List[str]) -> None:
+        try:
+            async with AsyncSessionLocal() as db:
+                await search_cache_repo.upsert(db, query, company_name, hrefs)
+                await db.commit()
+        except Exception as e:
+            logger.warning("Search cache store failed for '{}': {}", query, e)
+
+    def _extract_uids(self, hrefs: List[str], company_name: str) -> List[str]:
+        uid_pattern = self.RE_COMPANY_UID.format(company_name=re.escape(company_name))
+        uids = []
+        for href in hrefs:
+            match = re.search(uid_pattern, href, re.IGNORECASE)
+            if match:
+                uids.append(match.group(1).rstrip("."))
+        return uids
+
+    @staticmethod
+    def _is_valid_candidate(task: asyncio.Task) -> bool:
+        return task.done() and not task.cancelled() and task.exception() is None and task.result() is not None
+
     def _calculate_diff(self, company: Company, fresh: ComeetSourceData) -> Dict[str, Any]:
         updates = {}
         old_config = company.metadata_config or {}
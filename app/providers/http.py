@@ -0,0 +1,98 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import Any, Callable, Iterator, List, Optional
+
+import httpx
+
+from app.core import metrics, run_stats, tracing
+from app.providers import archive
+
+TransportFactory = Callable[[], httpx.AsyncBaseTransport]
+
+_transport_factory: ContextVar[Optional[TransportFactory]] = ContextVar("provider_transport_factory", default=None)
+
+
+class _CountingStream(httpx.AsyncByteStream):
+    """
+    Adds the raw (still compressed) body bytes to the active scrape run as they are read,
+    and hands the whole body to `on_complete` (the archive recording) once it is read.
+    """
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_complete: Optional[Callable[[bytes], None]] = None):
+        self._stream = stream
+        self._on_complete = on_complete
+        self._chunks: List[bytes] = []
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            run_stats.record_bytes(len(chunk))
+            if self._on_complete is not None:
+                self._chunks.append(chunk)
+            yield chunk
+        if self._on_complete is not None:
+            self._on_complete(b"".join(self._chunks))
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """
+    Records request counts, status codes and latency per provider around the real
+    transport, request and byte counts on the active scrape run, and the exchange on
+    the active archive recording.
+    """
+
+    def __init__(self, provider: str, transport: httpx.AsyncBaseTransport):
+        self.provider = provider
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        # Ends when the response headers arrive; the body is read by the caller afterwards
+        with tracing.span(
+            f"HTTP {request.method}", kind="CLIENT", provider=self.provider,
+            **{"http.request.method": request.method, "server.address": request.url.host, "url.path": request.url.path},
+        ) as span:
+            try:
+                response = await self._transport.handle_async_request(request)
+            except Exception:
+                metrics.provider_requests.inc(self.provider, request.method, "error")
+                raise
+            finally:
+                metrics.provider_request_duration.observe(time.perf_counter() - start, self.provider)
+            span.set_attribute("http.response.status_code", response.status_code)
+        metrics.provider_requests.inc(self.provider, request.method, str(response.status_code))
+        run_stats.record_request()
+        recording = archive.current_recording()
+        if recording is not None and response.is_stream_consumed:
+            # Read (and decoded) by the transport itself, like httpx.MockTransport does
+            recording.add(request, response, response.content, decoded=True)
+            recording = None
+        on_complete = partial(recording.add, request, response) if recording is not None else None
+        response.stream = _CountingStream(response.stream, on_complete)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+@contextmanager
+def use_transport(factory: TransportFactory) -> Iterator[None]:
+    """Provider clients created in this context (and tasks it spawns) send through `factory()`."""
+    token = _transport_factory.set(factory)
+    try:
+        yield
+    finally:
+        _transport_factory.reset(token)
+
+
+def provider_client(provider: str, **kwargs: Any) -> httpx.AsyncClient:
+    """An httpx.AsyncClient whose requests are recorded under `provider` in the metrics."""
+    transport = kwargs.pop("transport", None)
+    if transport is None:
+        factory = _transport_factory.get()
+        transport = factory() if factory is not None else httpx.AsyncHTTPTransport()
+    return httpx.AsyncClient(transport=InstrumentedTransport(provider, transport), **kwargs)
@@ -1,19 +1,66 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+import httpx
+from loguru import logger
+
+from app.core.exceptions import ProviderError
 from app.schemas.job import JobSchema
+from app.providers.http import provider_client
+from app.providers.scrapers.response_cache import ResponseValidators
+from app.providers.scrapers.validation_cache import validation_cache
 
 class BaseScraper(ABC):
 
     def __init__(self, company_name: str, config: Dict[str, Any]):
         self.company_name = company_name
         self.config = config
+        # Set by the scraping service to make list requests conditional
+        self.response_validators: Optional[ResponseValidators] = None
+        # Off when responses are replayed from the archive rather than fetched
+        self.pacing = True
+
+    @classmethod
+    def provider_name(cls) -> str:
+        return cls.__name__.removesuffix("Scraper")
+
+    @classmethod
+    def http_client(cls, **kwargs: Any) -> httpx.AsyncClient:
+        """HTTP client for provider calls; requests are counted and timed in the metrics."""
+        return provider_client(cls.provider_name(), **kwargs)
+
+    def conditional_headers(self, endpoint: str) -> Dict[str, str]:
+        if self.response_validators is None:
+            return {}
+        return self.response_validators.request_headers(endpoint)
+
+    def not_modified(self, endpoint: str, response: httpx.Response) -> bool:
+        """True when `response` matches the stored validators of `endpoint` (check it before raise_for_status)."""
+        return self.response_validators is not None and self.response_validators.not_modified(endpoint, response)
 
     @classmethod
     @abstractmethod
     async def is_valid_config(cls, config: Dict[str, Any]) -> bool: 
         pass
 
+    @classmethod
+    async def validate_config(cls, config: Dict[str, Any], raise_errors: bool = False) -> bool:
+        """
+        Cached entry point for `is_valid_config`.
+        Provider errors are not cached; they count as invalid for the caller
+        unless `raise_errors` is set, in which case they propagate.
+        """
+        try:
+            return await validation_cache.get_or_validate(
+                cls.__name__, config, lambda: cls.is_valid_config(config)
+            )
+        except ProviderError as e:
+            if raise_errors:
+                raise
+            logger.warning("{} config validation errored, treating as invalid: {}", cls.__name__, e)
+            return False
+
     @abstractmethod
-    async def fetch_jobs(self) -> List[JobSchema]: 
+    async def fetch_jobs(self) -> List[JobSchema]:
+        """Raises ContentNotModifiedError when the list responses match the stored validators."""
         pass
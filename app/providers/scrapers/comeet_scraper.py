@@ -2,10 +2,11 @@ import httpx
 from typing import Dict, Any, List, Optional
 from loguru import logger
 
-from app.schemas.job import JobSchema
+from app.schemas.job import JobSchema, validate_jobs
 from app.providers.scrapers.base import BaseScraper
+from app.core import run_stats, tracing
 
-from app.core.exceptions import RetryableProviderError, FatalProviderError, ProviderError
+from app.core.exceptions import ContentNotModifiedError, RetryableProviderError, FatalProviderError, ProviderError
 
 class ComeetScraper(BaseScraper):
     BASE_URL = "https://www.comeet.co/careers-api/2.0/company"
@@ -30,24 +31,24 @@ class ComeetScraper(BaseScraper):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with cls.http_client(timeout=5.0) as client:
                 resp = await client.get(url, params=params)
                 resp.raise_for_status() 
                 return True
         except httpx.HTTPStatusError as e:
             if e.response.status_code in [403, 404]:
-                logger.warning(f"Comeet Validation Failed: {e.response.status_code} - Invalid Config")
+                logger.warning("Comeet Validation Failed: {} - Invalid Config", e.response.status_code)
                 return False
             
-            logger.error(f"Comeet API Error during validation: {e}")
+            logger.error("Comeet API Error during validation: {}", e)
             raise RetryableProviderError(f"API Error during validation: {e}", provider="Comeet")
             
         except httpx.RequestError as e:
-            logger.error(f"Network error during Comeet validation: {e}")
+            logger.error("Network error during Comeet validation: {}", e)
             raise RetryableProviderError(f"Network error validating config: {e}", provider="Comeet")
             
         except Exception as e:
-            logger.error(f"Unexpected error during Comeet validation: {e}")
+            logger.error("Unexpected error during Comeet validation: {}", e)
             raise ProviderError(f"Unexpected validation error: {e}", provider="Comeet")
 
 
@@ -56,55 +57,64 @@ class ComeetScraper(BaseScraper):
         Fetches all jobs from Comeet API in a single request.
         """
         if not self.uid or not self.token:
-            logger.error(f"Missing uid or token for company {self.company_name}")
+            logger.error("Missing uid or token for company {}", self.company_name)
             return []
 
         url = f"{self.BASE_URL}/{self.uid}/positions"
         params = { "token": self.token, "details": "true" }
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with self.http_client(timeout=10.0) as client:
             try:
-                resp = await client.get(url, params=params)
-                resp.raise_for_status()
-                jobs_data = resp.json()
+                with tracing.span("list page"):
+                    resp = await client.get(url, params=params, headers=self.conditional_headers("positions"))
+                    if self.not_modified("positions", resp):
+                        raise ContentNotModifiedError(f"Positions of {self.company_name} unchanged", provider="Comeet")
+                    resp.raise_for_status()
+                    jobs_data = resp.json()
+                run_stats.record_page()
+            except ContentNotModifiedError:
+                raise
             except httpx.HTTPStatusError as e:
                 if e.response.status_code in [404, 403]:
-                    logger.error(f"Fatal error for {self.company_name}: {e}")
+                    logger.error("Fatal error for {}: {}", self.company_name, e)
                     raise FatalProviderError(f"Company not found or access denied: {e}", provider="Comeet")
                 if e.response.status_code == 429 or e.response.status_code >= 500:
-                    logger.warning(f"Temporary error for {self.company_name}: {e}")
+                    logger.warning("Temporary error for {}: {}", self.company_name, e)
                     raise RetryableProviderError(f"Service unavailable: {e}", provider="Comeet")
                 raise ProviderError(f"HTTP {e.response.status_code}: {e}", provider="Comeet")
             except httpx.RequestError as e:
-                logger.error(f"Connection failed for {self.company_name}: {e}")
+                logger.error("Connection failed for {}: {}", self.company_name, e)
                 raise RetryableProviderError(f"Connection failed: {e}", provider="Comeet")
             except Exception as e:
-                logger.error(f"Unexpected error for {self.company_name}: {e}")
+                logger.error("Unexpected error for {}: {}", self.company_name, e)
                 raise ProviderError(f"Unexpected error: {e}", provider="Comeet")
 
-        return self._parse_jobs(jobs_data)
+        with run_stats.parse_timer(), tracing.span("parse"):
+            return self._parse_jobs(jobs_data)
 
     def _parse_jobs(self, jobs: List[Dict[str, Any]]) -> List[JobSchema]:
-        parsed_jobs = []
+        payloads = []
         for job in jobs:
             try:
-                description_html = self._parse_details(job.get("details", []))
-
-                schema = JobSchema(
-                    title=job.get("name"),
-                    external_id=job.get("uid"),
-                    url=job.get("url_active_page"),
-                    location=job.get("location", {}).get("country"),
-                    city=job.get("location", {}).get("city"),
-                    description=description_html,
-                    published_at=job.get("time_updated"),
-                    raw_data=job
-                )
-                parsed_jobs.append(schema)
+                location = job.get("location") or {}
+                payloads.append({
+                    "title": job.get("name"),
+                    "external_id": job.get("uid"),
+                    "url": job.get("url_active_page"),
+                    "location": location.get("country"),
+                    "city": location.get("city"),
+                    "description": self._parse_details(job.get("details", [])),
+                    "published_at": job.get("time_updated"),
+                    "raw_data": job,
+                })
             except Exception as e:
-                logger.warning(f"Skipping malformed job {job.get('uid')}: {e}")
+                logger.warning("Skipping malformed job {}: {}", job.get('uid'), e)
+
+        parsed_jobs, rejected = validate_jobs(payloads)
+        for payload, error in rejected:
+            logger.warning("Skipping malformed job {}: {}", payload.get('external_id'), error)
 
-        logger.info(f"Successfully parsed {len(parsed_jobs)} jobs for {self.company_name}")
+        logger.debug("Successfully parsed {} jobs for {}", len(parsed_jobs), self.company_name)
         return parsed_jobs
 
     def _parse_details(self, details: List[Dict[str, Any]]) -> Optional[str]:
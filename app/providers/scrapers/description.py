@@ -0,0 +1,118 @@
+"""
+CPU-bound description processing. Functions here run in the CPU stage's worker
+processes, so they must stay module-level, picklable and free of app state.
+"""
+import hashlib
+import re
+from typing import List, NamedTuple, Optional
+
+from lxml import etree
+from lxml import html as lxml_html
+
+DROP_TAGS = (
+    "script", "style", "iframe", "object", "embed", "form", "input",
+    "button", "select", "textarea", "noscript", "link", "meta", "base",
+)
+KEEP_ATTRS = {"href", "title", "alt", "colspan", "rowspan"}
+# Links keep only these schemes; scheme-less (relative) URLs are kept too
+SAFE_URL_SCHEMES = {"http", "https", "mailto"}
+BLOCK_TAGS = (
+    "p", "div", "br", "li", "ul", "ol", "tr", "table", "section", "article",
+    "blockquote", "pre", "h1", "h2", "h3", "h4", "h5", "h6",
+)
+HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+
+SNIPPET_LENGTH = 280
+_WHITESPACE = re.compile(r"\s+")
+# Browsers ignore control characters and whitespace inside a scheme ("java\tscript:")
+_URL_IGNORED = re.compile(r"[\x00-\x20\x7f]+")
+_URL_SCHEME = re.compile(r"^([a-z][a-z0-9+.\-]*):", re.IGNORECASE)
+
+
+class DerivedDescription(NamedTuple):
+    html: Optional[str]
+    text: Optional[str]
+    snippet: Optional[str]
+
+
+def content_hash(html: Optional[str]) -> Optional[str]:
+    """Hash of the raw provider description; derived fields are recomputed only when it changes."""
+    if html is None:
+        return None
+    return hashlib.sha256(html.encode()).hexdigest()
+
+
+def _parse(html: str) -> lxml_html.HtmlElement:
+    return lxml_html.fragment_fromstring(html, create_parent="div")
+
+
+def _is_safe_url(url: str) -> bool:
+    scheme = _URL_SCHEME.match(_URL_IGNORED.sub("", url))
+    return scheme is None or scheme.group(1).lower() in SAFE_URL_SCHEMES
+
+
+def _sanitize(root: lxml_html.HtmlElement) -> Optional[str]:
+    etree.strip_elements(root, *DROP_TAGS, etree.Comment, etree.ProcessingInstruction, with_tail=False)
+
+    for element in root.iter():
+        for attr in list(element.attrib):
+            if attr not in KEEP_ATTRS or (attr == "href" and not _is_safe_url(element.attrib[attr])):
+                del element.attrib[attr]
+
+    # Serialize the children of the synthetic <div> wrapper
+    cleaned = lxml_html.tostring(root, encoding="unicode")[len("<div>"):-len("</div>")].strip()
+    return cleaned or None
+
+
+def _text_lines(root: lxml_html.HtmlElement) -> List[str]:
+    """Visible text, one line per block element. Mutates the tree."""
+    for element in root.iter(*BLOCK_TAGS):
+        element.tail = "\n" + (element.tail or "")
+        if element.tag != "br":
+            element.text = "\n" + (element.text or "")
+
+    lines = (_WHITESPACE.sub(" ", line).strip() for line in root.text_content().split("\n"))
+    return [line for line in lines if line]
+
+
+def _snippet(lines: List[str], headings: set) -> Optional[str]:
+    text = " ".join(line for line in lines if line not in headings) or " ".join(lines)
+    if len(text) <= SNIPPET_LENGTH:
+        return text or None
+    cut = text[:SNIPPET_LENGTH].rsplit(" ", 1)[0]
+    return cut.rstrip(",.;:-") + "…"
+
+
+def sanitize_html(html: Optional[str]) -> Optional[str]:
+    """
+    Strips active content (scripts, embeds, forms, event handlers, links other than
+    http(s), mailto or relative ones),
+    comments and presentational attributes from provider HTML.
+    Returns None for empty input.
+    """
+    if not html or not html.strip():
+        return None
+    return _sanitize(_parse(html))
+
+
+def html_to_text(html: Optional[str]) -> Optional[str]:
+    if not html or not html.strip():
+        return None
+    return "\n".join(_text_lines(_parse(html))) or None
+
+
+def derive_description(html: Optional[str]) -> DerivedDescription:
+    """Sanitized HTML, plain text and a short snippet from one parse of the provider HTML."""
+    if not html or not html.strip():
+        return DerivedDescription(None, None, None)
+
+    root = _parse(html)
+    sanitized = _sanitize(root)
+    headings = {_WHITESPACE.sub(" ", h.text_content()).strip() for h in root.iter(*HEADING_TAGS)}
+    lines = _text_lines(root)
+
+    return DerivedDescription(sanitized, "\n".join(lines) or None, _snippet(lines, headings))
+
+
+def derive_batch(descriptions: List[Optional[str]]) -> List[DerivedDescription]:
+    return [derive_description(description) for description in descriptions]
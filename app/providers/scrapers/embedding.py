@@ -0,0 +1,38 @@
+"""
+Dense job text vectors for nearest-neighbour search: hashed word/bigram counts
+reduced to DIM dimensions with a fixed sparse random projection, L2-normalized,
+so cosine similarity is a dot product. Stateless and deterministic, so vectors
+computed in different processes (CPU stage workers, the API) are comparable.
+"""
+from functools import lru_cache
+from typing import List, Optional
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.random_projection import SparseRandomProjection
+
+DIM = 256
+N_FEATURES = 2 ** 18
+
+_vectorizer = HashingVectorizer(
+    n_features=N_FEATURES, ngram_range=(1, 2), alternate_sign=False, norm=None, stop_words="english",
+)
+
+
+@lru_cache(maxsize=1)
+def _projection() -> SparseRandomProjection:
+    return SparseRandomProjection(n_components=DIM, dense_output=True, random_state=0).fit(sp.csr_matrix((1, N_FEATURES)))
+
+
+def embed(texts: List[Optional[str]]) -> np.ndarray:
+    """(len(texts), DIM) float32 unit vectors; empty texts map to zero vectors."""
+    counts = _vectorizer.transform([text or "" for text in texts])
+    counts.data = np.log1p(counts.data)  # sublinear term frequency
+    vectors = np.asarray(_projection().transform(counts), dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+def embed_batch(texts: List[Optional[str]]) -> List[np.ndarray]:
+    return list(embed(texts))
@@ -28,8 +28,10 @@ class ScraperFactory:
         return scraper_cls(company.name, company.metadata_config)
 
     @classmethod
-    async def validate_provider_config(cls, ats_provider: ATSProvider, config: Dict[str, Any]) -> bool:
+    async def validate_provider_config(
+        cls, ats_provider: ATSProvider, config: Dict[str, Any], raise_errors: bool = False
+    ) -> bool:
         scraper_cls = cls._registry.get(ats_provider)
         if not scraper_cls:
             return False
-        return await scraper_cls.is_valid_config(config)
+        return await scraper_cls.validate_config(config, raise_errors=raise_errors)
@@ -0,0 +1,75 @@
+"""
+Near-duplicate fingerprints for job postings: 64-bit SimHash over word shingles
+of the title and plain-text description. Runs in the CPU stage's worker processes.
+
+Hashes are split into 6 bands of 10-11 bits; two hashes within MAX_DISTANCE (5) bits
+always share at least one band exactly, so candidates are found by band equality
+and confirmed by Hamming distance. Job posts are short, so reposts with a changed
+sentence typically land 1-5 bits apart while unrelated posts are 20+ bits apart.
+"""
+import hashlib
+import re
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+BANDS = 6
+MAX_DISTANCE = BANDS - 1
+SHINGLE_SIZE = 3
+
+_MASK = (1 << 64) - 1
+
+
+def _band_layout() -> List[Tuple[int, int]]:
+    """(offset, width) of each band, splitting 64 bits as evenly as possible."""
+    layout, offset = [], 0
+    for band in range(BANDS):
+        width = 64 // BANDS + (band < 64 % BANDS)
+        layout.append((offset, width))
+        offset += width
+    return layout
+
+
+_BAND_LAYOUT = _band_layout()
+_TOKEN = re.compile(r"\w+")
+
+
+def _shingles(text: str) -> List[str]:
+    tokens = _TOKEN.findall(text.lower())
+    if len(tokens) <= SHINGLE_SIZE:
+        return [" ".join(tokens)] if tokens else []
+    return list({" ".join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)})
+
+
+def simhash(text: Optional[str]) -> Optional[int]:
+    """Signed 64-bit SimHash (fits a Postgres BIGINT), or None for empty text."""
+    shingles = _shingles(text or "")
+    if not shingles:
+        return None
+
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "little") for s in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    bits = np.unpackbits(hashes.view(np.uint8)).reshape(len(shingles), 64)
+    majority = np.packbits(bits.sum(axis=0) * 2 > len(shingles))
+    value = int(majority.view(np.uint64)[0])
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def bands(value: int) -> List[int]:
+    unsigned = value & _MASK
+    return [(unsigned >> offset) & ((1 << width) - 1) for offset, width in _BAND_LAYOUT]
+
+
+def distance(a: int, b: int) -> int:
+    return bin((a ^ b) & _MASK).count("1")
+
+
+def job_text(title: Optional[str], description_text: Optional[str]) -> str:
+    return f"{title or ''}\n{description_text or ''}"
+
+
+def simhash_batch(texts: List[Optional[str]]) -> List[Optional[int]]:
+    return [simhash(text) for text in texts]
@@ -0,0 +1,194 @@
+"""
+Offline location normalization. Provider location strings ("Tel Aviv-Yafo",
+"Herzliya, Israel", "Remote - Boston, MA") are resolved against a bundled
+gazetteer of cities into a canonical city, country and coordinates, and a
+KD-tree over the gazetteer answers "cities within N km" without geocoding.
+"""
+import csv
+import math
+import re
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+DEFAULT_GAZETTEER_PATH = Path(__file__).parent / "data" / "gazetteer.tsv"
+EARTH_RADIUS_KM = 6371.0
+MAX_NGRAM = 4
+
+# Country names and codes accepted as hints in free-text locations
+COUNTRIES: Dict[str, List[str]] = {
+    "IL": ["israel"],
+    "US": ["united states", "united states of america", "usa", "us", "america"],
+    "GB": ["united kingdom", "uk", "great britain", "england", "scotland"],
+    "CA": ["canada"],
+    "IE": ["ireland"],
+    "FR": ["france"],
+    "DE": ["germany", "deutschland"],
+    "NL": ["netherlands", "the netherlands", "holland"],
+    "BE": ["belgium"],
+    "CH": ["switzerland"],
+    "AT": ["austria"],
+    "CZ": ["czech republic", "czechia"],
+    "PL": ["poland"],
+    "HU": ["hungary"],
+    "RO": ["romania"],
+    "BG": ["bulgaria"],
+    "GR": ["greece"],
+    "UA": ["ukraine"],
+    "PT": ["portugal"],
+    "ES": ["spain"],
+    "IT": ["italy"],
+    "SE": ["sweden"],
+    "DK": ["denmark"],
+    "NO": ["norway"],
+    "FI": ["finland"],
+    "EE": ["estonia"],
+    "CY": ["cyprus"],
+    "TR": ["turkey", "turkiye"],
+    "AE": ["united arab emirates", "uae"],
+    "IN": ["india"],
+    "SG": ["singapore"],
+    "JP": ["japan"],
+    "KR": ["south korea", "korea"],
+    "CN": ["china"],
+    "HK": ["hong kong"],
+    "AU": ["australia"],
+    "BR": ["brazil"],
+    "AR": ["argentina"],
+    "MX": ["mexico"],
+    "ZA": ["south africa"],
+}
+
+# "Boston, MA": state codes hint at the US (alongside any country sharing the code, like CA)
+US_STATE_CODES = frozenset((
+    "al ak az ar ca co ct de fl ga hi id il in ia ks ky la me md ma mi mn ms mo mt ne nv nh nj "
+    "nm ny nc nd oh ok or pa ri sc sd tn tx ut vt va wa wv wi wy dc"
+).split())
+
+_SEGMENT_SEPARATORS = re.compile(r"[,;/|()\n]|\s-\s|\s–\s")
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+class City(NamedTuple):
+    name: str
+    country_code: str
+    latitude: float
+    longitude: float
+    population: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.country_code}:{self.name}"
+
+
+class NormalizedLocation(NamedTuple):
+    city: Optional[str]
+    country_code: Optional[str]
+    latitude: Optional[float]
+    longitude: Optional[float]
+    key: Optional[str]
+
+
+def normalize_name(text: Optional[str]) -> str:
+    """Lowercase ASCII words: 'Tel Aviv-Yafo' -> 'tel aviv yafo', 'Zürich' -> 'zurich'."""
+    if not text:
+        return ""
+    ascii_text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return _NON_ALNUM.sub(" ", ascii_text.replace("'", "").lower()).strip()
+
+
+def _to_xyz(latitude: np.ndarray, longitude: np.ndarray) -> np.ndarray:
+    lat, lon = np.radians(latitude), np.radians(longitude)
+    return np.column_stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+
+
+class Gazetteer:
+    """
+    In-memory city gazetteer. Name lookups go through an alias index built once at
+    load; spatial queries use a KD-tree over unit-sphere coordinates, where a great-circle
+    radius maps to a straight-line (chord) radius.
+    """
+
+    def __init__(self, cities: List[City], aliases: List[List[str]]):
+        self.cities = cities
+        self._by_name: Dict[str, List[int]] = {}
+        for index, (city, names) in enumerate(zip(cities, aliases)):
+            for name in {normalize_name(city.name), *(normalize_name(alias) for alias in names)} - {""}:
+                self._by_name.setdefault(name, []).append(index)
+        # Most populous first, so ambiguous names default to the largest city
+        for indexes in self._by_name.values():
+            indexes.sort(key=lambda i: -cities[i].population)
+
+        self._countries = {name: code for code, names in COUNTRIES.items() for name in (code.lower(), *names)}
+        self._tree = cKDTree(_to_xyz(
+            np.array([city.latitude for city in cities]), np.array([city.longitude for city in cities])
+        ))
+
+    @classmethod
+    def from_file(cls, path: Path = DEFAULT_GAZETTEER_PATH) -> "Gazetteer":
+        """Loads a TSV with name, country_code, latitude, longitude, population and |-separated aliases."""
+        cities, aliases = [], []
+        with open(path, encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f, delimiter="\t"):
+                cities.append(City(
+                    row["name"], row["country_code"].upper(),
+                    float(row["latitude"]), float(row["longitude"]), int(row["population"] or 0),
+                ))
+                aliases.append([alias for alias in (row.get("aliases") or "").split("|") if alias])
+        return cls(cities, aliases)
+
+    def _country_hints(self, segments: List[str], with_states: bool) -> Set[str]:
+        hints = {self._countries[segment] for segment in segments if segment in self._countries}
+        if with_states and any(segment in US_STATE_CODES for segment in segments):
+            hints.add("US")
+        return hints
+
+    def _city_matches(self, segment: str) -> List[int]:
+        """Cities named by the segment, or else by its longest matching word n-gram."""
+        if segment in self._by_name:
+            return self._by_name[segment]
+        words = segment.split()
+        for size in range(min(MAX_NGRAM, len(words) - 1), 0, -1):
+            for start in range(len(words) - size + 1):
+                matches = self._by_name.get(" ".join(words[start:start + size]))
+                if matches:
+                    return matches
+        return []
+
+    def normalize(self, location: Optional[str] = None, city: Optional[str] = None) -> Optional[NormalizedLocation]:
+        """
+        Resolves a provider city and/or free-text location. Country names or codes in
+        the text disambiguate same-named cities. Returns a country-only location when no
+        city is recognized, or None when nothing is.
+        """
+        segments = [
+            normalize_name(segment)
+            for text in (city, location) if text
+            for segment in _SEGMENT_SEPARATORS.split(text)
+        ]
+        segments = [segment for segment in segments if segment]
+        countries = self._country_hints(segments, with_states=True)
+
+        for segment in segments:
+            if (segment in self._countries or segment in US_STATE_CODES) and segment not in self._by_name:
+                continue
+            matches = self._city_matches(segment)
+            if matches:
+                hinted = [i for i in matches if self.cities[i].country_code in countries]
+                found = self.cities[(hinted or matches)[0]]
+                return NormalizedLocation(found.name, found.country_code, found.latitude, found.longitude, found.key)
+
+        countries = self._country_hints(segments, with_states=False)
+        if len(countries) == 1:
+            return NormalizedLocation(None, countries.pop(), None, None, None)
+        return None
+
+    def within(self, latitude: float, longitude: float, radius_km: float) -> List[City]:
+        """Gazetteer cities within `radius_km` (great-circle) of a point."""
+        angle = min(radius_km / EARTH_RADIUS_KM, math.pi)
+        chord = 2 * math.sin(angle / 2)
+        point = _to_xyz(np.array([latitude]), np.array([longitude]))[0]
+        return [self.cities[i] for i in self._tree.query_ball_point(point, chord + 1e-12)]
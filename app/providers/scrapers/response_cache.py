@@ -0,0 +1,68 @@
+"""
+Conditional requests for provider list endpoints. A scrape starts from the
+validators stored for its company, one set per endpoint: the ETag and Last-Modified
+of the last applied response and a digest of its body. They go out as
+If-None-Match / If-Modified-Since where the provider honours them, and a 304, or a
+200 whose body digest is unchanged, means "not modified" before the body is parsed.
+
+Validators seen during a scrape are only stored once the scrape has been applied,
+so a failed run never hides changes from the next one.
+"""
+import hashlib
+from typing import Dict, Iterable, List, Optional
+
+import httpx
+
+from app.models.response_validator import ResponseValidator
+
+
+def body_digest(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+class ResponseValidators:
+    """The validators of one company's scrape: stored ones to check against, and those seen to store."""
+
+    def __init__(self, stored: Iterable[ResponseValidator] = ()):
+        self._stored: Dict[str, ResponseValidator] = {validator.endpoint: validator for validator in stored}
+        self._seen: Dict[str, Dict[str, Optional[str]]] = {}
+
+    def request_headers(self, endpoint: str) -> Dict[str, str]:
+        stored = self._stored.get(endpoint)
+        headers = {}
+        if stored is not None and stored.etag:
+            headers["If-None-Match"] = stored.etag
+        if stored is not None and stored.last_modified:
+            headers["If-Modified-Since"] = stored.last_modified
+        return headers
+
+    def not_modified(self, endpoint: str, response: httpx.Response) -> bool:
+        """
+        Whether the endpoint's response matches its stored validators. Successful
+        responses are remembered for `seen`; others are left to the caller's error handling.
+        """
+        stored = self._stored.get(endpoint)
+        if response.status_code == 304 and stored is not None:
+            self._seen[endpoint] = {
+                "endpoint": endpoint,
+                "etag": response.headers.get("etag", stored.etag),
+                "last_modified": response.headers.get("last-modified", stored.last_modified),
+                "body_digest": stored.body_digest,
+            }
+            return True
+        if not response.is_success:
+            return False
+
+        digest = body_digest(response.content)
+        self._seen[endpoint] = {
+            "endpoint": endpoint,
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "body_digest": digest,
+        }
+        return stored is not None and stored.body_digest == digest
+
+    @property
+    def seen(self) -> List[Dict[str, Optional[str]]]:
+        """Rows for response_validator_repository.upsert_many."""
+        return list(self._seen.values())
@@ -0,0 +1,117 @@
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+
+def config_fingerprint(provider: Optional[str], config: Optional[Dict[str, Any]]) -> str:
+    """Stable hash of a (provider, config) pair, independent of key order."""
+    payload = json.dumps({"provider": provider, "config": config or {}}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ValidationCache:
+    """
+    TTL + LRU cache for provider config validation results.
+    Valid and invalid results expire separately, errors are never cached,
+    and concurrent lookups for the same key share a single validation call.
+    If that call's caller is cancelled, the other lookups validate again.
+    """
+
+    def __init__(self, positive_ttl: float, negative_ttl: float, max_size: int):
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.max_size = max_size
+
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[bool, float]]" = OrderedDict()
+        # Result of the in-flight validation per key; None when it was cancelled
+        self._inflight: Dict[Tuple[str, str], "asyncio.Future[Optional[bool]]"] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    async def get_or_validate(
+        self,
+        provider: str,
+        config: Dict[str, Any],
+        validator: Callable[[], Awaitable[bool]],
+    ) -> bool:
+        key = (provider, config_fingerprint(provider, config))
+
+        while True:
+            entry = self._entries.get(key)
+            if entry is not None:
+                is_valid, expires_at = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return is_valid
+                del self._entries[key]
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            self.coalesced += 1
+            is_valid = await asyncio.shield(inflight)
+            # None: the validating caller was cancelled; look up again
+            if is_valid is not None:
+                return is_valid
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            is_valid = await validator()
+        except asyncio.CancelledError:
+            # Waiters were not cancelled themselves: release them to retry
+            future.set_result(None)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # mark as retrieved when nobody else was waiting
+            raise
+        else:
+            self._store(key, is_valid)
+            future.set_result(is_valid)
+            return is_valid
+        finally:
+            self._inflight.pop(key, None)
+
+    def _store(self, key: Tuple[str, str], is_valid: bool) -> None:
+        ttl = self.positive_ttl if is_valid else self.negative_ttl
+        self._entries[key] = (is_valid, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, provider: str, config: Dict[str, Any]) -> None:
+        self._entries.pop((provider, config_fingerprint(provider, config)), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = self.coalesced = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "hit_ratio": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+        }
+
+
+validation_cache = ValidationCache(
+    positive_ttl=settings.VALIDATION_CACHE_POSITIVE_TTL,
+    negative_ttl=settings.VALIDATION_CACHE_NEGATIVE_TTL,
+    max_size=settings.VALIDATION_CACHE_MAX_SIZE,
+)
@@ -4,11 +4,13 @@ from typing import Dict, Any, List, Optional
 from loguru import logger
 from urllib.parse import urlparse
 
-from app.schemas.job import JobSchema
+from app.schemas.job import JobSchema, validate_jobs
 from app.providers.scrapers.base import BaseScraper
-from app.core.exceptions import RetryableProviderError, FatalProviderError, ProviderError
+from app.core import run_stats, tracing
+from app.core.exceptions import ContentNotModifiedError, RetryableProviderError, FatalProviderError, ProviderError
 
 class WorkableScraper(BaseScraper):
+    BASE_URL = "https://apply.workable.com"
 
     def __init__(self, company_name: str, config: Dict[str, Any]):
         super().__init__(company_name, config)
@@ -22,10 +24,10 @@ class WorkableScraper(BaseScraper):
             
         try:
 
-            api_url = f"https://apply.workable.com/api/v3/accounts/{slug}/jobs"
+            api_url = f"{cls.BASE_URL}/api/v3/accounts/{slug}/jobs"
             payload = {"location": [{"country": "Israel", "countryCode": "IL"}]}
             
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with cls.http_client(timeout=5.0) as client:
                 resp = await client.post(api_url, json=payload)
                 resp.raise_for_status() 
                 data = resp.json()
@@ -34,18 +36,18 @@ class WorkableScraper(BaseScraper):
                 return False
         except httpx.HTTPStatusError as e:
             if e.response.status_code in [403, 404]:
-                logger.warning(f"Workable Validation Failed: {e.response.status_code} - Invalid Config")
+                logger.warning("Workable Validation Failed: {} - Invalid Config", e.response.status_code)
                 return False
             
-            logger.error(f"Workable API Error during validation: {e}")
+            logger.error("Workable API Error during validation: {}", e)
             raise RetryableProviderError(f"API Error during validation: {e}", provider="Workable")
             
         except httpx.RequestError as e:
-            logger.error(f"Network error during Workable validation: {e}")
+            logger.error("Network error during Workable validation: {}", e)
             raise RetryableProviderError(f"Network error validating config: {e}", provider="Workable")
             
         except Exception as e:
-            logger.error(f"Unexpected error during Workable validation: {e}")
+            logger.error("Unexpected error during Workable validation: {}", e)
             raise ProviderError(f"Unexpected validation error: {e}", provider="Workable")
         
         return False
@@ -54,36 +56,40 @@ class WorkableScraper(BaseScraper):
         slug = self.slug
         
         if not slug:
-            logger.error(f"Missing name for company {self.company_name}")
+            logger.error("Missing name for company {}", self.company_name)
             return []
 
-        list_api_url = f"https://apply.workable.com/api/v3/accounts/{slug}/jobs"
-        base_detail_url = f"https://apply.workable.com/api/v2/accounts/{slug}/jobs/"
+        list_api_url = f"{self.BASE_URL}/api/v3/accounts/{slug}/jobs"
+        base_detail_url = f"{self.BASE_URL}/api/v2/accounts/{slug}/jobs/"
 
         all_jobs = []
 
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept": "application/json, text/plain, */*",
-            "Origin": "https://apply.workable.com"
+            "Origin": self.BASE_URL
         }
         payload = {"location": [{"country": "Israel", "countryCode": "IL"}]}
 
-        async with httpx.AsyncClient(timeout=30.0, headers=headers) as client:
+        async with self.http_client(timeout=30.0, headers=headers) as client:
             try:
-                logger.debug(f"[{self.company_name}] Fetching jobs list for Workable slug '{slug}'...")
-                resp = await client.post(list_api_url, json=payload)
-                resp.raise_for_status()
-                data = resp.json()
+                logger.debug("[{}] Fetching jobs list for Workable slug '{}'...", self.company_name, slug)
+                with tracing.span("list page"):
+                    resp = await client.post(list_api_url, json=payload, headers=self.conditional_headers("jobs"))
+                    if self.not_modified("jobs", resp):
+                        raise ContentNotModifiedError(f"Job list of {self.company_name} unchanged", provider="Workable")
+                    resp.raise_for_status()
+                    data = resp.json()
+                run_stats.record_page()
                 
                 job_results = data.get("results", [])
                 total = data.get("total", len(job_results))
                 
                 if not job_results:
-                    logger.info(f"[{self.company_name}] No jobs found for Workable.")
+                    logger.debug("[{}] No jobs found for Workable.", self.company_name)
                     return []
                 
-                logger.info(f"[{self.company_name}] Discovered {total} total jobs in search. Processing details...")
+                logger.debug("[{}] Discovered {} total jobs in search. Processing details...", self.company_name, total)
                 
                 semaphore = asyncio.Semaphore(5)
                 
@@ -92,69 +98,76 @@ class WorkableScraper(BaseScraper):
                     title = job_summary.get("title")
                     
                     if not shortcode:
-                        logger.warning(f"Job {title} has no shortcode, skipping details.")
+                        logger.warning("Job {} has no shortcode, skipping details.", title)
                         return None
                         
                     detail_url = f"{base_detail_url}{shortcode}"
                     
                     try:
-                        async with semaphore:
-                            detail_resp = await client.get(detail_url)
+                        with tracing.span("detail", shortcode=shortcode):
+                            async with semaphore:
+                                detail_resp = await client.get(detail_url)
                             
                         if detail_resp.status_code == 200:
-                            detail_data = detail_resp.json()
-                            
-                            description_html = detail_data.get("description", "")
-                            requirements_html = detail_data.get("requirements", "")
-                            benefits_html = detail_data.get("benefits", "")
-                            
-                            
-                            full_description = ""
-                            if description_html:
-                                full_description += f"<h4>Description</h4>{description_html}"
-                            if requirements_html:
-                                full_description += f"<h4>Requirements</h4>{requirements_html}"
-                            if benefits_html:
-                                full_description += f"<h4>Benefits</h4>{benefits_html}"
-                                
-                            location_data = detail_data.get("location", {})
-                            city = location_data.get("city")
-                            country = location_data.get("country")
-
-                            external_url = f"https://apply.workable.com/{slug}/j/{shortcode}/"
-                            
-                            return JobSchema(
-                                title=detail_data.get("title", title),
-                                external_id=str(detail_data.get("id")) if detail_data.get("id") else shortcode,
-                                url=external_url,
-                                location=country,
-                                city=city,
-                                description=full_description,
-                                published_at=detail_data.get("published"),
-                                raw_data=detail_data
-                            )
+                            return self._detail_payload(detail_resp.json(), shortcode, title)
                         else:
-                            logger.warning(f"Failed to fetch details for {title}: {detail_resp.status_code}")
+                            logger.warning("Failed to fetch details for {}: {}", title, detail_resp.status_code)
                             return None
                             
                     except Exception as e:
-                        logger.warning(f"Skipping malformed Workable job '{title}': {e}")
+                        logger.warning("Skipping malformed Workable job '{}': {}", title, e)
                         return None
 
                 tasks = [fetch_job_detail(js) for js in job_results]
-                page_results = await asyncio.gather(*tasks)
+                with tracing.span("detail fan-out", jobs=len(tasks)):
+                    page_results = await asyncio.gather(*tasks)
                 
-                valid_jobs = [j for j in page_results if j is not None]
+                with run_stats.parse_timer(), tracing.span("validate"):
+                    valid_jobs, rejected = validate_jobs([j for j in page_results if j is not None])
+                for job_payload, error in rejected:
+                    logger.warning("Skipping malformed Workable job '{}': {}", job_payload.get('title'), error)
                 all_jobs.extend(valid_jobs)
 
+            except ContentNotModifiedError:
+                raise
             except httpx.HTTPStatusError as e:
                  if e.response.status_code == 403:
-                     logger.warning(f"Access denied (403) for {self.company_name}.")
+                     logger.warning("Access denied (403) for {}.", self.company_name)
                      raise FatalProviderError("Blocked by WAF/Cloudflare", provider="Workable")
                  raise RetryableProviderError(f"HTTP Error: {e}", provider="Workable")
             except Exception as e:
-                logger.error(f"Unexpected error scraping Workable: {e}")
+                logger.error("Unexpected error scraping Workable: {}", e)
                 raise ProviderError(f"Unexpected: {e}", provider="Workable")
 
-        logger.info(f"Successfully parsed {len(all_jobs)} jobs for {self.company_name}")
+        logger.debug("Successfully parsed {} jobs for {}", len(all_jobs), self.company_name)
         return all_jobs
+
+    def _detail_payload(self, detail_data: Dict[str, Any], shortcode: str, title: Optional[str]) -> Dict[str, Any]:
+        """
+        Unvalidated JobSchema fields for a detail document; pages are validated in one batch.
+        Description, requirements and benefits are concatenated as <h4> sections.
+        """
+        description_html = detail_data.get("description", "")
+        requirements_html = detail_data.get("requirements", "")
+        benefits_html = detail_data.get("benefits", "")
+
+        full_description = ""
+        if description_html:
+            full_description += f"<h4>Description</h4>{description_html}"
+        if requirements_html:
+            full_description += f"<h4>Requirements</h4>{requirements_html}"
+        if benefits_html:
+            full_description += f"<h4>Benefits</h4>{benefits_html}"
+
+        location_data = detail_data.get("location", {})
+
+        return {
+            "title": detail_data.get("title", title),
+            "external_id": str(detail_data.get("id")) if detail_data.get("id") else shortcode,
+            "url": f"{self.BASE_URL}/{self.slug}/j/{shortcode}/",
+            "location": location_data.get("country"),
+            "city": location_data.get("city"),
+            "description": full_description,
+            "published_at": detail_data.get("published"),
+            "raw_data": detail_data,
+        }
@@ -4,9 +4,10 @@ from typing import Dict, Any, List, Optional
 from loguru import logger
 from urllib.parse import urlparse, parse_qs
 
-from app.schemas.job import JobSchema
+from app.schemas.job import JobSchema, validate_jobs
 from app.providers.scrapers.base import BaseScraper
-from app.core.exceptions import RetryableProviderError, FatalProviderError, ProviderError
+from app.core import run_stats, tracing
+from app.core.exceptions import ContentNotModifiedError, RetryableProviderError, FatalProviderError, ProviderError
 
 class WorkdayScraper(BaseScraper):
     
@@ -20,31 +21,31 @@ class WorkdayScraper(BaseScraper):
         if not url: return False
         
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with cls.http_client(timeout=5.0) as client:
                 resp = await client.get(url)
                 resp.raise_for_status() 
                 return True
         except httpx.HTTPStatusError as e:
             if e.response.status_code in [403, 404]:
-                logger.warning(f"Workday Validation Failed: {e.response.status_code} - Invalid Config")
+                logger.warning("Workday Validation Failed: {} - Invalid Config", e.response.status_code)
                 return False
             
-            logger.error(f"Workday API Error during validation: {e}")
+            logger.error("Workday API Error during validation: {}", e)
             raise RetryableProviderError(f"API Error during validation: {e}", provider="Workday")
             
         except httpx.RequestError as e:
-            logger.error(f"Network error during Workday validation: {e}")
+            logger.error("Network error during Workday validation: {}", e)
             raise RetryableProviderError(f"Network error validating config: {e}", provider="Workday")
             
         except Exception as e:
-            logger.error(f"Unexpected error during Workday validation: {e}")
+            logger.error("Unexpected error during Workday validation: {}", e)
             raise ProviderError(f"Unexpected validation error: {e}", provider="Workday")
         
         return True
 
     async def fetch_jobs(self) -> List[JobSchema]:
         if not self.careers_url:
-            logger.error(f"Missing careers_url for company {self.company_name}")
+            logger.error("Missing careers_url for company {}", self.company_name)
             return []
 
         url_parts = urlparse(self.careers_url)
@@ -53,9 +54,9 @@ class WorkdayScraper(BaseScraper):
         tenant = host.split(".")[0] # acme
         path_parts = url_parts.path.strip("/").split("/")[1:] # acme_careers        
         site_id = path_parts[0]
-        api_url = f"https://{host}/wday/cxs/{tenant}/{site_id}/jobs"
+        api_url = f"{url_parts.scheme or 'https'}://{host}/wday/cxs/{tenant}/{site_id}/jobs"
         params = parse_qs(url_parts.query)
-        logger.debug(f"FOUND Workday API Base: {api_url}")
+        logger.debug("FOUND Workday API Base: {}", api_url)
 
         all_jobs = []
         offset = 0
@@ -68,9 +69,10 @@ class WorkdayScraper(BaseScraper):
         }
         
  
-        async with httpx.AsyncClient(timeout=30.0, headers=headers) as client:
+        async with self.http_client(timeout=30.0, headers=headers) as client:
             try:
-                await client.get(self.careers_url)
+                with tracing.span("landing page"):
+                    await client.get(self.careers_url)
                 
                 while True:
                    
@@ -81,11 +83,19 @@ class WorkdayScraper(BaseScraper):
                         "searchText": ""
                     }
                     
-                    logger.debug(f"[{self.company_name}] Fetching offset {offset}...")
+                    logger.debug("[{}] Fetching offset {}...", self.company_name, offset)
                     
-                    resp = await client.post(api_url, json=payload)
-                    resp.raise_for_status()
-                    data = resp.json()
+                    with tracing.span("list page", offset=offset):
+                        if offset == 0:
+                            # The first page carries the total and the newest postings, so it stands for the list
+                            resp = await client.post(api_url, json=payload, headers=self.conditional_headers("jobs"))
+                            if self.not_modified("jobs", resp):
+                                raise ContentNotModifiedError(f"Job list of {self.company_name} unchanged", provider="Workday")
+                        else:
+                            resp = await client.post(api_url, json=payload)
+                        resp.raise_for_status()
+                        data = resp.json()
+                    run_stats.record_page()
                     
                     current_total = data.get("total")
                     if offset == 0:
@@ -93,13 +103,13 @@ class WorkdayScraper(BaseScraper):
                     
                     job_postings = data.get("jobPostings")
                     if not job_postings:
-                        logger.info(f"[{self.company_name}] No more jobs found at offset {offset}.")
+                        logger.debug("[{}] No more jobs found at offset {}.", self.company_name, offset)
                         break
                     
                     if offset == 0:
-                        logger.info(f"[{self.company_name}] Discovered {total} total jobs. Starting to fetch details...")
+                        logger.debug("[{}] Discovered {} total jobs. Starting to fetch details...", self.company_name, total)
                     
-                    logger.debug(f"[{self.company_name}] Response: Found {len(job_postings)} jobs at offset {offset}.")
+                    logger.debug("[{}] Response: Found {} jobs at offset {}.", self.company_name, len(job_postings), offset)
                     semaphore = asyncio.Semaphore(20)
                     
                     async def fetch_job_detail(job_summary):
@@ -107,65 +117,73 @@ class WorkdayScraper(BaseScraper):
                         external_path = job_summary.get("externalPath")
                         
                         if not external_path:
-                            logger.warning(f"Job {title} has no externalPath, skipping details.")
+                            logger.warning("Job {} has no externalPath, skipping details.", title)
                             return None
 
                         detail_api_url = f"{api_url.removesuffix('/jobs')}{external_path}"
                         
                         try:
-                            async with semaphore:
-                                detail_resp = await client.get(detail_api_url)
+                            with tracing.span("detail", path=external_path):
+                                async with semaphore:
+                                    detail_resp = await client.get(detail_api_url)
                                 
                             if detail_resp.status_code == 200:
-                                detail_data = detail_resp.json()
-                                job_posting_info = detail_data.get("jobPostingInfo", {})
-                                
-                                description = job_posting_info.get("jobDescription")
-                                external_url = job_posting_info.get("externalUrl") 
-                                
-                                if not external_url:
-                                     external_url = f"https://{host}/en-US/{site_id}{external_path}"
-                                
-                                return JobSchema(
-                                    title=title,
-                                    external_id=job_posting_info.get("jobReqId") or job_posting_info.get("id"),
-                                    url=external_url,
-                                    location=job_summary.get("locationsText"), 
-                                    city=None,
-                                    description=description, 
-                                    published_at=None, 
-                                    raw_data=job_posting_info
-                                )
+                                fallback_url = f"{url_parts.scheme or 'https'}://{host}/en-US/{site_id}{external_path}"
+                                return self._detail_payload(job_summary, detail_resp.json(), fallback_url)
                             else:
-                                logger.warning(f"Failed to fetch details for {title}: {detail_resp.status_code}")
+                                logger.warning("Failed to fetch details for {}: {}", title, detail_resp.status_code)
                                 return
                                 
                         except Exception as e:
-                            logger.warning(f"Skipping malformed Workday job '{title}': {e}")
+                            logger.warning("Skipping malformed Workday job '{}': {}", title, e)
                             return 
 
                     tasks = [fetch_job_detail(js) for js in job_postings]
-                    page_results = await asyncio.gather(*tasks)
+                    with tracing.span("detail fan-out", offset=offset, jobs=len(tasks)):
+                        page_results = await asyncio.gather(*tasks)
                     
-                    valid_jobs = [j for j in page_results if j is not None]
+                    with run_stats.parse_timer(), tracing.span("validate"):
+                        valid_jobs, rejected = validate_jobs([j for j in page_results if j is not None])
+                    for job_payload, error in rejected:
+                        logger.warning("Skipping malformed Workday job '{}': {}", job_payload.get('title'), error)
                     all_jobs.extend(valid_jobs)
 
                     offset += 20
                     
                     if offset >= total:
-                        logger.info(f"[{self.company_name}] Reached end of pagination (Offset {offset} >= Total {total}).")
+                        logger.debug("[{}] Reached end of pagination (Offset {} >= Total {}).", self.company_name, offset, total)
                         break
                         
-                    await asyncio.sleep(1)
+                    if self.pacing:
+                        await asyncio.sleep(1)
                     
+            except ContentNotModifiedError:
+                raise
             except httpx.HTTPStatusError as e:
                  if e.response.status_code == 403:
-                     logger.warning(f"Access denied (403) for {self.company_name}.")
+                     logger.warning("Access denied (403) for {}.", self.company_name)
                      raise FatalProviderError("Blocked by WAF/Cloudflare", provider="Workday")
                  raise RetryableProviderError(f"HTTP Error: {e}", provider="Workday")
             except Exception as e:
-                logger.error(f"Unexpected error scraping Workday: {e}")
+                logger.error("Unexpected error scraping Workday: {}", e)
                 raise ProviderError(f"Unexpected: {e}", provider="Workday")
 
-        logger.info(f"Successfully parsed {len(all_jobs)} jobs for {self.company_name}")
+        logger.debug("Successfully parsed {} jobs for {}", len(all_jobs), self.company_name)
         return all_jobs
+
+    def _detail_payload(self, job_summary: Dict[str, Any], detail_data: Dict[str, Any], fallback_url: str) -> Dict[str, Any]:
+        """
+        Unvalidated JobSchema fields for a detail document; pages are validated in one batch.
+        """
+        job_posting_info = detail_data.get("jobPostingInfo", {})
+
+        return {
+            "title": job_summary.get("title"),
+            "external_id": job_posting_info.get("jobReqId") or job_posting_info.get("id"),
+            "url": job_posting_info.get("externalUrl") or fallback_url,
+            "location": job_summary.get("locationsText"),
+            "city": None,
+            "description": job_posting_info.get("jobDescription"),
+            "published_at": None,
+            "raw_data": job_posting_info,
+        }
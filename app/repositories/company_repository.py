@@ -1,7 +1,7 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.company import Company, CompanyStatus, ATSProvider
@@ -19,6 +19,23 @@ async def get_by_name_and_provider(db: AsyncSession, name: str, ats_provider: Op
     result = await db.execute(query)
     return result.scalars().first()
 
+async def get_by_ids(db: AsyncSession, company_ids: Sequence[UUID]) -> List[Company]:
+    result = await db.execute(select(Company).where(Company.id.in_(company_ids)))
+    return result.scalars().all()
+
+async def get_identity_keys(
+    db: AsyncSession,
+    names: Sequence[str],
+    career_page_urls: Sequence[str],
+) -> List[Tuple[str, Optional[ATSProvider], Optional[str]]]:
+    """(name, ats_provider, career_page_url) of every company clashing with the given names or URLs, in one query."""
+    result = await db.execute(
+        select(Company.name, Company.ats_provider, Company.career_page_url).where(
+            or_(Company.name.in_(names), Company.career_page_url.in_(career_page_urls))
+        )
+    )
+    return [tuple(row) for row in result.all()]
+
 async def get_all(
     db: AsyncSession, 
     skip: int = 0, 
@@ -39,11 +56,34 @@ async def get_all(
     result = await db.execute(query)
     return result.scalars().all()
 
+async def get_ids(
+    db: AsyncSession,
+    status: Optional[CompanyStatus] = None,
+    ats_provider: Optional[ATSProvider] = None,
+    limit: Optional[int] = None,
+) -> List[UUID]:
+    query = select(Company.id)
+    if status:
+        query = query.where(Company.status == status)
+    if ats_provider:
+        query = query.where(Company.ats_provider == ats_provider)
+    if limit:
+        query = query.limit(limit)
+
+    result = await db.execute(query)
+    return [row[0] for row in result.all()]
+
 async def create(db: AsyncSession, company: Company) -> Company:
     db.add(company)
     await db.flush()
     return company
 
+async def create_many(db: AsyncSession, companies: List[Company], batch_size: int) -> List[Company]:
+    for start in range(0, len(companies), batch_size):
+        db.add_all(companies[start:start + batch_size])
+        await db.flush()
+    return companies
+
 async def update(db: AsyncSession, company: Company) -> Company:
     await db.flush()
     return company
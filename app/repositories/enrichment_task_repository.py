@@ -0,0 +1,53 @@
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import case, func, literal, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.enrichment_task import EnrichmentTask, EnrichmentTaskStatus
+
+
+async def get_by_id(db: AsyncSession, task_id: UUID) -> Optional[EnrichmentTask]:
+    result = await db.execute(select(EnrichmentTask).where(EnrichmentTask.id == task_id))
+    return result.scalars().first()
+
+async def get_unfinished(db: AsyncSession) -> List[EnrichmentTask]:
+    result = await db.execute(
+        select(EnrichmentTask).where(EnrichmentTask.status != EnrichmentTaskStatus.COMPLETED)
+    )
+    return result.scalars().all()
+
+async def create(db: AsyncSession, task: EnrichmentTask) -> EnrichmentTask:
+    db.add(task)
+    await db.flush()
+    return task
+
+async def mark_running(db: AsyncSession, task_id: UUID) -> None:
+    await db.execute(
+        update(EnrichmentTask)
+        .where(EnrichmentTask.id == task_id, EnrichmentTask.status == EnrichmentTaskStatus.PENDING)
+        .values(status=EnrichmentTaskStatus.RUNNING, started_at=func.now())
+    )
+
+async def record_result(db: AsyncSession, task_id: UUID, company_id: UUID, outcome: Dict[str, Any], success: bool) -> None:
+    """Atomically folds one company's outcome into the task counters, completing the task on the last one."""
+    processed = EnrichmentTask.processed + 1
+    await db.execute(
+        update(EnrichmentTask)
+        .where(EnrichmentTask.id == task_id)
+        .values(
+            processed=processed,
+            succeeded=EnrichmentTask.succeeded + (1 if success else 0),
+            failed=EnrichmentTask.failed + (0 if success else 1),
+            results=EnrichmentTask.results.op("||")(literal({str(company_id): outcome}, type_=JSONB)),
+            status=case(
+                (processed >= EnrichmentTask.total, literal(EnrichmentTaskStatus.COMPLETED, type_=EnrichmentTask.status.type)),
+                else_=EnrichmentTask.status,
+            ),
+            finished_at=case(
+                (processed >= EnrichmentTask.total, func.now()),
+                else_=EnrichmentTask.finished_at,
+            ),
+        )
+    )
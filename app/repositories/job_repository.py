@@ -1,10 +1,19 @@
-from typing import List, Optional, Set
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import String, any_, delete, insert, literal, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
-from app.models.job import Job, JobStatus
+from app.models.job import Job, JobSimhashBand, JobStatus, UserVerdict
+
+# Columns needed by list views; description HTML/text and raw_data are never loaded for lists
+LIST_COLUMNS = (
+    Job.id, Job.company_id, Job.title, Job.location, Job.city, Job.country_code, Job.latitude, Job.longitude,
+    Job.url, Job.status, Job.user_verdict, Job.published_at, Job.created_at, Job.description_snippet,
+    Job.duplicate_of_id, Job.relevance_score,
+)
 
 
 async def get_by_company(db: AsyncSession, company_id: UUID) -> List[Job]:
@@ -19,6 +28,79 @@ async def get_external_ids_by_company(db: AsyncSession, company_id: UUID) -> Set
     )
     return {row[0] for row in result.all()}
 
+async def get_by_id(db: AsyncSession, job_id: UUID) -> Optional[Job]:
+    result = await db.execute(select(Job).where(Job.id == job_id))
+    return result.scalars().first()
+
+async def get_by_ids(db: AsyncSession, job_ids: Sequence[UUID]) -> List[Job]:
+    result = await db.execute(select(Job).where(Job.id.in_(job_ids)))
+    return result.scalars().all()
+
+async def get_all(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    company_id: Optional[UUID] = None,
+    status: Optional[JobStatus] = None,
+    user_verdict: Optional[UserVerdict] = None,
+    q: Optional[str] = None,
+    dedupe: bool = False,
+    sort: str = "newest",
+    country_code: Optional[str] = None,
+    location_keys: Optional[Sequence[str]] = None,
+) -> List[Job]:
+    query = select(Job).options(load_only(*LIST_COLUMNS))
+    if dedupe:
+        query = query.where(Job.duplicate_of_id.is_(None))
+    if company_id:
+        query = query.where(Job.company_id == company_id)
+    if status:
+        query = query.where(Job.status == status)
+    if user_verdict:
+        query = query.where(Job.user_verdict == user_verdict)
+    if q:
+        query = query.where(or_(Job.title.ilike(f"%{q}%"), Job.description_text.ilike(f"%{q}%")))
+    if country_code:
+        query = query.where(Job.country_code == country_code.upper())
+    if location_keys is not None:
+        query = query.where(Job.location_key == any_(literal(list(location_keys), ARRAY(String))))
+
+    if sort == "relevance":
+        query = query.order_by(Job.relevance_score.desc().nulls_last(), Job.created_at.desc())
+    else:
+        query = query.order_by(Job.created_at.desc())
+
+    query = query.offset(skip).limit(limit)
+    result = await db.execute(query)
+    return result.scalars().all()
+
+async def get_description_hashes(db: AsyncSession, company_id: UUID) -> Dict[str, Optional[str]]:
+    """external_id -> description_hash for every job of the company."""
+    result = await db.execute(
+        select(Job.external_id, Job.description_hash).where(Job.company_id == company_id)
+    )
+    return {external_id: description_hash for external_id, description_hash in result.all()}
+
+async def get_descriptions_page(
+    db: AsyncSession,
+    after_id: Optional[UUID],
+    limit: int,
+    only_missing: bool = True,
+) -> List[Any]:
+    """(id, description) rows ordered by id, for keyset-paginated backfills."""
+    query = select(Job.id, Job.description).order_by(Job.id).limit(limit)
+    if after_id:
+        query = query.where(Job.id > after_id)
+    if only_missing:
+        query = query.where(Job.description_hash.is_(None))
+    result = await db.execute(query)
+    return result.all()
+
+async def update_many(db: AsyncSession, values: Sequence[Dict[str, Any]]) -> None:
+    """Bulk UPDATE by primary key; every dict must contain `id`."""
+    if values:
+        await db.execute(update(Job), list(values))
+
 async def get_by_external_id(db: AsyncSession, company_id: UUID, external_id: str) -> Optional[Job]:
     result = await db.execute(
         select(Job).where(
@@ -28,13 +110,31 @@ async def get_by_external_id(db: AsyncSession, company_id: UUID, external_id: st
     )
     return result.scalars().first()
 
+async def get_by_external_ids(db: AsyncSession, company_id: UUID, external_ids: Sequence[str]) -> Dict[str, Job]:
+    """A company's jobs by external id, in one query (ids sent as one array parameter)."""
+    if not external_ids:
+        return {}
+    result = await db.execute(
+        select(Job).where(
+            Job.company_id == company_id,
+            Job.external_id == any_(literal(list(external_ids), ARRAY(String))),
+        )
+    )
+    return {job.external_id: job for job in result.scalars().all()}
+
 async def create(db: AsyncSession, job: Job) -> Job:
     db.add(job)
     await db.flush()
     return job
 
-async def archive_missing(db: AsyncSession, company_id: UUID, active_external_ids: Set[str]) -> int:
-    """Mark jobs not in the latest scrape as ARCHIVED. Returns count of archived jobs."""
+async def create_many(db: AsyncSession, jobs: Sequence[Job]) -> List[Job]:
+    """Adds jobs in one flush, which batches their INSERTs."""
+    db.add_all(jobs)
+    await db.flush()
+    return list(jobs)
+
+async def archive_missing(db: AsyncSession, company_id: UUID, active_external_ids: Set[str]) -> List[UUID]:
+    """Mark jobs not in the latest scrape as ARCHIVED. Returns the ids of archived jobs."""
     result = await db.execute(
         update(Job)
         .where(
@@ -43,5 +143,108 @@ async def archive_missing(db: AsyncSession, company_id: UUID, active_external_id
             Job.status != JobStatus.ARCHIVED,
         )
         .values(status=JobStatus.ARCHIVED)
+        .returning(Job.id)
     )
-    return result.rowcount
+    return list(result.scalars().all())
+
+async def get_cluster(db: AsyncSession, canonical_id: UUID) -> List[Job]:
+    """The canonical job and every job flagged as its duplicate, oldest first."""
+    result = await db.execute(
+        select(Job)
+        .options(load_only(*LIST_COLUMNS))
+        .where(or_(Job.id == canonical_id, Job.duplicate_of_id == canonical_id))
+        .order_by(Job.created_at, Job.id)
+    )
+    return result.scalars().all()
+
+async def get_cluster_members(db: AsyncSession, canonical_ids: Sequence[UUID], exclude_ids: Sequence[UUID] = ()) -> List[Job]:
+    """Jobs flagged as duplicates of any of the given canonicals, with the columns needed to re-link them."""
+    query = (
+        select(Job)
+        .options(load_only(Job.id, Job.title, Job.description_text, Job.simhash, Job.duplicate_of_id))
+        .where(Job.duplicate_of_id.in_(canonical_ids))
+    )
+    if exclude_ids:
+        query = query.where(Job.id.notin_(exclude_ids))
+    result = await db.execute(query)
+    return result.scalars().all()
+
+async def get_unfingerprinted(db: AsyncSession, after_id: Optional[UUID], limit: int) -> List[Job]:
+    """Jobs with plain text but no SimHash, ordered by id, for keyset-paginated backfills."""
+    query = (
+        select(Job)
+        .options(load_only(Job.id, Job.title, Job.description_text, Job.simhash, Job.duplicate_of_id))
+        .where(Job.simhash.is_(None), Job.description_text.is_not(None))
+        .order_by(Job.id)
+        .limit(limit)
+    )
+    if after_id:
+        query = query.where(Job.id > after_id)
+    result = await db.execute(query)
+    return result.scalars().all()
+
+async def replace_simhash_bands(db: AsyncSession, job_ids: Sequence[UUID], rows: Sequence[Dict[str, Any]]) -> None:
+    await db.execute(delete(JobSimhashBand).where(JobSimhashBand.job_id.in_(job_ids)))
+    if rows:
+        await db.execute(insert(JobSimhashBand), list(rows))
+
+async def get_simhash_candidates(db: AsyncSession, band_values: Sequence[Tuple[int, int]]) -> List[Any]:
+    """
+    (id, simhash, duplicate_of_id, created_at, company_id, url, location, location_key)
+    of non-archived jobs sharing any (band, value).
+    """
+    if not band_values:
+        return []
+    result = await db.execute(
+        select(
+            Job.id, Job.simhash, Job.duplicate_of_id, Job.created_at,
+            Job.company_id, Job.url, Job.location, Job.location_key,
+        )
+        .join(JobSimhashBand, JobSimhashBand.job_id == Job.id)
+        .where(
+            tuple_(JobSimhashBand.band, JobSimhashBand.value).in_(list(band_values)),
+            Job.status != JobStatus.ARCHIVED,
+        )
+        .distinct()
+    )
+    return result.all()
+
+async def get_texts_page(
+    db: AsyncSession,
+    after_id: Optional[UUID],
+    limit: int,
+    status: Optional[JobStatus] = None,
+    exclude_status: Optional[JobStatus] = None,
+) -> List[Any]:
+    """(id, title, description_text) rows ordered by id, for keyset-paginated scoring and indexing."""
+    query = select(Job.id, Job.title, Job.description_text).order_by(Job.id).limit(limit)
+    if after_id:
+        query = query.where(Job.id > after_id)
+    if status:
+        query = query.where(Job.status == status)
+    if exclude_status:
+        query = query.where(Job.status != exclude_status)
+    result = await db.execute(query)
+    return result.all()
+
+async def get_locations_page(db: AsyncSession, after_id: Optional[UUID], limit: int) -> List[Any]:
+    """(id, location, city) rows ordered by id, for keyset-paginated location backfills."""
+    query = select(Job.id, Job.location, Job.city).order_by(Job.id).limit(limit)
+    if after_id:
+        query = query.where(Job.id > after_id)
+    result = await db.execute(query)
+    return result.all()
+
+async def get_labelled_page(db: AsyncSession, after_id: Optional[UUID], limit: int) -> List[Job]:
+    """Jobs with a user verdict, ordered by id, for keyset-paginated training."""
+    query = (
+        select(Job)
+        .options(load_only(Job.id, Job.title, Job.description_text, Job.user_verdict))
+        .where(Job.user_verdict.is_not(None))
+        .order_by(Job.id)
+        .limit(limit)
+    )
+    if after_id:
+        query = query.where(Job.id > after_id)
+    result = await db.execute(query)
+    return result.scalars().all()
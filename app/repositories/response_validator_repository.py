@@ -0,0 +1,36 @@
+from datetime import timedelta
+from typing import Any, Dict, List, Sequence
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.response_validator import ResponseValidator
+
+
+async def get_fresh(db: AsyncSession, company_id: UUID, max_age_seconds: int) -> List[ResponseValidator]:
+    """The company's validators fetched within the last `max_age_seconds`."""
+    result = await db.execute(
+        select(ResponseValidator).where(
+            ResponseValidator.company_id == company_id,
+            ResponseValidator.fetched_at > func.now() - timedelta(seconds=max_age_seconds),
+        )
+    )
+    return result.scalars().all()
+
+async def upsert_many(db: AsyncSession, company_id: UUID, rows: Sequence[Dict[str, Any]]) -> None:
+    """Stores (endpoint, etag, last_modified, body_digest) rows of a company in one statement."""
+    if not rows:
+        return
+    stmt = insert(ResponseValidator).values([{"company_id": company_id, **row} for row in rows])
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_response_validator_endpoint",
+        set_={
+            "etag": stmt.excluded.etag,
+            "last_modified": stmt.excluded.last_modified,
+            "body_digest": stmt.excluded.body_digest,
+            "fetched_at": func.now(),
+        },
+    )
+    await db.execute(stmt)
@@ -0,0 +1,84 @@
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import String, any_, func, literal, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, load_only
+
+from app.models.saved_search import SavedSearch, SearchNotification
+from app.repositories.job_repository import LIST_COLUMNS
+
+
+async def get_by_id(db: AsyncSession, saved_search_id: UUID) -> Optional[SavedSearch]:
+    result = await db.execute(select(SavedSearch).where(SavedSearch.id == saved_search_id))
+    return result.scalars().first()
+
+async def get_by_user(db: AsyncSession, user_id: str) -> List[SavedSearch]:
+    result = await db.execute(
+        select(SavedSearch).where(SavedSearch.user_id == user_id).order_by(SavedSearch.created_at)
+    )
+    return result.scalars().all()
+
+async def get_by_anchors(db: AsyncSession, anchors: Sequence[str]) -> List[SavedSearch]:
+    """Saved searches anchored on any of the given keys (sent as one array parameter)."""
+    if not anchors:
+        return []
+    result = await db.execute(
+        select(SavedSearch).where(SavedSearch.anchor == any_(literal(list(anchors), ARRAY(String))))
+    )
+    return result.scalars().all()
+
+async def get_with_city(db: AsyncSession) -> List[SavedSearch]:
+    result = await db.execute(select(SavedSearch).where(SavedSearch.city.is_not(None)))
+    return result.scalars().all()
+
+async def create(db: AsyncSession, saved_search: SavedSearch) -> SavedSearch:
+    db.add(saved_search)
+    await db.flush()
+    return saved_search
+
+async def delete(db: AsyncSession, saved_search: SavedSearch) -> None:
+    await db.delete(saved_search)
+    await db.flush()
+
+async def add_notifications(db: AsyncSession, rows: Sequence[Dict[str, Any]]) -> int:
+    """Inserts (user_id, saved_search_id, job_id) rows, skipping already-notified pairs. Returns the number added."""
+    added = 0
+    # Multi-row VALUES, chunked to stay under the driver's bind-parameter limit
+    for start in range(0, len(rows), 1000):
+        result = await db.execute(
+            pg_insert(SearchNotification)
+            .values(list(rows[start:start + 1000]))
+            .on_conflict_do_nothing(constraint="uq_search_notification_job")
+            .returning(SearchNotification.id)
+        )
+        added += len(result.all())
+    return added
+
+async def get_pending_notifications(db: AsyncSession, user_id: str, limit: int) -> List[SearchNotification]:
+    """The user's undelivered notifications, oldest first, with list columns of the job."""
+    result = await db.execute(
+        select(SearchNotification)
+        .options(joinedload(SearchNotification.job).options(load_only(*LIST_COLUMNS)))
+        .where(SearchNotification.user_id == user_id, SearchNotification.delivered_at.is_(None))
+        .order_by(SearchNotification.id)
+        .limit(limit)
+    )
+    return result.scalars().all()
+
+async def mark_delivered(db: AsyncSession, user_id: str, notification_ids: Sequence[int]) -> int:
+    """Marks the given undelivered notifications of the user as delivered. Returns how many were marked."""
+    if not notification_ids:
+        return 0
+    result = await db.execute(
+        update(SearchNotification)
+        .where(
+            SearchNotification.user_id == user_id,
+            SearchNotification.id.in_(list(notification_ids)),
+            SearchNotification.delivered_at.is_(None),
+        )
+        .values(delivered_at=func.now())
+        .returning(SearchNotification.id)
+    )
+    return len(result.all())
@@ -0,0 +1,136 @@
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.company import ATSProvider, Company
+from app.models.scrape_run import ScrapeRun
+
+# Summed per group and bucket by get_trends
+_TOTALS = (
+    "http_requests", "bytes_downloaded", "pages", "db_statements", "jobs_parsed",
+    "new_count", "updated_count", "changed_count", "archived_count",
+)
+
+
+async def create(db: AsyncSession, run: ScrapeRun) -> ScrapeRun:
+    db.add(run)
+    await db.flush()
+    return run
+
+async def get_recent(
+    db: AsyncSession,
+    limit: int = 100,
+    company_id: Optional[UUID] = None,
+    provider: Optional[ATSProvider] = None,
+    failed_only: bool = False,
+) -> List[ScrapeRun]:
+    query = select(ScrapeRun)
+    if company_id:
+        query = query.where(ScrapeRun.company_id == company_id)
+    if provider:
+        query = query.where(ScrapeRun.provider == provider)
+    if failed_only:
+        query = query.where(ScrapeRun.error_class.is_not(None))
+
+    result = await db.execute(query.order_by(ScrapeRun.started_at.desc()).limit(limit))
+    return result.scalars().all()
+
+async def get_last_applied(db: AsyncSession, company_id: UUID) -> Optional[ScrapeRun]:
+    """The company's newest run whose jobs were applied (succeeded and was not short-circuited as unmodified)."""
+    result = await db.execute(
+        select(ScrapeRun)
+        .where(
+            ScrapeRun.company_id == company_id,
+            ScrapeRun.error_class.is_(None),
+            ScrapeRun.not_modified.is_(False),
+        )
+        .order_by(ScrapeRun.started_at.desc())
+        .limit(1)
+    )
+    return result.scalars().first()
+
+async def get_trends(
+    db: AsyncSession,
+    group_by: str,
+    days: int,
+    bucket: str = "day",
+    company_id: Optional[UUID] = None,
+    provider: Optional[ATSProvider] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run counts, failures, summed volumes and mean timings per (company or provider, bucket)
+    over the last `days`, aggregated in the database.
+    """
+    group_column = ScrapeRun.company_id if group_by == "company" else ScrapeRun.provider
+    period = func.date_trunc(bucket, ScrapeRun.started_at).label("period")
+
+    query = (
+        select(
+            group_column.label("key"),
+            period,
+            func.count().label("runs"),
+            func.sum(case((ScrapeRun.error_class.is_not(None), 1), else_=0)).label("failures"),
+            func.sum(case((ScrapeRun.not_modified, 1), else_=0)).label("not_modified"),
+            func.avg(ScrapeRun.duration_seconds).label("avg_duration_seconds"),
+            func.avg(ScrapeRun.parse_seconds).label("avg_parse_seconds"),
+            func.avg(ScrapeRun.db_seconds).label("avg_db_seconds"),
+            func.avg(ScrapeRun.memory_peak_bytes).label("avg_memory_peak_bytes"),
+            func.max(ScrapeRun.memory_peak_bytes).label("max_memory_peak_bytes"),
+            *(func.sum(getattr(ScrapeRun, column)).label(column) for column in _TOTALS),
+        )
+        .where(ScrapeRun.started_at >= func.now() - timedelta(days=days))
+        .group_by(group_column, period)
+        .order_by(group_column, period)
+    )
+    if company_id:
+        query = query.where(ScrapeRun.company_id == company_id)
+    if provider:
+        query = query.where(ScrapeRun.provider == provider)
+
+    result = await db.execute(query)
+    return [dict(row._mapping) for row in result.all()]
+
+async def get_cost_growth(db: AsyncSession, days: int, limit: int) -> List[Dict[str, Any]]:
+    """
+    Per company, mean requests, bytes and duration per run in the last `days` against the
+    `days` before them, ordered by growth in bytes per run. Companies without runs in
+    both windows are left out.
+    """
+    now = func.now()
+    recent = ScrapeRun.started_at >= now - timedelta(days=days)
+
+    def window_avg(column, is_recent: bool):
+        return func.avg(case((recent if is_recent else ~recent, column)))
+
+    recent_bytes = window_avg(ScrapeRun.bytes_downloaded, True)
+    previous_bytes = window_avg(ScrapeRun.bytes_downloaded, False)
+    growth = (recent_bytes / func.nullif(previous_bytes, 0)).label("bytes_growth")
+    recent_runs = func.sum(case((recent, 1), else_=0))
+    previous_runs = func.sum(case((recent, 0), else_=1))
+
+    result = await db.execute(
+        select(
+            ScrapeRun.company_id,
+            Company.name.label("company_name"),
+            Company.ats_provider.label("provider"),
+            recent_runs.label("recent_runs"),
+            previous_runs.label("previous_runs"),
+            window_avg(ScrapeRun.http_requests, True).label("recent_avg_requests"),
+            window_avg(ScrapeRun.http_requests, False).label("previous_avg_requests"),
+            recent_bytes.label("recent_avg_bytes"),
+            previous_bytes.label("previous_avg_bytes"),
+            window_avg(ScrapeRun.duration_seconds, True).label("recent_avg_duration_seconds"),
+            window_avg(ScrapeRun.duration_seconds, False).label("previous_avg_duration_seconds"),
+            growth,
+        )
+        .join(Company, Company.id == ScrapeRun.company_id)
+        .where(ScrapeRun.started_at >= now - timedelta(days=2 * days))
+        .group_by(ScrapeRun.company_id, Company.name, Company.ats_provider)
+        .having(recent_runs > 0, previous_runs > 0)
+        .order_by(growth.desc().nulls_last())
+        .limit(limit)
+    )
+    return [dict(row._mapping) for row in result.all()]
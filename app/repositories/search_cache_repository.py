@@ -0,0 +1,29 @@
+from datetime import timedelta
+from typing import List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.search_result import CachedSearchResult
+
+
+async def get_fresh(db: AsyncSession, query: str, company_name: str, max_age_seconds: int) -> Optional[List[str]]:
+    """Returns cached hrefs for the query, or None if missing or older than `max_age_seconds`."""
+    result = await db.execute(
+        select(CachedSearchResult.hrefs).where(
+            CachedSearchResult.query == query,
+            CachedSearchResult.company_name == company_name,
+            CachedSearchResult.fetched_at > func.now() - timedelta(seconds=max_age_seconds),
+        )
+    )
+    row = result.first()
+    return row[0] if row else None
+
+async def upsert(db: AsyncSession, query: str, company_name: str, hrefs: List[str]) -> None:
+    stmt = insert(CachedSearchResult).values(query=query, company_name=company_name, hrefs=hrefs)
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_search_query_company",
+        set_={"hrefs": stmt.excluded.hrefs, "fetched_at": func.now()},
+    )
+    await db.execute(stmt)
@@ -1,6 +1,6 @@
 from datetime import datetime
 from uuid import UUID
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Literal, Optional
 from pydantic import BaseModel, field_validator
 
 from app.models.company import ATSProvider, CompanyStatus
@@ -18,6 +18,8 @@ class CompanyBase(BaseModel):
     def status_not_error(cls, v):
         if v == CompanyStatus.ERROR:
             raise ValueError("ERROR is a system-managed status. Use INACTIVE to pause scraping.")
+        if v == CompanyStatus.PENDING_VALIDATION:
+            raise ValueError("PENDING_VALIDATION is a system-managed status.")
         return v
 
 class CompanyCreate(CompanyBase):
@@ -38,5 +40,28 @@ class CompanyResponse(CompanyBase):
     created_at: datetime
     updated_at: datetime
 
+    @field_validator("status")
+    @classmethod
+    def status_not_error(cls, v):
+        # Responses carry system-managed statuses (ERROR, PENDING_VALIDATION) as-is
+        return v
+
     class Config:
         from_attributes = True
+
+
+class CompanyImportRowResult(BaseModel):
+    row: int
+    name: Optional[str] = None
+    result: Literal["created", "duplicate", "invalid"]
+    company_id: Optional[UUID] = None
+    status: Optional[CompanyStatus] = None
+    error: Optional[str] = None
+
+class CompanyImportReport(BaseModel):
+    total: int
+    created: int
+    duplicates: int
+    invalid: int
+    pending_validation: int
+    rows: List[CompanyImportRowResult]
@@ -0,0 +1,28 @@
+from datetime import datetime
+from uuid import UUID
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field
+
+from app.models.company import ATSProvider, CompanyStatus
+from app.models.enrichment_task import EnrichmentTaskStatus
+
+class EnrichmentBulkRequest(BaseModel):
+    company_ids: Optional[List[UUID]] = None
+    status: Optional[CompanyStatus] = CompanyStatus.UNCONFIGURED
+    ats_provider: Optional[ATSProvider] = None
+    limit: int = Field(default=500, ge=1, le=10000)
+
+class EnrichmentTaskResponse(BaseModel):
+    id: UUID
+    status: EnrichmentTaskStatus
+    total: int
+    processed: int
+    succeeded: int
+    failed: int
+    results: Dict[str, Any] = {}
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
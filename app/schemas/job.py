@@ -1,22 +1,94 @@
-from pydantic import field_validator
+from pydantic import Field, SkipValidation, TypeAdapter, ValidationError, field_validator
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
 
 from pydantic import BaseModel
 
+from app.models.job import JobStatus, UserVerdict
+
 class JobSchema(BaseModel):
-    title: str
-    external_id: str
-    url: str
+    title: str = Field(min_length=1)
+    external_id: str = Field(min_length=1)
+    url: str = Field(min_length=1)
     location: str | None = None
     city: str | None = None
     published_at: datetime | None = None
     description: str | None = None
-    raw_data: Dict[str, Any]
+    # The provider document is stored as-is; parsers always pass the decoded JSON object
+    raw_data: SkipValidation[Dict[str, Any]]
 
-    @field_validator('*', mode='before')
+    # Derived at ingest by the scrape pipeline, not by the providers
+    description_text: str | None = None
+    description_snippet: str | None = None
+    description_hash: str | None = None
+    country_code: str | None = None
+    latitude: float | None = None
+    longitude: float | None = None
+    location_key: str | None = None
+
+    @field_validator('location', 'city', 'published_at', 'description', mode='before')
     @classmethod
     def empty_string_to_none(cls, v):
         if v == "":
             return None
-        return v
\ No newline at end of file
+        return v
+
+
+_job_list_adapter = TypeAdapter(List[JobSchema])
+
+
+def validate_jobs(payloads: List[Dict[str, Any]]) -> Tuple[List[JobSchema], List[Tuple[Dict[str, Any], str]]]:
+    """
+    Validates a page of job payloads in a single call.
+    Returns the valid jobs (in input order) and the rejected payloads with their error.
+    """
+    try:
+        return _job_list_adapter.validate_python(payloads), []
+    except ValidationError as e:
+        errors: Dict[int, str] = {}
+        for error in e.errors():
+            index, *field = error["loc"]
+            errors.setdefault(index, f"{'.'.join(map(str, field))}: {error['msg']}" if field else error["msg"])
+
+    valid = [payload for index, payload in enumerate(payloads) if index not in errors]
+    rejected = [(payloads[index], message) for index, message in sorted(errors.items())]
+    return _job_list_adapter.validate_python(valid), rejected
+
+
+class JobListItem(BaseModel):
+    """List view row; reads only precomputed fields (no description HTML or raw data)."""
+    id: UUID
+    company_id: UUID
+    title: str
+    location: Optional[str] = None
+    city: Optional[str] = None
+    country_code: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    url: str
+    status: JobStatus
+    user_verdict: Optional[UserVerdict] = None
+    published_at: Optional[datetime] = None
+    created_at: datetime
+    description_snippet: Optional[str] = None
+    duplicate_of_id: Optional[UUID] = None
+    relevance_score: Optional[float] = None
+
+    class Config:
+        from_attributes = True
+
+class SimilarJob(JobListItem):
+    similarity: float
+
+class JobResponse(JobListItem):
+    description: Optional[str] = None
+    description_text: Optional[str] = None
+    last_scanned_at: Optional[datetime] = None
+
+class JobVerdictUpdate(BaseModel):
+    job_id: UUID
+    user_verdict: Optional[UserVerdict] = None
+
+class JobVerdictBatch(BaseModel):
+    verdicts: List[JobVerdictUpdate] = Field(min_length=1, max_length=1000)
@@ -0,0 +1,15 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+class ProfileInfo(BaseModel):
+    id: str
+    kind: str
+    run_id: UUID
+    name: str
+    started_at: datetime
+    wall_seconds: float
+    samples: int
+    # Samples where the task was suspended (network, DB, executors) rather than running
+    waiting_samples: int
@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field, field_validator
+
+from app.schemas.job import JobListItem
+
+class SavedSearchCreate(BaseModel):
+    user_id: str = Field(min_length=1, max_length=255)
+    name: str = Field(min_length=1)
+    keywords: List[str] = []
+    title_only: bool = False
+    city: Optional[str] = None
+    company_id: Optional[UUID] = None
+    active_companies_only: bool = True
+
+    @field_validator("keywords")
+    @classmethod
+    def strip_keywords(cls, v):
+        return [keyword.strip() for keyword in v if keyword.strip()]
+
+class SavedSearchResponse(SavedSearchCreate):
+    id: UUID
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class NotificationResponse(BaseModel):
+    id: int
+    saved_search_id: UUID
+    created_at: datetime
+    job: JobListItem
+
+    class Config:
+        from_attributes = True
+
+class NotificationAck(BaseModel):
+    user_id: str = Field(min_length=1, max_length=255)
+    notification_ids: List[int] = Field(min_length=1, max_length=1000)
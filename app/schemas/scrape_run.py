@@ -0,0 +1,73 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.models.company import ATSProvider
+
+class ScrapeRunResponse(BaseModel):
+    id: UUID
+    company_id: UUID
+    provider: ATSProvider
+    started_at: datetime
+    finished_at: datetime
+    duration_seconds: float
+    http_requests: int
+    bytes_downloaded: int
+    pages: int
+    parse_seconds: float
+    db_statements: int
+    db_seconds: float
+    jobs_parsed: int
+    new_count: int
+    updated_count: int
+    changed_count: int
+    archived_count: int
+    not_modified: bool = False
+    error_class: Optional[str] = None
+    memory_peak_bytes: Optional[int] = None
+    memory_top_allocations: Optional[List[Dict[str, Any]]] = None
+    memory_retained_objects: Optional[Dict[str, int]] = None
+
+    class Config:
+        from_attributes = True
+
+class ScrapeRunTrend(BaseModel):
+    """Aggregated runs of one company or provider (`key`) in one period."""
+    key: Union[UUID, ATSProvider]
+    period: datetime
+    runs: int
+    failures: int
+    # Runs that found their company's list responses unchanged
+    not_modified: int = 0
+    avg_duration_seconds: float
+    avg_parse_seconds: float
+    avg_db_seconds: float
+    http_requests: int
+    bytes_downloaded: int
+    pages: int
+    db_statements: int
+    jobs_parsed: int
+    new_count: int
+    updated_count: int
+    changed_count: int
+    archived_count: int
+    # Over memory-instrumented runs only
+    avg_memory_peak_bytes: Optional[float] = None
+    max_memory_peak_bytes: Optional[int] = None
+
+class CompanyCostGrowth(BaseModel):
+    """Mean per-run cost of a company in the recent window against the window before it."""
+    company_id: UUID
+    company_name: str
+    provider: Optional[ATSProvider] = None
+    recent_runs: int
+    previous_runs: int
+    recent_avg_requests: float
+    previous_avg_requests: float
+    recent_avg_bytes: float
+    previous_avg_bytes: float
+    recent_avg_duration_seconds: float
+    previous_avg_duration_seconds: float
+    bytes_growth: Optional[float] = None
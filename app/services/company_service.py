@@ -1,25 +1,141 @@
-from typing import List, Optional
+import asyncio
+import csv
+import io
+import json
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
+from fastapi import BackgroundTasks
 from loguru import logger
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.exceptions import CompanyAlreadyExistsError, CompanyNotFoundError, CompanyValidationError
+from app.db.session import AsyncSessionLocal
 from app.models.company import Company, CompanyStatus, ATSProvider
 from app.repositories import company_repository as company_repo
-from app.schemas.company import CompanyCreate, CompanyUpdate
+from app.schemas.company import (
+    CompanyCreate,
+    CompanyImportReport,
+    CompanyImportRowResult,
+    CompanyUpdate,
+)
 from app.providers.scrapers.factory import ScraperFactory
+from app.providers.scrapers.validation_cache import config_fingerprint
 
 
-async def _check_config_validity(ats_provider: Optional[ATSProvider], metadata_config: Optional[dict]) -> bool:
-    """Safely checks config validity. Returns False on any error (e.g. provider is down)."""
+async def _check_config_validity(ats_provider: Optional[ATSProvider], metadata_config: Optional[dict]) -> Optional[bool]:
+    """
+    Safely checks config validity. Returns None when the check itself errored
+    (e.g. provider is down), so that no verdict is stored for the config.
+    """
     if not ats_provider or not metadata_config:
         return False
     try:
-        return await ScraperFactory.validate_provider_config(ats_provider, metadata_config)
+        return await ScraperFactory.validate_provider_config(ats_provider, metadata_config, raise_errors=True)
     except Exception as e:
-        logger.warning(f"Config validation failed for {ats_provider}: {e}")
+        logger.warning("Config validation failed for {}: {}", ats_provider, e)
+        return None
+
+
+def _has_verdict(company: Company, fingerprint: str, requested_status: Optional[CompanyStatus]) -> bool:
+    """A stored verdict applies to the current config; a request for ACTIVE only trusts a valid one."""
+    if fingerprint != company.config_fingerprint or company.is_config_valid is None:
         return False
+    return company.is_config_valid or requested_status != CompanyStatus.ACTIVE
+
+
+async def _apply_config_validity(
+    company: Company,
+    requested_status: Optional[CompanyStatus],
+    defer: bool,
+) -> bool:
+    """
+    Resolves the company status for its current config.
+    Unchanged configs reuse the stored result, except an invalid one when ACTIVE is requested;
+    incomplete configs are resolved locally.
+    Anything that needs a provider round trip is either checked inline or, when `defer`
+    is set, marked PENDING_VALIDATION. Returns whether it was deferred.
+    A write to a company that is still pending resolves from the status it had before
+    the first pending write, and keeps that write's requested status unless it requests another.
+    A check that errored stores no verdict, so the next write validates again.
+    """
+    fingerprint = config_fingerprint(company.ats_provider, company.metadata_config)
+
+    if _has_verdict(company, fingerprint, requested_status):
+        company.status = await _resolve_status(company.status, requested_status, company.is_config_valid)
+        return False
+
+    base_status = company.status
+    if company.status == CompanyStatus.PENDING_VALIDATION:
+        base_status = company.pending_base_status or CompanyStatus.UNCONFIGURED
+        requested_status = requested_status or company.pending_requested_status
+
+    if defer and company.ats_provider and company.metadata_config:
+        if requested_status == CompanyStatus.ERROR:
+            raise CompanyValidationError("ERROR is a system-managed status. Use INACTIVE to pause scraping.")
+        company.config_fingerprint = fingerprint
+        company.is_config_valid = None
+        company.status = CompanyStatus.PENDING_VALIDATION
+        company.pending_base_status = base_status
+        company.pending_requested_status = requested_status
+        return True
+
+    is_valid = await _check_config_validity(company.ats_provider, company.metadata_config)
+    if is_valid is None and requested_status in [CompanyStatus.ACTIVE, CompanyStatus.INACTIVE]:
+        raise CompanyValidationError("Configuration could not be validated, the provider is unavailable. Try again later.")
+    company.config_fingerprint = fingerprint
+    company.is_config_valid = is_valid
+    company.status = await _resolve_status(base_status, requested_status, bool(is_valid))
+    company.pending_base_status = company.pending_requested_status = None
+    return False
+
+
+async def _schedule_validation(db: AsyncSession, background_tasks: BackgroundTasks, company: Company) -> None:
+    # The background task uses its own session, so the pending row must be visible to it
+    await db.commit()
+    background_tasks.add_task(validate_company_config, company.id, company.config_fingerprint)
+
+
+def _is_stale(company: Optional[Company], fingerprint: str) -> bool:
+    """The config changed again, or another validation of it already resolved the status."""
+    return not company or company.config_fingerprint != fingerprint or company.status != CompanyStatus.PENDING_VALIDATION
+
+
+async def validate_company_config(company_id: UUID, fingerprint: str) -> None:
+    """
+    Background half of a deferred write: validates the config against the provider
+    and resolves the final status from the pending one stored on the company.
+    Skipped if the config changed again in the meantime.
+    """
+    async with AsyncSessionLocal() as db:
+        company = await company_repo.get_by_id(db, company_id)
+        if _is_stale(company, fingerprint):
+            logger.debug("Skipping stale config validation for company {}", company_id)
+            return
+
+        is_valid = await _check_config_validity(company.ats_provider, company.metadata_config)
+        await _finish_validation(company, is_valid)
+        await company_repo.update(db, company)
+        await db.commit()
+
+
+async def _finish_validation(company: Company, is_valid: Optional[bool]) -> None:
+    """Resolves a pending company; an errored check (None) resolves as invalid but is not stored as a verdict."""
+    base_status = company.pending_base_status or CompanyStatus.UNCONFIGURED
+    requested_status = company.pending_requested_status
+    try:
+        status = await _resolve_status(base_status, requested_status, bool(is_valid))
+    except CompanyValidationError as e:
+        logger.warning("{}: requested status {} rejected: {}", company.name, requested_status, e)
+        status = await _resolve_status(base_status, None, bool(is_valid))
+
+    company.is_config_valid = is_valid
+    company.status = status
+    company.pending_base_status = company.pending_requested_status = None
+    logger.info("{}: config validated (valid={}), status is {}", company.name, is_valid, status)
 
 
 async def _resolve_status(
@@ -33,6 +149,10 @@ async def _resolve_status(
     """
     if requested_status == CompanyStatus.ERROR:
         raise CompanyValidationError("ERROR is a system-managed status. Use INACTIVE to pause scraping.")
+    if requested_status == CompanyStatus.PENDING_VALIDATION:
+        raise CompanyValidationError("PENDING_VALIDATION is a system-managed status.")
+    if current_status == CompanyStatus.PENDING_VALIDATION:
+        current_status = CompanyStatus.UNCONFIGURED
 
     if is_valid_config:
         if requested_status == CompanyStatus.ACTIVE:
@@ -76,26 +196,45 @@ async def get_company_by_id(db: AsyncSession, company_id: UUID) -> Company:
     return company
 
 
-async def create_company(db: AsyncSession, company_in: CompanyCreate) -> Company:
+async def create_company(
+    db: AsyncSession,
+    company_in: CompanyCreate,
+    background_tasks: Optional[BackgroundTasks] = None,
+) -> Company:
+    """
+    Creates a company. With `background_tasks`, provider validation runs after the
+    response and the company is returned as PENDING_VALIDATION; otherwise it runs inline.
+    """
     existing = await company_repo.get_by_name_and_provider(db, company_in.name, company_in.ats_provider)
     if existing:
         raise CompanyAlreadyExistsError(f"Company '{company_in.name}' with ATS '{company_in.ats_provider}' already exists")
 
-    is_valid = await _check_config_validity(company_in.ats_provider, company_in.metadata_config)
-    final_status = await _resolve_status(CompanyStatus.UNCONFIGURED, company_in.status, is_valid)
-    
     db_company = Company(
         name=company_in.name,
         career_page_url=company_in.career_page_url,
         ats_provider=company_in.ats_provider,
         metadata_config=company_in.metadata_config,
         logo_url=company_in.logo_url,
-        status=final_status,
+        status=CompanyStatus.UNCONFIGURED,
     )
-    return await company_repo.create(db, db_company)
+    deferred = await _apply_config_validity(db_company, company_in.status, defer=background_tasks is not None)
+    db_company = await company_repo.create(db, db_company)
+
+    if deferred:
+        await _schedule_validation(db, background_tasks, db_company)
+    return db_company
 
 
-async def update_company(db: AsyncSession, company_id: UUID, company_in: CompanyUpdate) -> Company:
+async def update_company(
+    db: AsyncSession,
+    company_id: UUID,
+    company_in: CompanyUpdate,
+    background_tasks: Optional[BackgroundTasks] = None,
+) -> Company:
+    """
+    Updates a company. Provider validation only runs when the (ats_provider, metadata_config)
+    pair changed, and is deferred to the background when `background_tasks` is given.
+    """
     company = await get_company_by_id(db, company_id)
 
     if company_in.name is not None:
@@ -109,13 +248,209 @@ async def update_company(db: AsyncSession, company_id: UUID, company_in: Company
     if company_in.logo_url is not None:
         company.logo_url = company_in.logo_url
 
-    is_valid = await _check_config_validity(company.ats_provider, company.metadata_config)
-    company.status = await _resolve_status(company.status, company_in.status, is_valid)
+    deferred = await _apply_config_validity(company, company_in.status, defer=background_tasks is not None)
+    company = await company_repo.update(db, company)
 
-    return await company_repo.update(db, company)
+    if deferred:
+        await _schedule_validation(db, background_tasks, company)
+    return company
 
 
 async def delete_company(db: AsyncSession, company_id: UUID) -> None:
     company = await get_company_by_id(db, company_id)
     await company_repo.delete(db, company)
 
+
+# (company_id, config_fingerprint) of a company awaiting validation
+PendingValidation = Tuple[UUID, str]
+
+JSONL_MEDIA_TYPES = {"application/x-ndjson", "application/jsonl", "application/x-jsonlines", "application/ndjson"}
+CSV_MEDIA_TYPES = {"text/csv", "application/csv"}
+
+
+def parse_import_rows(content_type: str, body: bytes) -> List[Dict[str, Any]]:
+    """
+    Parses a bulk import body into raw rows based on its Content-Type:
+    a JSON array, JSONL (one object per line) or CSV with a header row.
+    CSV config goes either in a JSON `metadata_config` column or in `metadata_config.<key>` columns.
+    """
+    media_type = content_type.split(";")[0].strip().lower()
+    try:
+        text = body.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise CompanyValidationError("Import body must be UTF-8 encoded.")
+
+    if media_type in CSV_MEDIA_TYPES:
+        rows = [_parse_csv_row(raw) for raw in csv.DictReader(io.StringIO(text))]
+    elif media_type in JSONL_MEDIA_TYPES:
+        rows = []
+        for line_no, line in enumerate(text.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                rows.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                raise CompanyValidationError(f"Invalid JSON on line {line_no}: {e}")
+    elif media_type == "application/json":
+        try:
+            rows = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise CompanyValidationError(f"Invalid JSON: {e}")
+        if not isinstance(rows, list):
+            raise CompanyValidationError("JSON import body must be an array of companies.")
+    else:
+        raise CompanyValidationError(f"Unsupported import format '{media_type}'. Use JSON, JSONL or CSV.")
+
+    if len(rows) > settings.COMPANY_IMPORT_MAX_ROWS:
+        raise CompanyValidationError(f"Import is limited to {settings.COMPANY_IMPORT_MAX_ROWS} rows, got {len(rows)}.")
+    return rows
+
+
+def _parse_csv_row(raw: Dict[str, Optional[str]]) -> Dict[str, Any]:
+    row: Dict[str, Any] = {}
+    config: Dict[str, Any] = {}
+    for key, value in raw.items():
+        if not key or value is None or not value.strip():
+            continue
+        key, value = key.strip(), value.strip()
+        if key.startswith("metadata_config."):
+            config[key.removeprefix("metadata_config.")] = value
+        elif key == "metadata_config":
+            try:
+                row[key] = json.loads(value)
+            except json.JSONDecodeError:
+                row[key] = value  # left for schema validation to report on the row
+        else:
+            row[key] = value
+
+    if config:
+        row["metadata_config"] = {**config, **(row.get("metadata_config") or {})}
+    return row
+
+
+async def import_companies(
+    db: AsyncSession,
+    rows: List[Dict[str, Any]],
+    background_tasks: Optional[BackgroundTasks] = None,
+) -> CompanyImportReport:
+    """
+    Bulk-creates companies and reports the outcome of every row.
+    Duplicates are detected against the payload itself and the table (in one query),
+    rows are inserted in batches, and provider configs are validated concurrently
+    afterwards, in the background when `background_tasks` is given.
+    """
+    results: List[Optional[CompanyImportRowResult]] = [None] * len(rows)
+    candidates: List[Tuple[int, CompanyCreate]] = []
+
+    for index, raw in enumerate(rows):
+        try:
+            candidates.append((index, CompanyCreate.model_validate(raw)))
+        except ValidationError as e:
+            error = ", ".join(f"{err['loc'][-1] if err['loc'] else 'row'}: {err['msg']}" for err in e.errors())
+            name = raw.get("name") if isinstance(raw, dict) else None
+            results[index] = CompanyImportRowResult(row=index, name=name if isinstance(name, str) else None, result="invalid", error=error)
+
+    existing = await company_repo.get_identity_keys(
+        db,
+        names=list({company_in.name for _, company_in in candidates}),
+        career_page_urls=list({company_in.career_page_url for _, company_in in candidates if company_in.career_page_url}),
+    )
+    taken_names = {name for name, _, _ in existing}
+    taken_pairs = {(name, provider) for name, provider, _ in existing}
+    taken_urls = {url for _, _, url in existing if url}
+
+    to_create: List[Tuple[int, Company, bool]] = []
+    for index, company_in in candidates:
+        duplicate_error = None
+        if company_in.ats_provider is None and company_in.name in taken_names:
+            duplicate_error = f"Company '{company_in.name}' already exists"
+        elif (company_in.name, company_in.ats_provider) in taken_pairs:
+            duplicate_error = f"Company '{company_in.name}' with ATS '{company_in.ats_provider}' already exists"
+        elif company_in.career_page_url and company_in.career_page_url in taken_urls:
+            duplicate_error = f"Career page '{company_in.career_page_url}' is already used"
+
+        if duplicate_error:
+            results[index] = CompanyImportRowResult(row=index, name=company_in.name, result="duplicate", error=duplicate_error)
+            continue
+
+        company = Company(
+            name=company_in.name,
+            career_page_url=company_in.career_page_url,
+            ats_provider=company_in.ats_provider,
+            metadata_config=company_in.metadata_config,
+            logo_url=company_in.logo_url,
+            status=CompanyStatus.UNCONFIGURED,
+        )
+        try:
+            deferred = await _apply_config_validity(company, company_in.status, defer=True)
+        except CompanyValidationError as e:
+            results[index] = CompanyImportRowResult(row=index, name=company_in.name, result="invalid", error=str(e))
+            continue
+
+        taken_names.add(company_in.name)
+        taken_pairs.add((company_in.name, company_in.ats_provider))
+        if company_in.career_page_url:
+            taken_urls.add(company_in.career_page_url)
+        to_create.append((index, company, deferred))
+
+    await company_repo.create_many(db, [company for _, company, _ in to_create], settings.COMPANY_IMPORT_BATCH_SIZE)
+
+    pending: List[PendingValidation] = []
+    for index, company, deferred in to_create:
+        results[index] = CompanyImportRowResult(
+            row=index, name=company.name, result="created", company_id=company.id, status=company.status
+        )
+        if deferred:
+            pending.append((company.id, company.config_fingerprint))
+
+    logger.info("Imported {} of {} companies, {} pending validation", len(to_create), len(rows), len(pending))
+
+    if pending:
+        # Validation uses its own sessions, so the new rows must be visible to it
+        await db.commit()
+        if background_tasks is not None:
+            background_tasks.add_task(validate_company_configs, pending)
+        else:
+            await validate_company_configs(pending)
+
+    return CompanyImportReport(
+        total=len(rows),
+        created=len(to_create),
+        duplicates=sum(1 for r in results if r.result == "duplicate"),
+        invalid=sum(1 for r in results if r.result == "invalid"),
+        pending_validation=len(pending),
+        rows=results,
+    )
+
+
+async def validate_company_configs(pending: List[PendingValidation]) -> None:
+    """
+    Validates many pending configs concurrently (bounded per provider, with identical
+    configs coalesced by the validation cache), then resolves all statuses in one transaction.
+    """
+    async with AsyncSessionLocal() as db:
+        companies = await company_repo.get_by_ids(db, [company_id for company_id, _ in pending])
+
+    semaphores: Dict[ATSProvider, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(settings.COMPANY_IMPORT_VALIDATION_CONCURRENCY)
+    )
+
+    async def check(company: Company) -> Optional[bool]:
+        async with semaphores[company.ats_provider]:
+            return await _check_config_validity(company.ats_provider, company.metadata_config)
+
+    outcomes = await asyncio.gather(*(check(company) for company in companies))
+    validity = {company.id: is_valid for company, is_valid in zip(companies, outcomes)}
+    fingerprints = dict(pending)
+
+    async with AsyncSessionLocal() as db:
+        for company in await company_repo.get_by_ids(db, list(validity)):
+            if _is_stale(company, fingerprints[company.id]):
+                continue
+            await _finish_validation(company, validity[company.id])
+        await db.commit()
+
+    logger.info(
+        "Validated {} company configs ({} valid, {} errored)",
+        len(validity), sum(1 for v in validity.values() if v), sum(1 for v in validity.values() if v is None),
+    )
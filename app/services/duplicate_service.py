@@ -0,0 +1,125 @@
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import AsyncSessionLocal
+from app.models.job import Job
+from app.providers.scrapers.fingerprint import MAX_DISTANCE, bands, distance, job_text, simhash_batch
+from app.repositories import job_repository as job_repo
+from app.workers.cpu_stage import cpu_stage
+
+
+async def index_job_fingerprints(db: AsyncSession, jobs: List[Job], archived_ids: Sequence[UUID] = ()) -> int:
+    """
+    (Re)fingerprints the given flushed jobs, updates their LSH bands and links each one
+    to the oldest near-duplicate in its cluster (across all companies) via duplicate_of_id.
+    Postings of the same company only match when they share a URL or location: the same
+    text for several cities is one opening per city, not a duplicate.
+    Clusters whose canonical is among `archived_ids`, or was one of the jobs and no longer
+    roots its cluster (its text changed, or it became a duplicate), are re-rooted: their
+    members are linked again, so the oldest live one becomes the canonical.
+    Returns the number of jobs flagged as duplicates.
+    """
+    previous = {job.id: (job.simhash, job.duplicate_of_id) for job in jobs}
+    flagged = await _link_duplicates(db, jobs) if jobs else 0
+
+    stale_roots = list(archived_ids) + [
+        job.id for job in jobs
+        if previous[job.id][0] is not None and previous[job.id][1] is None
+        and (job.simhash != previous[job.id][0] or job.duplicate_of_id is not None)
+    ]
+    if stale_roots:
+        members = await job_repo.get_cluster_members(db, stale_roots, [job.id for job in jobs])
+        if members:
+            logger.debug("Re-rooting {} duplicates of {} stale canonicals", len(members), len(stale_roots))
+            await index_job_fingerprints(db, members)
+    return flagged
+
+
+def _is_duplicate(job: Job, row: Any) -> bool:
+    if distance(row.simhash, job.simhash) > MAX_DISTANCE:
+        return False
+    if row.company_id != job.company_id:
+        return True
+    return row.url == job.url or (row.location_key or row.location) == (job.location_key or job.location)
+
+
+async def _link_duplicates(db: AsyncSession, jobs: List[Job]) -> int:
+    hashes = await cpu_stage.map(simhash_batch, [job_text(job.title, job.description_text) for job in jobs])
+    for job, value in zip(jobs, hashes):
+        job.simhash = value
+    await db.flush()
+
+    hashed = [job for job in jobs if job.simhash is not None]
+    await job_repo.replace_simhash_bands(db, [job.id for job in jobs], [
+        {"job_id": job.id, "band": band, "value": value}
+        for job in hashed
+        for band, value in enumerate(bands(job.simhash))
+    ])
+
+    band_values = {(band, value) for job in hashed for band, value in enumerate(bands(job.simhash))}
+    candidates = await job_repo.get_simhash_candidates(db, band_values)
+
+    rows: Dict[UUID, Any] = {row.id: row for row in candidates}
+    by_band: Dict[tuple, List[Any]] = defaultdict(list)
+    for row in candidates:
+        for band, value in enumerate(bands(row.simhash)):
+            by_band[(band, value)].append(row)
+
+    # Links assigned in this pass, so later jobs in the batch resolve to the same root
+    roots: Dict[UUID, Optional[UUID]] = {}
+
+    def root_of(row: Any) -> UUID:
+        duplicate_of = roots[row.id] if row.id in roots else row.duplicate_of_id
+        return duplicate_of or row.id
+
+    flagged = 0
+    for job in jobs:
+        if job.id not in rows:
+            # Empty text or archived: not part of any cluster
+            job.duplicate_of_id = roots[job.id] = None
+
+    for job in sorted((job for job in jobs if job.id in rows), key=lambda j: (rows[j.id].created_at, j.id)):
+        matches = {
+            row.id: row
+            for band, value in enumerate(bands(job.simhash))
+            for row in by_band[(band, value)]
+            if row.id == job.id or _is_duplicate(job, row)
+        }
+        oldest = min(matches.values(), key=lambda row: (row.created_at, row.id))
+        root = job.id if oldest.id == job.id else root_of(oldest)
+
+        job.duplicate_of_id = roots[job.id] = root if root != job.id else None
+        flagged += job.duplicate_of_id is not None
+
+    await db.flush()
+    return flagged
+
+
+async def get_duplicates(db: AsyncSession, job: Job) -> List[Job]:
+    """Every other job in the job's duplicate cluster."""
+    cluster = await job_repo.get_cluster(db, job.duplicate_of_id or job.id)
+    return [member for member in cluster if member.id != job.id]
+
+
+async def backfill_fingerprints(batch_size: int = 500) -> int:
+    """Fingerprints stored jobs that have a plain-text description but no SimHash yet."""
+    indexed = 0
+    after_id = None
+
+    while True:
+        async with AsyncSessionLocal() as db:
+            jobs = await job_repo.get_unfingerprinted(db, after_id, batch_size)
+            if not jobs:
+                break
+            after_id = jobs[-1].id
+            await index_job_fingerprints(db, jobs)
+            await db.commit()
+
+        indexed += len(jobs)
+        logger.info("Fingerprinted {} jobs", indexed)
+
+    return indexed
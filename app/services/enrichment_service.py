@@ -1,11 +1,18 @@
+import time
+from typing import List
 from uuid import UUID
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import metrics
 from app.models.company import Company
+from app.models.enrichment_task import EnrichmentTask, EnrichmentTaskStatus
+from app.repositories import company_repository as company_repo
+from app.repositories import enrichment_task_repository as task_repo
+from app.schemas.enrichment_task import EnrichmentBulkRequest
 from app.services.company_service import get_company_by_id, update_company
 from app.providers.enrichers.factory import EnricherFactory
-from app.core.exceptions import EnrichmentRateLimitError
+from app.core.exceptions import EnrichmentRateLimitError, EnrichmentTaskNotFoundError
 
 async def run_enrichment_for_company(db: AsyncSession, company_id: UUID) -> Company:
     """
@@ -15,27 +22,79 @@ async def run_enrichment_for_company(db: AsyncSession, company_id: UUID) -> Comp
     company = await get_company_by_id(db, company_id)
 
     if not company.ats_provider:
-        logger.warning(f"Cannot enrich {company.name}: No ATS Provider specified.")
+        logger.warning("Cannot enrich {}: No ATS Provider specified.", company.name)
         return company
 
     enricher = EnricherFactory.get_enricher(company.ats_provider)
     if not enricher:
-        logger.warning(f"No enricher strategy for {company.ats_provider}, skipping.")
+        logger.warning("No enricher strategy for {}, skipping.", company.ats_provider)
         return company
 
-    logger.info(f"Starting enrichment for {company.name} ({company.ats_provider})...")
-    
+    logger.info("Starting enrichment for {} ({})...", company.name, company.ats_provider)
+    provider = company.ats_provider.value
+    started = time.perf_counter()
+
     try:
         update_data = await enricher.enrich(company)
     except EnrichmentRateLimitError:
+        _record_enrichment(provider, "rate_limited", started)
         raise
     except Exception as e:
-        logger.error(f"Enrichment failed for {company.name}: {e}")
+        logger.error("Enrichment failed for {}: {}", company.name, e)
+        _record_enrichment(provider, "failed", started)
         return company
 
     if update_data:
-        logger.success(f"Enrichment successful for {company.name}. Applying updates...")
-        return await update_company(db, company_id, update_data)
+        logger.success("Enrichment successful for {}. Applying updates...", company.name)
+        company = await update_company(db, company_id, update_data)
+        _record_enrichment(provider, "updated", started)
+        return company
 
-    logger.info(f"Enrichment found no new data for {company.name}.")
+    logger.info("Enrichment found no new data for {}.", company.name)
+    _record_enrichment(provider, "no_data", started)
     return company
+
+
+def _record_enrichment(provider: str, result: str, started: float) -> None:
+    metrics.enrichment_runs.inc(provider, result)
+    metrics.enrichment_duration.observe(time.perf_counter() - started, provider)
+
+
+async def create_enrichment_task(db: AsyncSession, company_ids: List[UUID]) -> EnrichmentTask:
+    """
+    Persists an enrichment task for the given companies.
+    Committed immediately so the worker pool can pick it up from its own session.
+    """
+    task = EnrichmentTask(
+        company_ids=[str(company_id) for company_id in company_ids],
+        total=len(company_ids),
+        processed=0,
+        succeeded=0,
+        failed=0,
+        results={},
+        status=EnrichmentTaskStatus.PENDING if company_ids else EnrichmentTaskStatus.COMPLETED,
+    )
+    task = await task_repo.create(db, task)
+    await db.commit()
+    return task
+
+
+async def create_company_enrichment_task(db: AsyncSession, company_id: UUID) -> EnrichmentTask:
+    await get_company_by_id(db, company_id)
+    return await create_enrichment_task(db, [company_id])
+
+
+async def create_bulk_enrichment_task(db: AsyncSession, request: EnrichmentBulkRequest) -> EnrichmentTask:
+    company_ids = request.company_ids
+    if company_ids is None:
+        company_ids = await company_repo.get_ids(db, request.status, request.ats_provider, request.limit)
+
+    logger.info("Queueing bulk enrichment for {} companies", len(company_ids))
+    return await create_enrichment_task(db, company_ids)
+
+
+async def get_enrichment_task(db: AsyncSession, task_id: UUID) -> EnrichmentTask:
+    task = await task_repo.get_by_id(db, task_id)
+    if not task:
+        raise EnrichmentTaskNotFoundError(f"Enrichment task {task_id} not found")
+    return task
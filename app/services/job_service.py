@@ -0,0 +1,97 @@
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import JobNotFoundError
+from app.db.session import AsyncSessionLocal
+from app.models.job import Job, JobStatus, UserVerdict
+from app.providers.scrapers.description import content_hash, derive_batch
+from app.repositories import job_repository as job_repo
+from app.services import duplicate_service, location_service, similarity_service
+from app.workers.cpu_stage import cpu_stage
+
+
+async def get_jobs(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    company_id: Optional[UUID] = None,
+    status: Optional[JobStatus] = None,
+    user_verdict: Optional[UserVerdict] = None,
+    q: Optional[str] = None,
+    dedupe: bool = False,
+    sort: str = "newest",
+    country_code: Optional[str] = None,
+    near: Optional[str] = None,
+    radius_km: float = 25,
+) -> List[Job]:
+    location_keys = location_service.location_keys_near(near, radius_km) if near else None
+    if location_keys == []:
+        return []
+    return await job_repo.get_all(
+        db,
+        skip=skip,
+        limit=limit,
+        company_id=company_id,
+        status=status,
+        user_verdict=user_verdict,
+        q=q,
+        dedupe=dedupe,
+        sort=sort,
+        country_code=country_code,
+        location_keys=location_keys,
+    )
+
+
+async def get_job_by_id(db: AsyncSession, job_id: UUID) -> Job:
+    job = await job_repo.get_by_id(db, job_id)
+    if not job:
+        raise JobNotFoundError(f"Job {job_id} not found")
+    return job
+
+
+async def get_job_duplicates(db: AsyncSession, job_id: UUID) -> List[Job]:
+    job = await get_job_by_id(db, job_id)
+    return await duplicate_service.get_duplicates(db, job)
+
+
+async def get_similar_jobs(db: AsyncSession, job_id: UUID, k: int = 10) -> List[Tuple[Job, float]]:
+    job = await get_job_by_id(db, job_id)
+    return await similarity_service.get_similar_jobs(db, job, k)
+
+
+async def backfill_descriptions(batch_size: int = 500, force: bool = False) -> int:
+    """
+    Derives sanitized HTML, plain text and snippet for stored jobs, one committed batch at a time.
+    Only rows without a description hash are processed unless `force` is set.
+    Returns the number of updated jobs.
+    """
+    updated = 0
+    after_id = None
+
+    while True:
+        async with AsyncSessionLocal() as db:
+            rows = await job_repo.get_descriptions_page(db, after_id, batch_size, only_missing=not force)
+            if not rows:
+                break
+
+            derived = await cpu_stage.map(derive_batch, [description for _, description in rows])
+            await job_repo.update_many(db, [
+                {
+                    "id": job_id,
+                    "description": html,
+                    "description_text": text,
+                    "description_snippet": snippet,
+                    "description_hash": content_hash(description),
+                }
+                for (job_id, description), (html, text, snippet) in zip(rows, derived)
+            ])
+            await db.commit()
+
+        updated += len(rows)
+        after_id = rows[-1][0]
+        logger.info("Backfilled descriptions for {} jobs", updated)
+
+    return updated
@@ -0,0 +1,97 @@
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from loguru import logger
+
+from app.core.config import settings
+from app.core.exceptions import LocationNotFoundError
+from app.db.session import AsyncSessionLocal
+from app.providers.scrapers.locations import DEFAULT_GAZETTEER_PATH, Gazetteer, NormalizedLocation
+from app.repositories import job_repository as job_repo
+from app.schemas.job import JobSchema
+
+_COORDINATES = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*$")
+
+
+@lru_cache(maxsize=1)
+def get_gazetteer() -> Gazetteer:
+    path = Path(settings.GAZETTEER_PATH) if settings.GAZETTEER_PATH else DEFAULT_GAZETTEER_PATH
+    gazetteer = Gazetteer.from_file(path)
+    logger.info("Loaded gazetteer with {} cities from {}", len(gazetteer.cities), path)
+    return gazetteer
+
+
+@lru_cache(maxsize=4096)
+def normalize_location(location: Optional[str], city: Optional[str]) -> Optional[NormalizedLocation]:
+    # Postings of a company share a handful of location strings, so lookups are memoized
+    return get_gazetteer().normalize(location, city)
+
+
+def normalize_locations(jobs: List[JobSchema]) -> None:
+    """
+    Sets canonical city, country and coordinates on scraped jobs. Unrecognized
+    locations keep the provider's city and get no coordinates.
+    """
+    for job in jobs:
+        normalized = normalize_location(job.location, job.city)
+        if normalized is None:
+            continue
+        job.city = normalized.city or job.city
+        job.country_code = normalized.country_code
+        job.latitude = normalized.latitude
+        job.longitude = normalized.longitude
+        job.location_key = normalized.key
+
+
+def resolve_place(near: str) -> Tuple[float, float]:
+    """(latitude, longitude) of "lat,lon" or a gazetteer city name ("Tel Aviv", "Cambridge, UK")."""
+    match = _COORDINATES.match(near)
+    if match:
+        latitude, longitude = float(match.group(1)), float(match.group(2))
+        if -90 <= latitude <= 90 and -180 <= longitude <= 180:
+            return latitude, longitude
+
+    normalized = get_gazetteer().normalize(near)
+    if normalized is None or normalized.latitude is None:
+        raise LocationNotFoundError(f"Unknown place '{near}'")
+    return normalized.latitude, normalized.longitude
+
+
+def location_keys_near(near: str, radius_km: float) -> List[str]:
+    """Location keys of every gazetteer city within `radius_km` of a place, via the KD-tree."""
+    latitude, longitude = resolve_place(near)
+    return [city.key for city in get_gazetteer().within(latitude, longitude, radius_km)]
+
+
+async def backfill_locations(batch_size: int = 1000) -> int:
+    """Normalizes the location of every stored job, one committed batch at a time."""
+    updated = 0
+    after_id = None
+
+    while True:
+        async with AsyncSessionLocal() as db:
+            rows = await job_repo.get_locations_page(db, after_id, batch_size)
+            if not rows:
+                break
+
+            values = []
+            for job_id, location, city in rows:
+                normalized = normalize_location(location, city) or NormalizedLocation(city, None, None, None, None)
+                values.append({
+                    "id": job_id,
+                    "city": normalized.city or city,
+                    "country_code": normalized.country_code,
+                    "latitude": normalized.latitude,
+                    "longitude": normalized.longitude,
+                    "location_key": normalized.key,
+                })
+            await job_repo.update_many(db, values)
+            await db.commit()
+
+        updated += len(rows)
+        after_id = rows[-1][0]
+        logger.info("Normalized locations for {} jobs", updated)
+
+    return updated
@@ -0,0 +1,17 @@
+from typing import List
+
+from app.core.exceptions import ProfileNotFoundError
+from app.core.profiler import profile_store
+from app.schemas.profile import ProfileInfo
+
+
+def list_profiles() -> List[ProfileInfo]:
+    return [ProfileInfo(**summary) for summary in profile_store.list()]
+
+
+def get_profile(profile_id: str) -> str:
+    """Folded stacks of a stored profile."""
+    folded = profile_store.read(profile_id)
+    if folded is None:
+        raise ProfileNotFoundError(f"Profile {profile_id} not found")
+    return folded
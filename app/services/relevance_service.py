@@ -0,0 +1,314 @@
+import asyncio
+import threading
+from pathlib import Path
+from typing import List, Optional, Sequence
+from uuid import UUID
+
+import joblib
+import numpy as np
+from fastapi import BackgroundTasks
+from loguru import logger
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.job import Job, JobStatus, UserVerdict
+from app.repositories import job_repository as job_repo
+from app.schemas.job import JobVerdictUpdate
+
+# PERFECT_MATCH counts as a stronger positive example than GOOD
+VERDICT_LABELS = {UserVerdict.PERFECT_MATCH: 1, UserVerdict.GOOD: 1, UserVerdict.IRRELEVANT: 0}
+VERDICT_WEIGHTS = {UserVerdict.PERFECT_MATCH: 2.0, UserVerdict.GOOD: 1.0, UserVerdict.IRRELEVANT: 1.0}
+
+
+def relevance_text(title: Optional[str], description_text: Optional[str]) -> str:
+    # The title is repeated so it outweighs boilerplate in long descriptions
+    return f"{title or ''}\n{title or ''}\n{description_text or ''}"
+
+
+class RelevanceModel:
+    """
+    Linear text classifier (hashed word/bigram features + logistic SGD) predicting
+    whether a job will be marked PERFECT_MATCH/GOOD. The vectorizer is stateless,
+    so every verdict batch is an incremental `partial_fit` on just the new labels.
+    A changed or cleared verdict can't be un-learned that way; it schedules a full retrain.
+    The file is re-read when another process replaces it (its mtime changes), e.g.
+    after `make retrain-relevance`, and an update never overwrites such a model.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.vectorizer = HashingVectorizer(
+            n_features=2 ** 20, ngram_range=(1, 2), alternate_sign=False, norm="l2", stop_words="english",
+        )
+        self._classifier: Optional[SGDClassifier] = None
+        self._loaded = False
+        # mtime (ns) of the file the classifier was loaded from or saved to
+        self._mtime: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_trained(self) -> bool:
+        with self._lock:
+            self._load()
+            return self._classifier is not None
+
+    def _file_mtime(self) -> Optional[int]:
+        try:
+            return self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _load(self) -> None:
+        mtime = self._file_mtime()
+        if self._loaded and mtime == self._mtime:
+            return
+        self._loaded = True
+        self._mtime = mtime
+        self._classifier = joblib.load(self.path) if mtime is not None else None
+        if mtime is not None:
+            logger.info("Loaded relevance model from {}", self.path)
+
+    def partial_fit(self, texts: Sequence[str], labels: Sequence[int], weights: Sequence[float]) -> None:
+        features = self.vectorizer.transform(texts)
+        with self._lock:
+            while True:
+                self._load()
+                mtime = self._mtime
+                if self._classifier is None:
+                    self._classifier = SGDClassifier(loss="log_loss", alpha=1e-5, random_state=0)
+                self._classifier.partial_fit(
+                    features, np.asarray(labels), classes=[0, 1], sample_weight=np.asarray(weights),
+                )
+                # Replaced by another process while fitting: apply the batch to its model instead
+                if self._file_mtime() == mtime:
+                    break
+            self._dump()
+
+    def _dump(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp.joblib")
+        joblib.dump(self._classifier, tmp)
+        tmp.replace(self.path)
+        self._mtime = self._file_mtime()
+
+    def score(self, texts: Sequence[str]) -> Optional[List[float]]:
+        """Probability of relevance per text, or None while the model is untrained."""
+        with self._lock:
+            self._load()
+            if self._classifier is None or not texts:
+                return None if self._classifier is None else []
+            return self._classifier.predict_proba(self.vectorizer.transform(texts))[:, 1].tolist()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._classifier = None
+            self._loaded = True
+            self._mtime = None
+            self.path.unlink(missing_ok=True)
+
+    def replace(self, other: "RelevanceModel") -> None:
+        """Takes over the file of `other` (or becomes untrained if it has none)."""
+        with self._lock:
+            if other.path.exists():
+                other.path.replace(self.path)
+            else:
+                self.path.unlink(missing_ok=True)
+            self._loaded = False
+
+
+relevance_model = RelevanceModel(settings.RELEVANCE_MODEL_PATH)
+
+
+async def score_jobs(db: AsyncSession, jobs: List[Job]) -> int:
+    """Scores the given jobs in one vectorized call (off the loop). Returns the number scored."""
+    if not jobs:
+        return 0
+
+    texts = [relevance_text(job.title, job.description_text) for job in jobs]
+    scores = await asyncio.to_thread(relevance_model.score, texts)
+    if scores is None:
+        return 0
+
+    for job, score in zip(jobs, scores):
+        job.relevance_score = score
+    await db.flush()
+    return len(jobs)
+
+
+async def rescore_new_jobs(batch_size: Optional[int] = None) -> int:
+    """Re-scores every NEW job with the current model, one committed batch at a time."""
+    batch_size = batch_size or settings.RELEVANCE_SCORE_BATCH_SIZE
+    scored = 0
+    after_id = None
+
+    while True:
+        async with AsyncSessionLocal() as db:
+            rows = await job_repo.get_texts_page(db, after_id, batch_size, status=JobStatus.NEW)
+            if not rows:
+                break
+
+            scores = await asyncio.to_thread(
+                relevance_model.score, [relevance_text(title, text) for _, title, text in rows]
+            )
+            if scores is None:
+                break
+            await job_repo.update_many(db, [
+                {"id": job_id, "relevance_score": score} for (job_id, _, _), score in zip(rows, scores)
+            ])
+            await db.commit()
+
+        scored += len(rows)
+        after_id = rows[-1][0]
+
+    return scored
+
+
+async def train_batch(jobs: List[Job], model: Optional[RelevanceModel] = None) -> None:
+    await asyncio.to_thread(
+        (model or relevance_model).partial_fit,
+        [relevance_text(job.title, job.description_text) for job in jobs],
+        [VERDICT_LABELS[job.user_verdict] for job in jobs],
+        [VERDICT_WEIGHTS[job.user_verdict] for job in jobs],
+    )
+
+
+# Background re-scoring of NEW jobs after verdict batches; see schedule_rescore
+_rescore_task: Optional[asyncio.Task] = None
+_rescore_requested = False
+
+
+def schedule_rescore() -> None:
+    """
+    Re-scores NEW jobs in the background, RELEVANCE_RESCORE_DELAY seconds from now.
+    Requests made meanwhile share that pass; requests made during it get one more pass.
+    """
+    global _rescore_task, _rescore_requested
+    _rescore_requested = True
+    if _rescore_task is None or _rescore_task.done():
+        _rescore_task = asyncio.create_task(_rescore_while_requested())
+
+
+async def _rescore_while_requested() -> None:
+    global _rescore_requested
+    while _rescore_requested:
+        await asyncio.sleep(settings.RELEVANCE_RESCORE_DELAY)
+        _rescore_requested = False
+        try:
+            rescored = await rescore_new_jobs()
+            logger.info("Re-scored {} NEW jobs with the updated relevance model", rescored)
+        except Exception as e:
+            logger.error("Re-scoring NEW jobs failed: {}", e)
+
+
+# Background full retrains after verdicts were changed or cleared; see schedule_retrain
+_retrain_task: Optional[asyncio.Task] = None
+_retrain_requested = False
+
+
+def schedule_retrain() -> None:
+    """
+    Retrains the model from scratch in the background, RELEVANCE_RETRAIN_DELAY seconds from now.
+    Requests made meanwhile share that pass; requests made during it get one more pass.
+    """
+    global _retrain_task, _retrain_requested
+    _retrain_requested = True
+    if _retrain_task is None or _retrain_task.done():
+        _retrain_task = asyncio.create_task(_retrain_while_requested())
+
+
+async def _retrain_while_requested() -> None:
+    global _retrain_requested
+    while _retrain_requested:
+        await asyncio.sleep(settings.RELEVANCE_RETRAIN_DELAY)
+        _retrain_requested = False
+        try:
+            trained = await retrain()
+            logger.info("Retrained the relevance model on {} verdicts", trained)
+        except Exception as e:
+            logger.error("Retraining the relevance model failed: {}", e)
+
+
+def _retraining() -> bool:
+    return _retrain_task is not None and not _retrain_task.done()
+
+
+async def train_on_jobs(job_ids: Sequence[UUID]) -> None:
+    """Incrementally trains on the current verdicts of the given jobs, then schedules a re-score of NEW jobs."""
+    async with AsyncSessionLocal() as db:
+        jobs = [job for job in await job_repo.get_by_ids(db, job_ids) if job.user_verdict is not None]
+
+    if not jobs:
+        return
+
+    await train_batch(jobs)
+    schedule_rescore()
+    if _retraining():
+        # The retrain in progress may have paged past these jobs and replaces this update
+        schedule_retrain()
+    logger.info("Relevance model updated with {} verdicts", len(jobs))
+
+
+async def retrain(batch_size: Optional[int] = None) -> int:
+    """
+    Rebuilds the model from scratch over every labelled job. Returns the number of examples.
+    It is trained in a staging file that replaces the live one only when complete, so
+    processes using the model keep the previous one until then.
+    """
+    batch_size = batch_size or settings.RELEVANCE_SCORE_BATCH_SIZE
+    staging = RelevanceModel(str(relevance_model.path.with_suffix(".staging.joblib")))
+    staging.reset()
+    trained = 0
+    after_id = None
+
+    while True:
+        async with AsyncSessionLocal() as db:
+            jobs = await job_repo.get_labelled_page(db, after_id, batch_size)
+        if not jobs:
+            break
+
+        await train_batch(jobs, staging)
+        trained += len(jobs)
+        after_id = jobs[-1].id
+
+    relevance_model.replace(staging)
+    await rescore_new_jobs(batch_size)
+    return trained
+
+
+async def record_verdicts(
+    db: AsyncSession,
+    verdicts: List[JobVerdictUpdate],
+    background_tasks: Optional[BackgroundTasks] = None,
+) -> List[Job]:
+    """
+    Stores user verdicts and schedules an incremental model update on them.
+    Changing or clearing an existing verdict also schedules a full retrain, which
+    drops what the model learned from the previous verdict.
+    """
+    jobs = {job.id: job for job in await job_repo.get_by_ids(db, [v.job_id for v in verdicts])}
+    revised = False
+    for verdict in verdicts:
+        job = jobs.get(verdict.job_id)
+        if job:
+            revised |= job.user_verdict is not None and job.user_verdict != verdict.user_verdict
+            job.user_verdict = verdict.user_verdict
+
+    # Training uses its own sessions, so the verdicts must be committed first
+    await db.commit()
+
+    labelled = [job_id for job_id, job in jobs.items() if job.user_verdict is not None]
+    if background_tasks is None:
+        if revised:
+            await retrain()
+        elif labelled:
+            await train_on_jobs(labelled)
+        return list(jobs.values())
+
+    if labelled:
+        background_tasks.add_task(train_on_jobs, labelled)
+    if revised:
+        schedule_retrain()
+    return list(jobs.values())
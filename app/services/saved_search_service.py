@@ -0,0 +1,173 @@
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import SavedSearchNotFoundError
+from app.db.session import AsyncSessionLocal
+from app.models.company import CompanyStatus
+from app.models.job import Job, JobStatus
+from app.models.saved_search import SavedSearch, SearchNotification
+from app.repositories import company_repository as company_repo
+from app.repositories import saved_search_repository as saved_search_repo
+from app.schemas.saved_search import SavedSearchCreate
+from app.services.location_service import normalize_location
+
+MATCH_ALL = "*"
+_TOKEN = re.compile(r"\w+")
+
+
+def _tokens(text: Optional[str]) -> List[str]:
+    return _TOKEN.findall(text.lower()) if text else []
+
+
+def tokenize(text: Optional[str]) -> Set[str]:
+    return set(_tokens(text))
+
+
+def normalize_city(city: Optional[str]) -> Optional[str]:
+    return " ".join(_tokens(city)) or None
+
+
+def canonical_city(city: Optional[str]) -> Optional[str]:
+    """
+    The gazetteer name of a saved-search city ("TLV", "Tel-Aviv, Israel" -> "Tel Aviv"),
+    as stored on normalized jobs. Unrecognized cities are kept as given.
+    """
+    if not city or not city.strip():
+        return None
+    normalized = normalize_location(None, city)
+    return normalized.city if normalized and normalized.city else city.strip()
+
+
+def keyword_tokens(keywords: List[str]) -> Set[str]:
+    return {token for keyword in keywords for token in _tokens(keyword)}
+
+
+def search_anchor(keywords: List[str], city: Optional[str], company_id: Optional[UUID]) -> str:
+    """
+    The key a saved search is indexed under: its longest keyword token (longer tokens
+    are rarer in job text), else its city, else its company, else MATCH_ALL.
+    Every job matching the search necessarily carries this key.
+    """
+    tokens = keyword_tokens(keywords)
+    if tokens:
+        return f"kw:{max(sorted(tokens), key=len)}"
+    if normalize_city(city):
+        return f"city:{normalize_city(city)}"
+    if company_id:
+        return f"company:{company_id}"
+    return MATCH_ALL
+
+
+class _JobTerms:
+    """Percolation keys and match inputs of one job, computed once per batch."""
+
+    def __init__(self, job: Job):
+        self.company_id = job.company_id
+        self.title = tokenize(job.title)
+        self.all = self.title | tokenize(job.description_text)
+        self.city = normalize_city(job.city)
+
+    def anchors(self) -> Set[str]:
+        keys = {f"kw:{token}" for token in self.all} | {f"company:{self.company_id}", MATCH_ALL}
+        if self.city:
+            keys.add(f"city:{self.city}")
+        return keys
+
+
+def matches(search: SavedSearch, job: Job, terms: _JobTerms, company_active: bool) -> bool:
+    if search.active_companies_only and not company_active:
+        return False
+    if search.company_id and search.company_id != job.company_id:
+        return False
+    if search.city and normalize_city(search.city) != terms.city:
+        return False
+    return keyword_tokens(search.keywords) <= (terms.title if search.title_only else terms.all)
+
+
+async def percolate_jobs(db: AsyncSession, jobs: List[Job]) -> int:
+    """
+    Matches new/changed jobs against saved searches and records a notification per
+    (search, job) pair not notified before. Only searches anchored on a key the jobs
+    carry are loaded and checked. Returns the number of notifications added.
+    """
+    jobs = [job for job in jobs if job.status != JobStatus.ARCHIVED]
+    if not jobs:
+        return 0
+
+    terms = {job.id: _JobTerms(job) for job in jobs}
+    jobs_by_anchor: Dict[str, List[Job]] = defaultdict(list)
+    for job in jobs:
+        for anchor in terms[job.id].anchors():
+            jobs_by_anchor[anchor].append(job)
+
+    candidates = await saved_search_repo.get_by_anchors(db, list(jobs_by_anchor))
+    if not candidates:
+        return 0
+
+    companies = await company_repo.get_by_ids(db, list({job.company_id for job in jobs}))
+    active = {company.id for company in companies if company.status == CompanyStatus.ACTIVE}
+
+    rows = [
+        {"user_id": search.user_id, "saved_search_id": search.id, "job_id": job.id}
+        for search in candidates
+        for job in jobs_by_anchor[search.anchor]
+        if matches(search, job, terms[job.id], job.company_id in active)
+    ]
+    added = await saved_search_repo.add_notifications(db, rows)
+    if added:
+        logger.info("Saved searches: {} new notifications from {} candidate searches", added, len(candidates))
+    return added
+
+
+async def create_saved_search(db: AsyncSession, search_in: SavedSearchCreate) -> SavedSearch:
+    city = canonical_city(search_in.city)
+    saved_search = SavedSearch(
+        user_id=search_in.user_id,
+        name=search_in.name,
+        keywords=search_in.keywords,
+        title_only=search_in.title_only,
+        city=city,
+        company_id=search_in.company_id,
+        active_companies_only=search_in.active_companies_only,
+        anchor=search_anchor(search_in.keywords, city, search_in.company_id),
+    )
+    return await saved_search_repo.create(db, saved_search)
+
+
+async def backfill_search_cities() -> int:
+    """Re-resolves the city (and anchor) of stored saved searches. Returns the number changed."""
+    changed = 0
+    async with AsyncSessionLocal() as db:
+        for search in await saved_search_repo.get_with_city(db):
+            city = canonical_city(search.city)
+            if city == search.city:
+                continue
+            search.city = city
+            search.anchor = search_anchor(search.keywords, city, search.company_id)
+            changed += 1
+        await db.commit()
+    return changed
+
+
+async def get_saved_searches(db: AsyncSession, user_id: str) -> List[SavedSearch]:
+    return await saved_search_repo.get_by_user(db, user_id)
+
+
+async def delete_saved_search(db: AsyncSession, saved_search_id: UUID) -> None:
+    saved_search = await saved_search_repo.get_by_id(db, saved_search_id)
+    if not saved_search:
+        raise SavedSearchNotFoundError(f"Saved search {saved_search_id} not found")
+    await saved_search_repo.delete(db, saved_search)
+
+
+async def get_pending_notifications(db: AsyncSession, user_id: str, limit: int = 100) -> List[SearchNotification]:
+    return await saved_search_repo.get_pending_notifications(db, user_id, limit)
+
+
+async def acknowledge_notifications(db: AsyncSession, user_id: str, notification_ids: List[int]) -> int:
+    return await saved_search_repo.mark_delivered(db, user_id, notification_ids)
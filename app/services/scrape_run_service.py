@@ -0,0 +1,78 @@
+from dataclasses import asdict
+from datetime import datetime
+from typing import List, Literal, Optional
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.run_stats import ScrapeRunStats
+from app.db.session import AsyncSessionLocal
+from app.models.company import ATSProvider
+from app.models.scrape_run import ScrapeRun
+from app.repositories import scrape_run_repository as scrape_run_repo
+from app.schemas.scrape_run import CompanyCostGrowth, ScrapeRunTrend
+
+TrendGroup = Literal["company", "provider"]
+TrendBucket = Literal["hour", "day", "week"]
+
+_LEDGER_COLUMNS = frozenset(ScrapeRun.__table__.columns.keys())
+
+
+async def record_scrape_run(
+    run_id: UUID,
+    company_id: UUID,
+    provider: ATSProvider,
+    started_at: datetime,
+    finished_at: datetime,
+    duration_seconds: float,
+    stats: ScrapeRunStats,
+    error_class: Optional[str] = None,
+) -> None:
+    """
+    Writes the ledger row of a run in its own session and transaction, so runs whose
+    own transaction is rolled back are recorded too. Failures are logged, never raised.
+    """
+    run = ScrapeRun(
+        id=run_id,
+        company_id=company_id,
+        provider=provider,
+        started_at=started_at,
+        finished_at=finished_at,
+        duration_seconds=duration_seconds,
+        error_class=error_class,
+        **{name: value for name, value in asdict(stats).items() if name in _LEDGER_COLUMNS},
+    )
+    try:
+        async with AsyncSessionLocal() as db:
+            await scrape_run_repo.create(db, run)
+            await db.commit()
+    except Exception as e:
+        logger.warning("Could not record scrape run of company {}: {}", company_id, e)
+
+
+async def get_recent_runs(
+    db: AsyncSession,
+    limit: int = 100,
+    company_id: Optional[UUID] = None,
+    provider: Optional[ATSProvider] = None,
+    failed_only: bool = False,
+) -> List[ScrapeRun]:
+    return await scrape_run_repo.get_recent(db, limit, company_id, provider, failed_only)
+
+
+async def get_trends(
+    db: AsyncSession,
+    group_by: TrendGroup = "provider",
+    days: int = 30,
+    bucket: TrendBucket = "day",
+    company_id: Optional[UUID] = None,
+    provider: Optional[ATSProvider] = None,
+) -> List[ScrapeRunTrend]:
+    rows = await scrape_run_repo.get_trends(db, group_by, days, bucket, company_id, provider)
+    return [ScrapeRunTrend(**row) for row in rows]
+
+
+async def get_cost_growth(db: AsyncSession, days: int = 7, limit: int = 20) -> List[CompanyCostGrowth]:
+    rows = await scrape_run_repo.get_cost_growth(db, days, limit)
+    return [CompanyCostGrowth(**row) for row in rows]
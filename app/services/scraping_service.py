@@ -1,93 +1,405 @@
+import asyncio
+import time
+from contextlib import nullcontext
+from dataclasses import asdict
 from datetime import datetime, timezone
-from uuid import UUID
+from typing import Dict, List, Optional, Union
+from uuid import UUID, uuid4
 
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.exceptions import CompanyNotFoundError, FatalProviderError
-from app.models.company import CompanyStatus
+from app.core import memory, metrics, profiler, run_stats, tracing
+from app.core.config import settings
+from app.core.exceptions import (
+    ArchivedRunNotFoundError, CompanyNotFoundError, ContentNotModifiedError, FatalProviderError, StaleArchivedRunError,
+)
+from app.db import query_tracker
+from app.db.session import AsyncSessionLocal
+from app.models.company import Company, CompanyStatus
 from app.models.job import Job
+from app.repositories import company_repository as company_repo
 from app.repositories import job_repository as job_repo
+from app.repositories import response_validator_repository as validator_repo
+from app.repositories import scrape_run_repository as scrape_run_repo
+from app.providers.archive import ResponseArchive, response_archive
+from app.providers.http import use_transport
+from app.providers.scrapers.description import content_hash, derive_batch
+from app.providers.scrapers.base import BaseScraper
 from app.providers.scrapers.factory import ScraperFactory
+from app.providers.scrapers.response_cache import ResponseValidators
 from app.schemas.job import JobSchema
 from app.services.company_service import get_company_by_id
+from app.services.duplicate_service import index_job_fingerprints
+from app.services.location_service import normalize_locations
+from app.services.relevance_service import score_jobs
+from app.services.saved_search_service import percolate_jobs
+from app.services.scrape_run_service import record_scrape_run
+from app.services.similarity_service import apply_index_updates, index_jobs, save_index, unindex_jobs
+from app.workers.cpu_stage import cpu_stage
 
 
-async def run_scrape_for_company(db: AsyncSession, company_id: UUID) -> int:
+async def run_scrape_for_company(
+    db: AsyncSession, company_id: UUID, profile: bool = False, track_memory: bool = False, archive: bool = False
+) -> int:
     """
     Scrapes jobs for a single company.
+    With `profile`, the run is sampled and saved as a profile keyed by its scrape-run id.
+    With `track_memory` (or SCRAPE_MEMORY_TRACKING), its memory use is recorded in the run stats.
+    With `archive` (or RESPONSE_ARCHIVE_ENABLED), its raw provider responses are archived for re-parsing.
     Returns the number of new jobs found.
     """
     company = await get_company_by_id(db, company_id)
 
     if company.status != CompanyStatus.ACTIVE:
-        logger.warning(f"{company.name}: Status is {company.status}, cannot scrape.")
+        logger.warning("{}: Status is {}, cannot scrape.", company.name, company.status)
         return 0
 
     scraper = ScraperFactory.get_scraper(company)
-    logger.info(f"Scraping {company.name} ({company.ats_provider})...")
+    logger.debug("Scraping {} ({})...", company.name, company.ats_provider)
 
+    ats_provider = company.ats_provider
+    provider = ats_provider.value
+    run_id = uuid4()
+    started_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    started = time.perf_counter()
+    result = "error"
+    error_class = None
+    run_profile = profiler.profiling("scrape", run_id, company.name) if profile else nullcontext()
+    archive = archive or settings.RESPONSE_ARCHIVE_ENABLED
+    run_recording = response_archive.recording(run_id, company_id, company.name, provider) if archive else nullcontext()
+    run_span = tracing.span(
+        "scrape", provider=provider, **{"company.id": str(company_id), "company.name": company.name, "scrape.run_id": str(run_id)}
+    )
+    with run_span, run_stats.track_run() as stats, query_tracker.track_queries("scrape", company.name), run_profile:
+        try:
+            if settings.RESPONSE_VALIDATION_ENABLED:
+                scraper.response_validators = ResponseValidators(
+                    await validator_repo.get_fresh(db, company_id, settings.RESPONSE_VALIDATOR_MAX_AGE)
+                )
+            track_memory = track_memory or settings.SCRAPE_MEMORY_TRACKING
+            async with memory.track_memory(stats) if track_memory else nullcontext():
+                with run_recording as recording:
+                    new_count = await _scrape_company(db, company, scraper, provider, stats)
+                    if recording is not None and not stats.not_modified:
+                        recording.complete = True
+            result = "not_modified" if stats.not_modified else "success"
+            return new_count
+        except Exception as e:
+            result = "fatal" if isinstance(e, FatalProviderError) else "error"
+            error_class = type(e).__name__
+            raise
+        finally:
+            duration = time.perf_counter() - started
+            metrics.scrape_runs.inc(provider, result)
+            metrics.scrape_duration.observe(duration, provider)
+            if stats.memory_peak_bytes is not None:
+                metrics.scrape_memory_peak.observe(stats.memory_peak_bytes, provider)
+            _log_run_summary(company, provider, run_id, result, duration, stats, error_class)
+            await record_scrape_run(
+                run_id, company_id, ats_provider, started_at,
+                datetime.now(timezone.utc).replace(tzinfo=None), duration, stats, error_class,
+            )
+
+
+def _log_run_summary(
+    company: Company,
+    provider: str,
+    run_id: UUID,
+    result: str,
+    duration: float,
+    stats: run_stats.ScrapeRunStats,
+    error_class: Optional[str],
+) -> None:
+    """One record per run; its fields are also the record's extra (keys of the JSON record with LOG_JSON)."""
+    fields = {
+        "company": company.name,
+        "provider": provider,
+        "run_id": str(run_id),
+        "result": result,
+        "duration_seconds": round(duration, 3),
+        "error_class": error_class,
+        **{name: value for name, value in asdict(stats).items() if not name.startswith("memory_top")},
+    }
+    level = "WARNING" if error_class else "SUCCESS"
+    logger.bind(event="scrape_run").log(
+        level,
+        "{company}: {result} in {duration_seconds}s: {new_count} new, {updated_count} updated, "
+        "{archived_count} archived, {duplicate_count} flagged as duplicates, "
+        "{notification_count} saved-search notifications, {http_requests} requests, {db_statements} statements",
+        **fields,
+    )
+
+
+async def _scrape_company(
+    db: AsyncSession, company: Company, scraper: BaseScraper, provider: str, stats: run_stats.ScrapeRunStats
+) -> int:
+    """
+    Fetches and stores one company's jobs, counting them on `stats`; run_scrape_for_company records the run.
+    A company whose list responses match the scraper's response validators is left untouched.
+    """
+    company_id = company.id
     try:
-        scraped_jobs = await scraper.fetch_jobs()
+        with tracing.span("fetch"):
+            scraped_jobs = await scraper.fetch_jobs()
+        # Every parsed posting and its raw_data is alive here
+        memory.checkpoint()
+    except ContentNotModifiedError:
+        stats.not_modified = True
+        company.last_scanned_at = datetime.now(timezone.utc)
+        await db.flush()
+        return 0
     except FatalProviderError as e:
-        logger.error(f"Fatal scrape error for {company.name}: {e}")
+        logger.error("Fatal scrape error for {}: {}", company.name, e)
         company.status = CompanyStatus.ERROR
         await db.flush()
         raise
     except Exception as e:
-        logger.error(f"Scrape failed for {company.name}: {e}")
+        logger.error("Scrape failed for {}: {}", company.name, e)
         raise
 
-    existing_ids = await job_repo.get_external_ids_by_company(db, company_id)
+    existing_hashes = await job_repo.get_description_hashes(db, company_id)
+    existing_ids = set(existing_hashes)
+    with run_stats.parse_timer(), tracing.span("derive", jobs=len(scraped_jobs)):
+        await _derive_descriptions(scraped_jobs, existing_hashes)
+        normalize_locations(scraped_jobs)
+
     scraped_ids = {job.external_id for job in scraped_jobs}
+    stats.jobs_parsed = len(scraped_jobs)
+    metrics.scrape_jobs.inc(provider, "parsed", amount=len(scraped_jobs))
 
-    new_count = 0
     updated_count = 0
+    new_jobs: List[Job] = []
+    changed_jobs: List[Job] = []
+
+    with tracing.span("upsert"):
+        # Stored jobs are loaded in one query and new ones inserted in one flush, not per job
+        existing_jobs = await job_repo.get_by_external_ids(
+            db, company_id, [job.external_id for job in scraped_jobs if job.external_id in existing_ids]
+        )
+        for job_data in scraped_jobs:
+            job = existing_jobs.get(job_data.external_id)
+            if job:
+                updated_count += 1
+                if _update_job(job, job_data):
+                    changed_jobs.append(job)
+            else:
+                new_jobs.append(_new_job(company_id, job_data))
+
+        await job_repo.create_many(db, new_jobs)
+    new_count = len(new_jobs)
+    changed_jobs.extend(new_jobs)
 
-    for job_data in scraped_jobs:
-        if job_data.external_id in existing_ids:
-            await _update_job(db, company_id, job_data)
-            updated_count += 1
-        else:
-            await _create_job(db, company_id, job_data)
-            new_count += 1
+    with tracing.span("archive"):
+        archived_ids = await job_repo.archive_missing(db, company_id, scraped_ids)
+    archived_count = len(archived_ids)
+    with tracing.span("fingerprint"):
+        duplicate_count = await index_job_fingerprints(db, changed_jobs, archived_ids)
+    with tracing.span("score"):
+        await score_jobs(db, changed_jobs)
+    with tracing.span("index"):
+        await index_jobs(db, changed_jobs)
+        await unindex_jobs(db, archived_ids)
+    with tracing.span("percolate"):
+        notification_count = await percolate_jobs(db, changed_jobs)
 
-    archived_count = await job_repo.archive_missing(db, company_id, scraped_ids)
+    stats.new_count = new_count
+    stats.updated_count = updated_count
+    stats.changed_count = len(changed_jobs)
+    stats.archived_count = archived_count
+    stats.duplicate_count = duplicate_count
+    stats.notification_count = notification_count
+    metrics.scrape_jobs.inc(provider, "created", amount=new_count)
+    metrics.scrape_jobs.inc(provider, "updated", amount=updated_count)
+    metrics.scrape_jobs.inc(provider, "changed", amount=len(changed_jobs))
+    metrics.scrape_jobs.inc(provider, "archived", amount=archived_count)
 
     company.last_scanned_at = datetime.now(timezone.utc)
+    if scraper.response_validators is not None:
+        # Stored only now, with the jobs they describe
+        await validator_repo.upsert_many(db, company_id, scraper.response_validators.seen)
     await db.flush()
+    return new_count
+
+
+async def run_scrape_fleet(
+    company_ids: Optional[List[UUID]] = None,
+    concurrency: Optional[int] = None,
+    profile: bool = False,
+    track_memory: bool = False,
+    archive: bool = False,
+    durations: Optional[Dict[UUID, float]] = None,
+) -> Dict[UUID, Union[int, Exception]]:
+    """
+    Scrapes many companies concurrently (every ACTIVE company by default),
+    each in its own session and transaction so one failure doesn't roll back the rest.
+    Committed runs update the similarity index, which is saved at the end.
+    With `profile` / `track_memory` / `archive`, every company run is profiled / memory-accounted / archived.
+    `durations`, when given, receives each company's run time (excluding the wait for a slot).
+    Returns new-job counts, or the raised exception, per company.
+    """
+    if company_ids is None:
+        async with AsyncSessionLocal() as db:
+            company_ids = await company_repo.get_ids(db, status=CompanyStatus.ACTIVE)
+
+    semaphore = asyncio.Semaphore(concurrency or settings.SCRAPE_FLEET_CONCURRENCY)
+
+    async def scrape_one(company_id: UUID) -> Union[int, Exception]:
+        async with semaphore, AsyncSessionLocal() as db:
+            started = time.perf_counter()
+            try:
+                new_count = await run_scrape_for_company(db, company_id, profile, track_memory, archive)
+                await db.commit()
+                await apply_index_updates(db)
+                return new_count
+            except FatalProviderError as e:
+                # Persist the ERROR status set by run_scrape_for_company
+                await db.commit()
+                return e
+            except Exception as e:
+                await db.rollback()
+                return e
+            finally:
+                if durations is not None:
+                    durations[company_id] = time.perf_counter() - started
 
-    logger.success(
-        f"{company.name}: {new_count} new, {updated_count} updated, {archived_count} archived"
+    outcomes = await asyncio.gather(*(scrape_one(company_id) for company_id in company_ids))
+    results = dict(zip(company_ids, outcomes))
+
+    failed = sum(1 for outcome in outcomes if isinstance(outcome, Exception))
+    logger.info("Fleet scrape finished: {} succeeded, {} failed", len(results) - failed, failed)
+    if archive or settings.RESPONSE_ARCHIVE_ENABLED:
+        # Bodies of runs pruned from the archive during the fleet
+        await asyncio.to_thread(response_archive.collect_garbage)
+    # Committed runs' vectors, for the API process to reload
+    await save_index()
+    return results
+
+
+async def reparse_company(db: AsyncSession, company_id: UUID, store: Optional[ResponseArchive] = None) -> int:
+    """
+    Re-parses the newest complete archived run of a company and applies its jobs through
+    the normal upsert path, with the archive standing in for the provider. A run older than
+    the company's last applied scrape is refused: applying it would archive newer jobs and
+    overwrite newer data. Returns the number of new jobs.
+    """
+    store = store or response_archive
+    company = await get_company_by_id(db, company_id)
+    manifest = store.latest(company_id)
+    if manifest is None:
+        raise ArchivedRunNotFoundError(f"No complete archived run of company {company.name}")
+    last_applied = await scrape_run_repo.get_last_applied(db, company_id)
+    if (
+        last_applied is not None
+        and str(last_applied.id) != manifest["run_id"]
+        and last_applied.started_at > datetime.fromisoformat(manifest["started_at"])
+    ):
+        raise StaleArchivedRunError(
+            f"Archived run {manifest['run_id']} of company {company.name} ({manifest['started_at']}) "
+            f"is older than its last applied scrape ({last_applied.started_at.isoformat()})"
+        )
+
+    scraper = ScraperFactory.get_scraper(company)
+    scraper.pacing = False
+    replay = store.replay_transport(manifest)
+    with run_stats.track_run() as stats, use_transport(lambda: replay):
+        new_count = await _scrape_company(db, company, scraper, company.ats_provider.value, stats)
+    logger.info(
+        "{}: re-parsed run {} of {}: {} jobs, {} new, {} changed, {} archived",
+        company.name, manifest["run_id"], manifest["started_at"], stats.jobs_parsed,
+        new_count, stats.changed_count, stats.archived_count,
     )
     return new_count
 
 
-async def _create_job(db: AsyncSession, company_id: UUID, job_data: JobSchema) -> Job:
-    job = Job(
+async def reparse_archive(
+    company_ids: Optional[List[UUID]] = None, store: Optional[ResponseArchive] = None
+) -> Dict[UUID, Union[int, Exception]]:
+    """
+    Re-parses archived runs of many companies (every archived company by default), one
+    at a time, each in its own session and transaction. Returns new-job counts, or the
+    raised exception, per company.
+    """
+    store = store or response_archive
+    if company_ids is None:
+        company_ids = store.companies()
+
+    results: Dict[UUID, Union[int, Exception]] = {}
+    for company_id in company_ids:
+        async with AsyncSessionLocal() as db:
+            try:
+                results[company_id] = await reparse_company(db, company_id, store)
+                await db.commit()
+                await apply_index_updates(db)
+            except Exception as e:
+                await db.rollback()
+                results[company_id] = e
+    await save_index()
+    return results
+
+
+async def _derive_descriptions(jobs: List[JobSchema], existing_hashes: Dict[str, Optional[str]]) -> None:
+    """
+    Derives sanitized HTML, plain text and snippet for new or changed descriptions,
+    off the event loop in CPU stage batches. Unchanged descriptions keep their stored fields.
+    """
+    changed = []
+    for job in jobs:
+        job.description_hash = content_hash(job.description)
+        if job.external_id not in existing_hashes or existing_hashes[job.external_id] != job.description_hash:
+            changed.append(job)
+
+    derived = await cpu_stage.map(derive_batch, [job.description for job in changed])
+    for job, (html, text, snippet) in zip(changed, derived):
+        job.description = html
+        job.description_text = text
+        job.description_snippet = snippet
+
+
+def _new_job(company_id: UUID, job_data: JobSchema) -> Job:
+    return Job(
         company_id=company_id,
         external_id=job_data.external_id,
         title=job_data.title,
         url=job_data.url,
         location=job_data.location,
         city=job_data.city,
+        country_code=job_data.country_code,
+        latitude=job_data.latitude,
+        longitude=job_data.longitude,
+        location_key=job_data.location_key,
         description=job_data.description,
+        description_text=job_data.description_text,
+        description_snippet=job_data.description_snippet,
+        description_hash=job_data.description_hash,
         published_at=job_data.published_at,
         raw_data=job_data.raw_data,
     )
-    return await job_repo.create(db, job)
 
 
-async def _update_job(db: AsyncSession, company_id: UUID, job_data: JobSchema) -> None:
-    job = await job_repo.get_by_external_id(db, company_id, job_data.external_id)
-    if not job:
-        return
+# Fields saved searches match on (besides the description): a change re-runs percolation
+MATCHED_FIELDS = ("title", "location", "city", "country_code", "location_key")
 
+
+def _update_job(job: Job, job_data: JobSchema) -> Optional[Job]:
+    """Updates a stored job; returns it when its description or a matched field changed."""
+    changed = job.description_hash != job_data.description_hash or any(
+        getattr(job, field) != getattr(job_data, field) for field in MATCHED_FIELDS
+    )
     job.title = job_data.title
     job.url = job_data.url
     job.location = job_data.location
     job.city = job_data.city
-    job.description = job_data.description
+    job.country_code = job_data.country_code
+    job.latitude = job_data.latitude
+    job.longitude = job_data.longitude
+    job.location_key = job_data.location_key
+    if job.description_hash != job_data.description_hash:
+        job.description = job_data.description
+        job.description_text = job_data.description_text
+        job.description_snippet = job_data.description_snippet
+        job.description_hash = job_data.description_hash
     job.published_at = job_data.published_at
     job.raw_data = job_data.raw_data
     job.last_scanned_at = datetime.now(timezone.utc)
+    return job if changed else None
@@ -0,0 +1,350 @@
+import asyncio
+import fcntl
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+from loguru import logger
+from sklearn.cluster import MiniBatchKMeans
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.job import Job, JobStatus
+from app.providers.scrapers.embedding import DIM, embed, embed_batch
+from app.repositories import job_repository as job_repo
+from app.services.relevance_service import relevance_text
+from app.workers.cpu_stage import cpu_stage
+
+
+class JobVectorIndex:
+    """
+    Persisted IVF (inverted file) index over job text vectors, CPU-only.
+    Vectors are partitioned by k-means centroids; a query scans only the `nprobe`
+    closest partitions. Below `train_threshold` vectors (or before the first training)
+    every live vector is scanned. Updates are incremental: upserts are assigned to the
+    nearest centroid, removals are tombstoned and dropped at the next (re)training.
+    Row storage grows geometrically, so appends don't copy the whole matrix.
+    The file is re-read when another process replaces it (its mtime changes), and this
+    process's unsaved updates are re-applied on top; saves hold a file lock and merge the
+    same way, so processes sharing the file don't drop each other's updates.
+    """
+
+    def __init__(self, path: str, nprobe: int, train_threshold: int, save_every: int):
+        self.path = Path(path)
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+        self.save_every = save_every
+
+        self._lock = threading.RLock()
+        self._loaded = False
+        # mtime (ns) of the file this state was loaded from or saved to
+        self._mtime: Optional[int] = None
+        # Updates not yet in the file, by job id (None: removed); re-applied after a reload
+        self._pending: Dict[UUID, Optional[np.ndarray]] = {}
+        # Set by reset(): the next save replaces the file instead of merging with it
+        self._authoritative = False
+        self._clear()
+
+    def _clear(self) -> None:
+        self._ids: List[UUID] = []
+        self._rows: Dict[UUID, int] = {}
+        self._vectors = np.zeros((0, DIM), dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._lists = np.zeros(0, dtype=np.int32)
+        self._centroids: Optional[np.ndarray] = None
+        self._trained_size = 0
+        self._unsaved = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load()
+            return int(self._alive[:self._size].sum())
+
+    @property
+    def _size(self) -> int:
+        return len(self._ids)
+
+    @property
+    def dirty(self) -> bool:
+        return self._unsaved > 0
+
+    # --- Persistence -----------------------------------------------------------
+
+    def _file_mtime(self) -> Optional[int]:
+        try:
+            return self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _load(self) -> None:
+        mtime = self._file_mtime()
+        if self._loaded and (mtime is None or mtime == self._mtime or self._authoritative):
+            return
+        self._loaded = True
+        self._mtime = mtime
+        if mtime is None:
+            return
+
+        self._clear()
+        with np.load(self.path, allow_pickle=False) as data:
+            self._ids = [UUID(job_id) for job_id in data["ids"]]
+            self._vectors = data["vectors"]
+            self._alive = data["alive"]
+            self._lists = data["lists"]
+            self._centroids = data["centroids"] if data["centroids"].size else None
+            self._trained_size = int(data["trained_size"])
+        self._rows = {job_id: row for row, job_id in enumerate(self._ids)}
+        self._replay_pending()
+        logger.info("Loaded job similarity index ({} vectors) from {}", len(self), self.path)
+
+    def _replay_pending(self) -> None:
+        upserts = {job_id: vector for job_id, vector in self._pending.items() if vector is not None}
+        if upserts:
+            self._apply_upsert(list(upserts), np.stack(list(upserts.values())))
+        self._apply_remove([job_id for job_id, vector in self._pending.items() if vector is None])
+        self._unsaved = len(self._pending)
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Exclusive lock across processes sharing the index file."""
+        with open(self.path.with_suffix(".lock"), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def save(self) -> None:
+        """
+        Writes the index atomically under the file lock. If another process saved since
+        this one last read the file, it is re-read first and the pending updates re-applied.
+        """
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._file_lock():
+                self._load()
+                tmp = self.path.with_suffix(".tmp.npz")
+                np.savez(
+                    tmp,
+                    ids=np.array([str(job_id) for job_id in self._ids]),
+                    vectors=self._vectors[:self._size],
+                    alive=self._alive[:self._size],
+                    lists=self._lists[:self._size],
+                    centroids=self._centroids if self._centroids is not None else np.zeros((0, DIM), dtype=np.float32),
+                    trained_size=self._trained_size,
+                )
+                tmp.replace(self.path)
+                self._mtime = self._file_mtime()
+            self._unsaved = 0
+            self._pending.clear()
+            self._authoritative = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._clear()
+            self._pending.clear()
+            self._loaded = True
+            self._mtime = None
+            self._authoritative = True
+            self.path.unlink(missing_ok=True)
+
+    # --- Updates ---------------------------------------------------------------
+
+    def upsert(self, job_ids: Sequence[UUID], vectors: np.ndarray) -> None:
+        if not len(job_ids):
+            return
+        with self._lock:
+            self._load()
+            self._apply_upsert(job_ids, vectors)
+            if not self._authoritative:
+                self._pending.update(zip(job_ids, vectors))
+            self._after_update(len(job_ids))
+
+    def _apply_upsert(self, job_ids: Sequence[UUID], vectors: np.ndarray) -> None:
+        new_ids = [job_id for job_id in dict.fromkeys(job_ids) if job_id not in self._rows]
+        if new_ids:
+            self._reserve(self._size + len(new_ids))
+            self._rows.update({job_id: self._size + i for i, job_id in enumerate(new_ids)})
+            self._ids.extend(new_ids)
+
+        rows = np.array([self._rows[job_id] for job_id in job_ids])
+        self._vectors[rows] = vectors
+        self._alive[rows] = True
+        if self._centroids is not None:
+            self._lists[rows] = np.argmax(vectors @ self._centroids.T, axis=1)
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._vectors)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity, 1024)
+        self._vectors = np.resize(self._vectors, (capacity, DIM))
+        self._alive = np.concatenate([self._alive, np.zeros(capacity - len(self._alive), dtype=bool)])
+        self._lists = np.resize(self._lists, capacity)
+
+    def remove(self, job_ids: Sequence[UUID]) -> None:
+        with self._lock:
+            self._load()
+            removed = self._apply_remove(job_ids)
+            if not self._authoritative:
+                # Kept even for ids unknown here: another process may hold them unsaved
+                self._pending.update(dict.fromkeys(job_ids))
+            if removed:
+                self._after_update(removed)
+
+    def _apply_remove(self, job_ids: Sequence[UUID]) -> int:
+        rows = [self._rows[job_id] for job_id in job_ids if job_id in self._rows]
+        if rows:
+            self._alive[rows] = False
+        return len(rows)
+
+    def _after_update(self, changed: int) -> None:
+        size = len(self)
+        # Re-partition whenever the index has doubled since the last training
+        if size >= self.train_threshold and (self._centroids is None or size >= 2 * self._trained_size):
+            self.train()
+        self._unsaved += changed
+        if self._unsaved >= self.save_every:
+            self.save()
+
+    def train(self) -> None:
+        """Drops tombstones and re-partitions the live vectors with k-means (sqrt(n) lists)."""
+        with self._lock:
+            self._load()
+            keep = np.flatnonzero(self._alive[:self._size])
+            self._ids = [self._ids[row] for row in keep]
+            self._rows = {job_id: row for row, job_id in enumerate(self._ids)}
+            self._vectors = self._vectors[keep]
+            self._alive = np.ones(len(keep), dtype=bool)
+            self._trained_size = len(keep)
+
+            if len(keep) < self.train_threshold:
+                self._centroids = None
+                self._lists = np.zeros(len(keep), dtype=np.int32)
+                return
+
+            n_lists = min(4096, int(np.sqrt(len(keep))))
+            kmeans = MiniBatchKMeans(n_clusters=n_lists, batch_size=4096, n_init=1, random_state=0).fit(self._vectors)
+            centroids = kmeans.cluster_centers_.astype(np.float32)
+            centroids /= np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12)
+            self._centroids = centroids
+            self._lists = np.argmax(self._vectors @ centroids.T, axis=1).astype(np.int32)
+            logger.info("Trained job similarity index: {} vectors in {} lists", len(keep), n_lists)
+
+    # --- Queries ---------------------------------------------------------------
+
+    def vector_of(self, job_id: UUID) -> Optional[np.ndarray]:
+        with self._lock:
+            self._load()
+            row = self._rows.get(job_id)
+            return self._vectors[row].copy() if row is not None and self._alive[row] else None
+
+    def search(self, vector: np.ndarray, k: int, exclude: Sequence[UUID] = ()) -> List[Tuple[UUID, float]]:
+        """Top-k live (job_id, cosine similarity) pairs, best first."""
+        with self._lock:
+            self._load()
+            candidates = self._alive[:self._size].copy()
+            if self._centroids is not None:
+                probe = np.argsort(self._centroids @ vector)[-self.nprobe:]
+                candidates &= np.isin(self._lists[:self._size], probe)
+            for job_id in exclude:
+                if job_id in self._rows:
+                    candidates[self._rows[job_id]] = False
+
+            rows = np.flatnonzero(candidates)
+            if not len(rows):
+                return []
+            scores = self._vectors[rows] @ vector
+            top = np.argpartition(scores, -k)[-k:] if len(rows) > k else np.arange(len(rows))
+            top = top[np.argsort(-scores[top])]
+            return [(self._ids[rows[i]], float(scores[i])) for i in top]
+
+
+similarity_index = JobVectorIndex(
+    settings.SIMILARITY_INDEX_PATH,
+    nprobe=settings.SIMILARITY_INDEX_NPROBE,
+    train_threshold=settings.SIMILARITY_INDEX_TRAIN_THRESHOLD,
+    save_every=settings.SIMILARITY_INDEX_SAVE_EVERY,
+)
+
+
+def _pending_updates(db: AsyncSession) -> List[Tuple[List[UUID], Optional[np.ndarray]]]:
+    return db.info.setdefault("similarity_updates", [])
+
+
+async def index_jobs(db: AsyncSession, jobs: List[Job]) -> None:
+    """
+    Embeds new/changed jobs in the CPU stage and queues their upsert on the session;
+    apply_index_updates adds them to the index once the session has committed.
+    """
+    if not jobs:
+        return
+    vectors = await cpu_stage.map(embed_batch, [relevance_text(job.title, job.description_text) for job in jobs])
+    _pending_updates(db).append(([job.id for job in jobs], np.array(vectors, dtype=np.float32)))
+
+
+async def unindex_jobs(db: AsyncSession, job_ids: Sequence[UUID]) -> None:
+    """Queues the removal of jobs from the index until the session has committed."""
+    if job_ids:
+        _pending_updates(db).append((list(job_ids), None))
+
+
+async def apply_index_updates(db: AsyncSession) -> None:
+    """
+    Applies the index updates queued on `db`, in order. Call it after the session's commit,
+    so a rolled-back scrape leaves no vectors behind; a discarded session drops its queue.
+    """
+    for job_ids, vectors in db.info.pop("similarity_updates", []):
+        if vectors is None:
+            await asyncio.to_thread(similarity_index.remove, job_ids)
+        else:
+            await asyncio.to_thread(similarity_index.upsert, job_ids, vectors)
+
+
+async def save_index() -> None:
+    """Saves the index if it has unsaved updates."""
+    if similarity_index.dirty:
+        await asyncio.to_thread(similarity_index.save)
+
+
+async def get_similar_jobs(db: AsyncSession, job: Job, k: int = 10) -> List[Tuple[Job, float]]:
+    """
+    Top-k non-archived jobs most similar to `job`, across all companies. Index lookups run
+    in a worker thread: they can wait on a (re)load or a k-means training holding the lock.
+    """
+    vector = await asyncio.to_thread(similarity_index.vector_of, job.id)
+    if vector is None:
+        vector = (await asyncio.to_thread(embed, [relevance_text(job.title, job.description_text)]))[0]
+
+    hits = await asyncio.to_thread(similarity_index.search, vector, k, [job.id])
+    jobs = {found.id: found for found in await job_repo.get_by_ids(db, [job_id for job_id, _ in hits])}
+    return [
+        (jobs[job_id], score) for job_id, score in hits
+        if job_id in jobs and jobs[job_id].status != JobStatus.ARCHIVED
+    ]
+
+
+async def rebuild_index(batch_size: int = 1000) -> int:
+    """Rebuilds the similarity index from every non-archived job. Returns the number indexed."""
+    similarity_index.reset()
+    indexed = 0
+    after_id = None
+
+    while True:
+        async with AsyncSessionLocal() as db:
+            rows = await job_repo.get_texts_page(db, after_id, batch_size, exclude_status=JobStatus.ARCHIVED)
+        if not rows:
+            break
+
+        vectors = await cpu_stage.map(embed_batch, [relevance_text(title, text) for _, title, text in rows])
+        similarity_index.upsert([job_id for job_id, _, _ in rows], np.array(vectors, dtype=np.float32))
+        indexed += len(rows)
+        after_id = rows[-1][0]
+
+    await asyncio.to_thread(similarity_index.train)
+    similarity_index.save()
+    return indexed
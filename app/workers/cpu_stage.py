@@ -0,0 +1,70 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+from loguru import logger
+
+from app.core.config import settings
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class CPUStage:
+    """
+    Offloads CPU-bound batch work (HTML parsing, sanitization) to a process pool
+    so it doesn't stall the event loop shared by concurrent scrapes and API requests.
+    Items are split into batches and at most `max_pending` batches are in flight
+    across all callers; further callers wait for a free slot.
+    With `workers=0` batches run inline on the loop (tests, one-off scripts).
+    """
+
+    def __init__(self, workers: int, batch_size: int, max_pending: int):
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def start(self) -> None:
+        if self._slots is not None:
+            return
+        self._slots = asyncio.Semaphore(self.max_pending)
+        if self.workers > 0:
+            # spawn: forking a process with a running loop and client threads is unsafe
+            self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+            logger.info("Started CPU stage with {} worker processes", self.workers)
+
+    def stop(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+        self._slots = None
+
+    async def map(self, fn: Callable[[List[T]], List[R]], items: Sequence[T]) -> List[R]:
+        """
+        Applies a batch function over `items` and returns the results in input order.
+        `fn` must be a picklable module-level function mapping a list to an equal-length list.
+        """
+        if not items:
+            return []
+        self.start()
+
+        batches = [list(items[i:i + self.batch_size]) for i in range(0, len(items), self.batch_size)]
+        results = await asyncio.gather(*(self._run_batch(fn, batch) for batch in batches))
+        return [result for batch_result in results for result in batch_result]
+
+    async def _run_batch(self, fn: Callable[[List[T]], List[R]], batch: List[T]) -> List[R]:
+        async with self._slots:
+            if self._executor is None:
+                return fn(batch)
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, batch)
+
+
+cpu_stage = CPUStage(
+    workers=settings.CPU_STAGE_WORKERS,
+    batch_size=settings.CPU_STAGE_BATCH_SIZE,
+    max_pending=settings.CPU_STAGE_MAX_PENDING_BATCHES,
+)
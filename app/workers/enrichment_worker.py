@@ -0,0 +1,123 @@
+import asyncio
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from loguru import logger
+
+from app.core import metrics, tracing
+from app.core.config import settings
+from app.core.exceptions import EnrichmentRateLimitError
+from app.db.session import AsyncSessionLocal
+from app.repositories import enrichment_task_repository as task_repo
+from app.services.enrichment_service import run_enrichment_for_company
+from app.workers.rate_limiter import AsyncRateLimiter
+
+
+class EnrichmentWorkerPool:
+    """
+    In-process workers that drain enrichment tasks one company at a time.
+    All workers share one rate budget; a rate-limited company pauses the whole
+    budget for a cooldown and is retried up to `max_attempts` times.
+    """
+
+    def __init__(self, concurrency: int, limiter: AsyncRateLimiter, cooldown: float, max_attempts: int):
+        self.concurrency = concurrency
+        self.limiter = limiter
+        self.cooldown = cooldown
+        self.max_attempts = max_attempts
+
+        self._queue: Optional[asyncio.Queue[Tuple[UUID, UUID, int]]] = None
+        self._workers: List[asyncio.Task] = []
+        # task_id -> traceparent of the request that submitted it, continued by worker spans
+        self._traceparents: Dict[UUID, str] = {}
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._workers = [asyncio.create_task(self._run(i)) for i in range(self.concurrency)]
+        await self._recover()
+        logger.info("Started {} enrichment workers", self.concurrency)
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def submit(self, task_id: UUID, company_ids: Iterable[UUID]) -> None:
+        span = tracing.current_span()
+        if span is not None:
+            self._traceparents[task_id] = span.traceparent
+        for company_id in company_ids:
+            self._queue.put_nowait((task_id, company_id, 1))
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+    async def _recover(self) -> None:
+        """Re-queues companies of tasks left unfinished by a previous process."""
+        async with AsyncSessionLocal() as db:
+            tasks = await task_repo.get_unfinished(db)
+
+        for task in tasks:
+            remaining = [UUID(cid) for cid in task.company_ids if cid not in task.results]
+            if remaining:
+                logger.info("Resuming enrichment task {} ({} companies left)", task.id, len(remaining))
+                self.submit(task.id, remaining)
+
+    async def _run(self, worker_id: int) -> None:
+        while True:
+            task_id, company_id, attempt = await self._queue.get()
+            try:
+                with tracing.span(
+                    "enrichment", traceparent=self._traceparents.get(task_id),
+                    **{"enrichment.task_id": str(task_id), "company.id": str(company_id), "enrichment.attempt": attempt},
+                ):
+                    await self._process(task_id, company_id, attempt)
+            except Exception as e:
+                logger.error("Enrichment worker {} failed on company {}: {}", worker_id, company_id, e)
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, task_id: UUID, company_id: UUID, attempt: int) -> None:
+        await self.limiter.acquire()
+
+        async with AsyncSessionLocal() as db:
+            await task_repo.mark_running(db, task_id)
+            await db.commit()
+
+            try:
+                company = await run_enrichment_for_company(db, company_id)
+                await db.commit()
+                outcome = {"status": "done", "company_status": company.status.value}
+                success = True
+            except EnrichmentRateLimitError as e:
+                await db.rollback()
+                cooldown = e.retry_after or self.cooldown
+                self.limiter.pause(cooldown)
+                if attempt < self.max_attempts:
+                    logger.warning("Rate limited enriching {}, pausing {:.0f}s (attempt {})", company_id, cooldown, attempt)
+                    self._queue.put_nowait((task_id, company_id, attempt + 1))
+                    return
+                outcome = {"status": "failed", "error": str(e)}
+                success = False
+            except Exception as e:
+                await db.rollback()
+                outcome = {"status": "failed", "error": str(e)}
+                success = False
+
+            await task_repo.record_result(db, task_id, company_id, outcome, success)
+            await db.commit()
+
+
+enrichment_workers = EnrichmentWorkerPool(
+    concurrency=settings.ENRICHMENT_WORKERS,
+    limiter=AsyncRateLimiter(rate=settings.ENRICHMENT_RATE_PER_MINUTE, per=60.0),
+    cooldown=settings.ENRICHMENT_RATE_LIMIT_COOLDOWN,
+    max_attempts=settings.ENRICHMENT_MAX_ATTEMPTS,
+)
+
+metrics.gauge(
+    "jobfinder_enrichment_queue_depth", "Companies waiting for an enrichment worker.",
+    function=lambda: enrichment_workers.queued,
+)
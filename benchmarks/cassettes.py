@@ -0,0 +1,86 @@
+"""
+Full-size scrapes from recorded cassettes, offline.
+
+With --record, the cassettes under tests/providers/cassettes are regenerated by
+scraping tenants of the in-process mock ATS (multi-page Workday lists, Workable and
+Comeet detail documents). Otherwise every cassette is replayed through its scraper
+and timed; --latency-scale 1 replays with the recorded per-request latency.
+
+    python -m benchmarks.cassettes --record
+    python -m benchmarks.cassettes --repeats 5 --latency-scale 1
+"""
+import argparse
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import httpx
+from loguru import logger
+
+from app.core import run_stats
+from app.models.company import ATSProvider, Company
+from app.providers.cassettes import use_cassette
+from app.providers.scrapers.factory import ScraperFactory
+from benchmarks.mock_ats import MockATSConfig, TenantSpec, create_app
+
+CASSETTE_DIR = Path(__file__).parent.parent / "tests" / "providers" / "cassettes"
+
+# Cassette file -> provider and company config; tenants match the mock ATS below
+CASSETTES: Dict[str, Tuple[ATSProvider, Dict[str, Any]]] = {
+    "comeet_acme.json": (ATSProvider.COMEET, {"uid": "comeet0", "token": "bench-token-5f2c9a"}),
+    "workday_acme.json": (ATSProvider.WORKDAY, {"careers_url": "https://acme.wd3.myworkdayjobs.com/en-US/workday0"}),
+    "workable_acme.json": (ATSProvider.WORKABLE, {"name": "workable0"}),
+}
+MOCK_ATS = MockATSConfig(
+    tenants=[TenantSpec("comeet", "comeet0", 30), TenantSpec("workday", "workday0", 45), TenantSpec("workable", "workable0", 15)],
+    latency_ms=20,
+    jitter_ms=10,
+    paragraphs=1,
+)
+
+
+def scraper_for(cassette: str):
+    provider, config = CASSETTES[cassette]
+    scraper = ScraperFactory.get_scraper(Company(name="Acme", ats_provider=provider, metadata_config=config))
+    scraper.pacing = False
+    return scraper
+
+
+async def record(directory: Path) -> None:
+    app = create_app(MOCK_ATS)
+    for name in CASSETTES:
+        with use_cassette(directory / name, mode="record", transport_factory=lambda: httpx.ASGITransport(app)) as cassette:
+            jobs = await scraper_for(name).fetch_jobs()
+        print(f"{name:<20} recorded {len(cassette.interactions)} exchanges, {len(jobs)} jobs")
+
+
+async def replay(directory: Path, repeats: int, latency_scale: float) -> None:
+    for name in CASSETTES:
+        timings = []
+        for _ in range(repeats):
+            with use_cassette(directory / name, mode="replay", latency_scale=latency_scale), \
+                    run_stats.track_run() as stats:
+                start = time.perf_counter()
+                jobs = await scraper_for(name).fetch_jobs()
+                timings.append(time.perf_counter() - start)
+        best = min(timings)
+        print(
+            f"{name:<20} {len(jobs)} jobs, {stats.http_requests} requests | best {best * 1000:8.1f} ms "
+            f"({len(jobs) / best if best else 0:.0f} jobs/s) | parse {stats.parse_seconds * 1000:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay (or re-record) scraper cassettes")
+    parser.add_argument("--record", action="store_true", help="Regenerate the cassettes from the mock ATS")
+    parser.add_argument("--directory", default=str(CASSETTE_DIR))
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--latency-scale", type=float, default=0.0, help="1 replays with the recorded latency")
+    args = parser.parse_args()
+
+    logger.disable("app")
+    if args.record:
+        asyncio.run(record(Path(args.directory)))
+    else:
+        asyncio.run(replay(Path(args.directory), args.repeats, args.latency_scale))
@@ -0,0 +1,305 @@
+"""
+Offline mock of the ATS endpoints our scrapers call:
+
+- Comeet:   GET  /careers-api/2.0/company/{uid}/positions
+- Workday:  GET  /en-US/{site_id}                      (landing page)
+            POST /wday/cxs/{tenant}/{site_id}/jobs     (list, limit must be 20)
+            GET  /wday/cxs/{tenant}/{site_id}/job/{id} (detail)
+- Workable: POST /api/v3/accounts/{slug}/jobs          (list)
+            GET  /api/v2/accounts/{slug}/jobs/{code}   (detail)
+
+Tenants, latency/jitter and fault injection (429, 5xx, WAF 403) are configured
+with a MockATSConfig. Run standalone with `python -m benchmarks.mock_ats --help`.
+"""
+import argparse
+import asyncio
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, JSONResponse
+
+WORKDAY_PAGE_SIZE = 20
+
+CITIES = ["Tel Aviv", "Haifa", "Jerusalem", "Herzliya", "Petah Tikva", "Beer Sheva"]
+TITLES = ["Backend Engineer", "Frontend Engineer", "Data Scientist", "DevOps Engineer", "Product Manager", "QA Engineer"]
+PARAGRAPH = (
+    "<p>We are looking for an experienced engineer to join a fast-growing team. "
+    "You will design, build and operate services used by millions of users.</p>"
+)
+
+
+@dataclass
+class TenantSpec:
+    provider: str
+    slug: str
+    jobs: int
+    waf_blocked: bool = False
+
+
+@dataclass
+class MockATSConfig:
+    tenants: List[TenantSpec] = field(default_factory=list)
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    rate_429: float = 0.0
+    rate_5xx: float = 0.0
+    paragraphs: int = 4
+    seed: int = 0
+
+    @classmethod
+    def build(
+        cls,
+        comeet: int = 0,
+        workday: int = 0,
+        workable: int = 0,
+        jobs_per_tenant: int = 100,
+        waf_tenants: int = 0,
+        **kwargs: Any,
+    ) -> "MockATSConfig":
+        """Generates `n` tenants per provider; the first `waf_tenants` of each provider are WAF-blocked."""
+        tenants = [
+            TenantSpec(provider, f"{provider}{i}", jobs_per_tenant, waf_blocked=i < waf_tenants)
+            for provider, count in (("comeet", comeet), ("workday", workday), ("workable", workable))
+            for i in range(count)
+        ]
+        return cls(tenants=tenants, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _description(paragraphs: int, index: int) -> Dict[str, str]:
+    body = PARAGRAPH * paragraphs
+    return {
+        "description": f"<div>{body}<ul>" + "".join(f"<li>Responsibility {i}</li>" for i in range(8)) + "</ul></div>",
+        "requirements": "<ul>" + "".join(f"<li>{i + 2}+ years with technology {index % 7}</li>" for i in range(6)) + "</ul>",
+        "benefits": "<p>Hybrid work, stock options, learning budget.</p>",
+    }
+
+
+def _posting(index: int, paragraphs: int) -> Dict[str, Any]:
+    return {
+        "index": index,
+        "title": f"{TITLES[index % len(TITLES)]} {index}",
+        "city": CITIES[index % len(CITIES)],
+        "published": (datetime(2026, 1, 1) + timedelta(hours=index)).isoformat() + "Z",
+        **_description(paragraphs, index),
+    }
+
+
+def generate_postings(count: int, paragraphs: int = 4) -> List[Dict[str, Any]]:
+    return [_posting(index, paragraphs) for index in range(count)]
+
+
+def comeet_position(p: Dict[str, Any], uid: str, base_url: str, with_details: bool = True) -> Dict[str, Any]:
+    position = {
+        "uid": f"{p['index']:04X}.{uid.upper()}",
+        "name": p["title"],
+        "url_active_page": f"{base_url}/jobs/{uid}/{p['index']:04X}",
+        "location": {"country": "Israel", "city": p["city"]},
+        "time_updated": p["published"],
+    }
+    if with_details:
+        position["details"] = [
+            {"name": "Description", "value": p["description"], "order": 1},
+            {"name": "Requirements", "value": p["requirements"], "order": 2},
+            {"name": "Benefits", "value": p["benefits"], "order": 3},
+        ]
+    return position
+
+
+def workday_summary(p: Dict[str, Any]) -> Dict[str, Any]:
+    return {"title": p["title"], "externalPath": f"/job/{p['index']}", "locationsText": f"{p['city']}, Israel"}
+
+
+def workday_detail(p: Dict[str, Any], site_id: str, base_url: str) -> Dict[str, Any]:
+    return {
+        "jobPostingInfo": {
+            "id": f"{site_id}-{p['index']}",
+            "jobReqId": f"R{p['index']:06d}",
+            "title": p["title"],
+            "jobDescription": p["description"] + p["requirements"],
+            "location": f"{p['city']}, Israel",
+            "startDate": p["published"][:10],
+            "externalUrl": f"{base_url}/en-US/{site_id}/job/{p['index']}",
+        }
+    }
+
+
+def workable_shortcode(p: Dict[str, Any], slug: str) -> str:
+    return f"{slug.upper()}{p['index']:05d}"
+
+
+def workable_detail(p: Dict[str, Any], slug: str) -> Dict[str, Any]:
+    return {
+        "id": 100000 + p["index"],
+        "shortcode": workable_shortcode(p, slug),
+        "title": p["title"],
+        "description": p["description"],
+        "requirements": p["requirements"],
+        "benefits": p["benefits"],
+        "location": {"city": p["city"], "country": "Israel", "countryCode": "IL"},
+        "published": p["published"],
+    }
+
+
+def create_app(config: MockATSConfig) -> FastAPI:
+    app = FastAPI(title="Mock ATS")
+    rng = random.Random(config.seed)
+    tenants = {(t.provider, t.slug): t for t in config.tenants}
+    stats: Counter = Counter()
+    postings_cache: Dict[str, List[Dict[str, Any]]] = {}
+
+    def postings(tenant: TenantSpec) -> List[Dict[str, Any]]:
+        if tenant.slug not in postings_cache:
+            postings_cache[tenant.slug] = generate_postings(tenant.jobs, config.paragraphs)
+        return postings_cache[tenant.slug]
+
+    async def gate(provider: str, slug: str) -> Optional[JSONResponse]:
+        """Applies latency and fault injection; returns an error response or None."""
+        stats["requests"] += 1
+        stats[f"{provider}.requests"] += 1
+
+        delay = config.latency_ms + rng.uniform(-config.jitter_ms, config.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        tenant = tenants.get((provider, slug))
+        if tenant is None:
+            stats["404"] += 1
+            return JSONResponse({"error": "not found"}, status_code=404)
+        if tenant.waf_blocked:
+            stats["403"] += 1
+            return JSONResponse({"error": "blocked"}, status_code=403)
+        if rng.random() < config.rate_429:
+            stats["429"] += 1
+            return JSONResponse({"error": "too many requests"}, status_code=429)
+        if rng.random() < config.rate_5xx:
+            stats["5xx"] += 1
+            return JSONResponse({"error": "upstream error"}, status_code=503)
+        return
+
+    # --- Comeet ---------------------------------------------------------------
+
+    @app.get("/careers-api/2.0/company/{uid}/positions")
+    async def read_comeet_positions(uid: str, request: Request, details: str = "false", limit: Optional[int] = None):
+        if error := await gate("comeet", uid):
+            return error
+
+        tenant = tenants[("comeet", uid)]
+        items = postings(tenant)[:limit] if limit else postings(tenant)
+        with_details = details.lower() == "true"
+        base_url = str(request.base_url).rstrip("/")
+        return [comeet_position(p, uid, base_url, with_details) for p in items]
+
+    # --- Workday --------------------------------------------------------------
+
+    @app.get("/en-US/{site_id}", response_class=HTMLResponse)
+    async def read_workday_landing(site_id: str):
+        if error := await gate("workday", site_id):
+            return error
+        return "<html><body>Careers</body></html>"
+
+    @app.post("/wday/cxs/{tenant_name}/{site_id}/jobs")
+    async def read_workday_jobs(tenant_name: str, site_id: str, request: Request):
+        if error := await gate("workday", site_id):
+            return error
+
+        payload = await request.json()
+        if payload.get("limit") != WORKDAY_PAGE_SIZE:
+            return JSONResponse({"error": "bad request"}, status_code=400)
+
+        offset = int(payload.get("offset", 0))
+        items = postings(tenants[("workday", site_id)])
+        return {
+            "total": len(items),
+            "jobPostings": [workday_summary(p) for p in items[offset:offset + WORKDAY_PAGE_SIZE]],
+        }
+
+    @app.get("/wday/cxs/{tenant_name}/{site_id}/job/{index}")
+    async def read_workday_detail(tenant_name: str, site_id: str, index: int, request: Request):
+        if error := await gate("workday", site_id):
+            return error
+
+        p = postings(tenants[("workday", site_id)])[index]
+        return workday_detail(p, site_id, str(request.base_url).rstrip("/"))
+
+    # --- Workable -------------------------------------------------------------
+
+    @app.post("/api/v3/accounts/{slug}/jobs")
+    async def read_workable_jobs(slug: str):
+        if error := await gate("workable", slug):
+            return error
+
+        items = postings(tenants[("workable", slug)])
+        return {
+            "total": len(items),
+            "results": [{"shortcode": workable_shortcode(p, slug), "title": p["title"]} for p in items],
+        }
+
+    @app.get("/api/v2/accounts/{slug}/jobs/{shortcode}")
+    async def read_workable_detail(slug: str, shortcode: str):
+        if error := await gate("workable", slug):
+            return error
+
+        index = int(shortcode[-5:])
+        return workable_detail(postings(tenants[("workable", slug)])[index], slug)
+
+    # --- Introspection --------------------------------------------------------
+
+    @app.get("/_stats")
+    async def read_stats():
+        return dict(stats)
+
+    @app.post("/_reset")
+    async def reset_stats():
+        stats.clear()
+        return {}
+
+    return app
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--comeet", type=int, default=4, help="Number of Comeet tenants")
+    parser.add_argument("--workday", type=int, default=2, help="Number of Workday tenants")
+    parser.add_argument("--workable", type=int, default=2, help="Number of Workable tenants")
+    parser.add_argument("--jobs-per-tenant", type=int, default=100)
+    parser.add_argument("--waf-tenants", type=int, default=0, help="WAF-blocked tenants per provider")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-5xx", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def config_from_args(args: argparse.Namespace) -> MockATSConfig:
+    return MockATSConfig.build(
+        comeet=args.comeet,
+        workday=args.workday,
+        workable=args.workable,
+        jobs_per_tenant=args.jobs_per_tenant,
+        waf_tenants=args.waf_tenants,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_429=args.rate_429,
+        rate_5xx=args.rate_5xx,
+        seed=args.seed,
+    )
+
+
+def serve(config: MockATSConfig, host: str = "127.0.0.1", port: int = 8100) -> None:
+    import uvicorn
+
+    uvicorn.run(create_app(config), host=host, port=port, log_level="warning", access_log=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the offline mock ATS server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+    serve(config_from_args(args), args.host, args.port)
@@ -0,0 +1,171 @@
+"""
+Micro-benchmarks for provider parsers and JobSchema validation.
+
+Runs each case over realistic generated fixtures (5k Comeet positions with
+multi-section HTML details, Workday and Workable detail documents), reports
+per-posting CPU cost and allocations, and compares against a stored baseline.
+
+    python -m benchmarks.parsers                   # compare against the baseline
+    python -m benchmarks.parsers --save-baseline   # record a new baseline
+
+The committed baseline (benchmarks/baselines/parsers.json) was recorded on a
+development machine; timings are only comparable on the same hardware, so
+re-record it (make bench-parsers-baseline) before comparing elsewhere.
+"""
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from loguru import logger
+
+from app.providers.scrapers.comeet_scraper import ComeetScraper
+from app.providers.scrapers.description import derive_batch
+from app.providers.scrapers.workable_scraper import WorkableScraper
+from app.providers.scrapers.workday_scraper import WorkdayScraper
+from app.schemas.job import JobSchema, validate_jobs
+from benchmarks.mock_ats import (
+    comeet_position,
+    generate_postings,
+    workable_detail,
+    workday_detail,
+    workday_summary,
+)
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "parsers.json"
+BASE_URL = "https://bench.example"
+
+
+@dataclass
+class Case:
+    name: str
+    postings: int
+    run: Callable[[], Any]
+
+
+def build_cases(count: int) -> List[Case]:
+    postings = generate_postings(count)
+
+    comeet = ComeetScraper("bench", {"uid": "bench", "token": "bench"})
+    comeet_positions = [comeet_position(p, "bench", BASE_URL) for p in postings]
+    comeet_descriptions = [comeet._parse_details(pos["details"]) for pos in comeet_positions]
+
+    workday = WorkdayScraper("bench", {"careers_url": f"{BASE_URL}/en-US/bench"})
+    workday_docs = [(workday_summary(p), workday_detail(p, "bench", BASE_URL)) for p in postings]
+
+    workable = WorkableScraper("bench", {"name": "bench"})
+    workable_docs = [workable_detail(p, "bench") for p in postings]
+
+    schema_kwargs = [
+        {
+            "title": p["title"],
+            "external_id": str(p["index"]),
+            "url": f"{BASE_URL}/{p['index']}",
+            "location": "Israel",
+            "city": p["city"],
+            "description": p["description"],
+            "published_at": p["published"],
+            "raw_data": position,
+        }
+        for p, position in zip(postings, comeet_positions)
+    ]
+
+    return [
+        Case("comeet.parse_jobs", count, lambda: comeet._parse_jobs(comeet_positions)),
+        Case("comeet.parse_details", count, lambda: [comeet._parse_details(pos["details"]) for pos in comeet_positions]),
+        Case("workday.parse_detail", count, lambda: validate_jobs([
+            workday._detail_payload(summary, detail, BASE_URL) for summary, detail in workday_docs
+        ])),
+        Case("workable.parse_detail", count, lambda: validate_jobs([
+            workable._detail_payload(doc, doc["shortcode"], doc["title"]) for doc in workable_docs
+        ])),
+        Case("schema.validate", count, lambda: [JobSchema(**kwargs) for kwargs in schema_kwargs]),
+        Case("schema.validate_batch", count, lambda: validate_jobs(schema_kwargs)),
+        Case("description.derive", count, lambda: derive_batch(comeet_descriptions)),
+    ]
+
+
+def measure(case: Case, repeats: int) -> Dict[str, float]:
+    """Best-of-`repeats` wall time per posting, plus peak and retained traced memory per posting."""
+    case.run()  # warm-up
+
+    timings = []
+    for _ in range(repeats):
+        gc.collect()
+        started = time.perf_counter()
+        case.run()
+        timings.append(time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = case.run()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return {
+        "us_per_posting": min(timings) / case.postings * 1e6,
+        "peak_bytes_per_posting": (peak - before) / case.postings,
+        "retained_bytes_per_posting": (current - before) / case.postings,
+    }
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float) -> List[str]:
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            reference = baseline.get(name, {}).get(metric)
+            if reference and value > reference * (1 + threshold):
+                regressions.append(f"{name}.{metric}: {value:.1f} vs baseline {reference:.1f} (+{(value / reference - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(args: argparse.Namespace) -> int:
+    logger.disable("app")
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    if not baseline and not args.save_baseline:
+        print(f"No baseline at {baseline_path}; record one with --save-baseline")
+
+    results = {}
+    for case in build_cases(args.postings):
+        if args.only and not any(case.name.startswith(prefix) for prefix in args.only):
+            continue
+        results[case.name] = metrics = measure(case, args.repeats)
+
+        reference = baseline.get(case.name, {}).get("us_per_posting")
+        delta = f" ({(metrics['us_per_posting'] / reference - 1) * 100:+.0f}% vs baseline)" if reference else ""
+        print(
+            f"{case.name:<24} {metrics['us_per_posting']:8.2f} us/posting{delta:<22} "
+            f"peak {metrics['peak_bytes_per_posting'] / 1024:7.2f} KiB/posting  "
+            f"retained {metrics['retained_bytes_per_posting'] / 1024:7.2f} KiB/posting"
+        )
+
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps({**baseline, **results}, indent=2, sort_keys=True))
+        print(f"Baseline saved to {baseline_path}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Provider parser and schema validation micro-benchmarks")
+    parser.add_argument("--postings", type=int, default=5000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--only", nargs="*", help="Run only cases whose name starts with one of these prefixes")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed slowdown before flagging a regression")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,201 @@
+"""
+End-to-end scrape throughput benchmark against the offline mock ATS server.
+
+Seeds ACTIVE benchmark companies pointing at a local mock server (started in a
+child process), scrapes them through `run_scrape_for_company` (sequentially) and
+`run_scrape_fleet` (concurrently) against the configured Postgres, and reports
+jobs/sec, requests/job, p50/p95 per-company latency and peak RSS.
+Benchmark companies are deleted afterwards.
+
+    python -m benchmarks.scrape_throughput --comeet 20 --workday 5 --workable 5 --jobs-per-tenant 200
+"""
+import argparse
+import asyncio
+import multiprocessing
+import resource
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List
+from uuid import UUID
+
+import httpx
+from sqlalchemy import func, select
+
+from app.core.log import configure_logging
+from app.db.session import AsyncSessionLocal
+from app.models.company import ATSProvider, Company, CompanyStatus
+from app.models.job import Job
+from app.providers.scrapers.comeet_scraper import ComeetScraper
+from app.providers.scrapers.workable_scraper import WorkableScraper
+from app.repositories import company_repository as company_repo
+from app.services.scraping_service import run_scrape_for_company, run_scrape_fleet
+from app.services.similarity_service import apply_index_updates
+from benchmarks.mock_ats import MockATSConfig, add_config_arguments, config_from_args, serve
+
+BENCH_PREFIX = "bench-"
+
+
+@dataclass
+class RunReport:
+    mode: str
+    companies: int
+    jobs: int
+    requests: int
+    failures: int
+    wall_seconds: float
+    latencies: List[float] = field(default_factory=list)
+
+    def render(self) -> str:
+        latencies = sorted(self.latencies) or [0.0]
+        p95 = latencies[min(len(latencies) - 1, int(round(0.95 * (len(latencies) - 1))))]
+        return (
+            f"[{self.mode}] {self.companies} companies, {self.jobs} jobs in {self.wall_seconds:.2f}s | "
+            f"{self.jobs / self.wall_seconds if self.wall_seconds else 0:.1f} jobs/s | "
+            f"{self.requests / self.jobs if self.jobs else 0:.2f} requests/job | "
+            f"p50 {statistics.median(latencies):.2f}s p95 {p95:.2f}s per company | "
+            f"{self.failures} failed"
+        )
+
+
+def point_scrapers_at(base_url: str) -> None:
+    ComeetScraper.BASE_URL = f"{base_url}/careers-api/2.0/company"
+    WorkableScraper.BASE_URL = base_url
+
+
+async def seed_companies(config: MockATSConfig, base_url: str, run_tag: str) -> List[UUID]:
+    companies = []
+    for tenant in config.tenants:
+        if tenant.provider == "comeet":
+            provider, metadata = ATSProvider.COMEET, {"uid": tenant.slug, "token": "bench"}
+        elif tenant.provider == "workday":
+            provider, metadata = ATSProvider.WORKDAY, {"careers_url": f"{base_url}/en-US/{tenant.slug}"}
+        else:
+            provider, metadata = ATSProvider.WORKABLE, {"name": tenant.slug}
+
+        companies.append(Company(
+            name=f"{BENCH_PREFIX}{run_tag}-{tenant.slug}",
+            ats_provider=provider,
+            metadata_config=metadata,
+            status=CompanyStatus.ACTIVE,
+        ))
+
+    async with AsyncSessionLocal() as db:
+        await company_repo.create_many(db, companies, batch_size=500)
+        await db.commit()
+    return [company.id for company in companies]
+
+
+async def cleanup(company_ids: List[UUID]) -> None:
+    async with AsyncSessionLocal() as db:
+        for company in await company_repo.get_by_ids(db, company_ids):
+            await company_repo.delete(db, company)
+        await db.commit()
+
+
+async def count_jobs(company_ids: List[UUID]) -> int:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(func.count()).select_from(Job).where(Job.company_id.in_(company_ids)))
+        return result.scalar_one()
+
+
+async def mock_stats(client: httpx.AsyncClient, reset: bool = False) -> Dict[str, int]:
+    if reset:
+        await client.post("/_reset")
+        return {}
+    return (await client.get("/_stats")).json()
+
+
+async def bench_sequential(company_ids: List[UUID], client: httpx.AsyncClient) -> RunReport:
+    await mock_stats(client, reset=True)
+    latencies, failures = [], 0
+
+    started = time.perf_counter()
+    for company_id in company_ids:
+        company_started = time.perf_counter()
+        async with AsyncSessionLocal() as db:
+            try:
+                await run_scrape_for_company(db, company_id)
+                await db.commit()
+                await apply_index_updates(db)
+            except Exception:
+                await db.rollback()
+                failures += 1
+        latencies.append(time.perf_counter() - company_started)
+    wall = time.perf_counter() - started
+
+    stats = await mock_stats(client)
+    return RunReport("sequential", len(company_ids), await count_jobs(company_ids), stats.get("requests", 0), failures, wall, latencies)
+
+
+async def bench_fleet(company_ids: List[UUID], client: httpx.AsyncClient, concurrency: int) -> RunReport:
+    await mock_stats(client, reset=True)
+
+    durations: Dict[UUID, float] = {}
+    started = time.perf_counter()
+    results = await run_scrape_fleet(company_ids, concurrency=concurrency, durations=durations)
+    wall = time.perf_counter() - started
+
+    stats = await mock_stats(client)
+    failures = sum(1 for outcome in results.values() if isinstance(outcome, Exception))
+    return RunReport(
+        f"fleet x{concurrency}", len(company_ids), await count_jobs(company_ids), stats.get("requests", 0), failures,
+        wall, list(durations.values()),
+    )
+
+
+async def wait_for_server(client: httpx.AsyncClient, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            await client.get("/_stats")
+            return
+        except httpx.TransportError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+async def main(args: argparse.Namespace) -> None:
+    config = config_from_args(args)
+    base_url = f"http://127.0.0.1:{args.port}"
+    point_scrapers_at(base_url)
+
+    server = multiprocessing.Process(target=serve, args=(config, "127.0.0.1", args.port), daemon=True)
+    server.start()
+    seeded: List[UUID] = []
+
+    try:
+        async with httpx.AsyncClient(base_url=base_url) as client:
+            await wait_for_server(client)
+            reports = []
+
+            if not args.skip_sequential:
+                company_ids = await seed_companies(config, base_url, "seq")
+                seeded += company_ids
+                reports.append(await bench_sequential(company_ids, client))
+
+            for concurrency in args.fleet_concurrency:
+                company_ids = await seed_companies(config, base_url, f"fleet{concurrency}")
+                seeded += company_ids
+                reports.append(await bench_fleet(company_ids, client, concurrency))
+
+        for report in reports:
+            print(report.render())
+        print(f"peak RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MiB")
+    finally:
+        if seeded and not args.keep:
+            await cleanup(seeded)
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    configure_logging()
+    parser = argparse.ArgumentParser(description="Scrape throughput benchmark against the mock ATS server")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--fleet-concurrency", type=int, nargs="*", default=[8])
+    parser.add_argument("--skip-sequential", action="store_true")
+    parser.add_argument("--keep", action="store_true", help="Keep seeded benchmark companies")
+    add_config_arguments(parser)
+    asyncio.run(main(parser.parse_args()))
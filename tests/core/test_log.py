@@ -0,0 +1,62 @@
+from loguru import logger
+
+from app.core.log import RecordFilter, dropped_records
+
+
+def _capture(record_filter):
+    messages = []
+    handler_id = logger.add(lambda message: messages.append(message.record), filter=record_filter, level="DEBUG")
+    return messages, handler_id
+
+
+def test_rate_limit_is_per_call_site_and_reports_suppressed_records():
+    record_filter = RecordFilter(limit=3, window=60)
+    messages, handler_id = _capture(record_filter)
+    dropped = dropped_records.value("rate_limited")
+    try:
+        for offset in range(10):
+            logger.debug("Fetching offset {}", offset)
+        logger.info("Another call site")
+    finally:
+        logger.remove(handler_id)
+
+    texts = [record["message"] for record in messages]
+    assert texts[:4] == ["Fetching offset 0", "Fetching offset 1", "Fetching offset 2", "Another call site"]
+    assert dropped_records.value("rate_limited") - dropped == 7
+
+
+def test_rollover_notes_suppressed_count_and_errors_and_events_always_pass():
+    record_filter = RecordFilter(limit=1, window=60)
+    messages, handler_id = _capture(record_filter)
+    try:
+        for attempt in range(5):
+            logger.bind(key="detail").warning("Failed to fetch details for {}", attempt)
+            logger.error("Scrape failed: {}", attempt)
+            logger.bind(event="scrape_run").info("summary {}", attempt)
+        for state in record_filter._windows.values():
+            state[0] -= 61
+        logger.bind(key="detail").warning("Failed to fetch details for {}", 5)
+    finally:
+        logger.remove(handler_id)
+
+    details = [record for record in messages if record["extra"].get("key") == "detail"]
+    assert [record["message"] for record in details] == [
+        "Failed to fetch details for 0", "Failed to fetch details for 5 (4 similar records suppressed)",
+    ]
+    assert details[1]["extra"]["suppressed"] == 4
+    assert sum(record["level"].name == "ERROR" for record in messages) == 5
+    assert sum(record["extra"].get("event") == "scrape_run" for record in messages) == 5
+
+
+def test_sampled_records_pass_at_their_rate():
+    messages, handler_id = _capture(RecordFilter(limit=10_000, window=60))
+    try:
+        for _ in range(2000):
+            logger.bind(sample=0.1).debug("sampled")
+        for _ in range(10):
+            logger.bind(sample=0.0).debug("never")
+    finally:
+        logger.remove(handler_id)
+
+    assert 100 < len(messages) < 320
+    assert all(record["message"] == "sampled" for record in messages)
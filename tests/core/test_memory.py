@@ -0,0 +1,36 @@
+import tracemalloc
+
+import pytest
+
+from app.core import memory
+from app.core.run_stats import ScrapeRunStats
+
+
+class Posting:
+    def __init__(self, i):
+        self.raw_data = {"description": f"{i:04d}" + "x" * 1000, "id": i}
+
+
+@pytest.mark.asyncio
+async def test_track_memory_records_peak_sites_and_retained_objects():
+    stats = ScrapeRunStats()
+    kept = []
+
+    async with memory.track_memory(stats):
+        kept.extend(Posting(i) for i in range(2000))
+        memory.checkpoint()
+        transient = [bytearray(10_000) for _ in range(100)]
+        del transient
+
+    assert stats.memory_peak_bytes > 2000 * 1000 + 100 * 10_000
+    assert "test_memory.py" in stats.memory_top_allocations[0]["site"]
+    assert stats.memory_top_allocations[0]["size_bytes"] > 2000 * 1000
+    assert stats.memory_retained_objects["Posting"] == 2000
+    assert not tracemalloc.is_tracing()
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_outside_an_instrumented_run_is_a_no_op():
+    memory.checkpoint()
+    stats = ScrapeRunStats()
+    assert stats.memory_peak_bytes is None
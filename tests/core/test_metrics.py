@@ -0,0 +1,63 @@
+import httpx
+import pytest
+
+from app.core.metrics import Counter, Gauge, Histogram, Registry
+from app.core import metrics
+from app.providers.http import provider_client
+
+
+def test_counter_and_gauge_render_in_exposition_format():
+    registry = Registry()
+    requests = registry.register(Counter("requests", "Requests.", ["provider", "status"]))
+    pool = registry.register(Gauge("pool_in_use", "Connections in use.", function=lambda: 3))
+
+    requests.inc("Comeet", "200")
+    requests.inc("Comeet", "200", amount=2)
+    requests.inc("Workday", "error")
+
+    text = registry.render()
+    assert "# TYPE requests counter" in text
+    assert 'requests_total{provider="Comeet",status="200"} 3' in text
+    assert 'requests_total{provider="Workday",status="error"} 1' in text
+    assert "pool_in_use 3" in text
+    assert pool.value() == 3
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("duration_seconds", "Duration.", ["provider"], buckets=(0.1, 1))
+    for value in (0.05, 0.5, 0.7, 5):
+        histogram.observe(value, "Comeet")
+
+    text = histogram.render()
+    assert 'duration_seconds_bucket{provider="Comeet",le="0.1"} 1' in text
+    assert 'duration_seconds_bucket{provider="Comeet",le="1"} 3' in text
+    assert 'duration_seconds_bucket{provider="Comeet",le="+Inf"} 4' in text
+    assert 'duration_seconds_count{provider="Comeet"} 4' in text
+    assert histogram.count("Comeet") == 4
+
+
+def test_label_count_is_enforced():
+    with pytest.raises(ValueError):
+        Counter("requests", "Requests.", ["provider"]).inc()
+
+
+@pytest.mark.asyncio
+async def test_provider_client_records_status_codes_and_transport_errors():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/down":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(404 if request.url.path == "/missing" else 200)
+
+    before_ok = metrics.provider_requests.value("TestProvider", "GET", "200")
+    before_errors = metrics.provider_requests.value("TestProvider", "GET", "error")
+
+    async with provider_client("TestProvider", transport=httpx.MockTransport(handler)) as client:
+        await client.get("https://ats.test/jobs")
+        assert (await client.get("https://ats.test/missing")).status_code == 404
+        with pytest.raises(httpx.ConnectError):
+            await client.get("https://ats.test/down")
+
+    assert metrics.provider_requests.value("TestProvider", "GET", "200") == before_ok + 1
+    assert metrics.provider_requests.value("TestProvider", "GET", "404") == 1
+    assert metrics.provider_requests.value("TestProvider", "GET", "error") == before_errors + 1
+    assert metrics.provider_request_duration.count("TestProvider") >= 3
@@ -0,0 +1,62 @@
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+
+from app.core import profiler
+from app.core.profiler import WAITING, ProfileStore, profiling
+
+
+def _spin(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def _fetch():
+    await asyncio.sleep(0.1)
+
+
+@pytest.mark.asyncio
+async def test_profile_samples_running_and_waiting_tasks(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiler.settings, "PROFILE_INTERVAL_MS", 2)
+    store = ProfileStore(tmp_path, max_profiles=10)
+
+    with profiling("scrape", uuid4(), "Acme", store) as profile:
+        await asyncio.gather(_fetch(), _fetch())
+        _spin(0.1)
+
+    stacks = profile.folded()
+    assert "_fetch (tests/core/test_profiler.py)" in stacks
+    assert WAITING in stacks
+    assert "_spin (tests/core/test_profiler.py)" in stacks
+    assert store.read(profile.id) == stacks
+    assert store.list()[0]["id"] == profile.id
+
+
+@pytest.mark.asyncio
+async def test_unprofiled_tasks_are_not_sampled(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiler.settings, "PROFILE_INTERVAL_MS", 2)
+    outside = asyncio.create_task(_fetch())
+
+    with profiling("request", uuid4(), "GET /api/jobs", ProfileStore(tmp_path, 10)) as profile:
+        await asyncio.sleep(0.05)
+    await outside
+
+    assert "_fetch" not in profile.folded()
+
+
+def test_store_keeps_the_newest_profiles_and_rejects_unknown_ids(tmp_path):
+    store = ProfileStore(tmp_path, max_profiles=2)
+    ids = []
+    for i in range(3):
+        profile = profiler.Profile("scrape", uuid4(), f"company {i}", None, None)
+        profile.stacks["main;work"] = 1
+        store.save(profile)
+        ids.append(profile.id)
+        time.sleep(0.01)
+
+    assert [summary["id"] for summary in store.list()] == ids[:0:-1]
+    assert store.read(ids[0]) is None
+    assert store.read("../../etc/passwd") is None
@@ -0,0 +1,52 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.core import run_stats
+from app.providers.http import provider_client
+
+
+def test_recording_outside_a_run_is_a_no_op():
+    run_stats.record_request()
+    run_stats.record_page()
+    with run_stats.parse_timer():
+        pass
+    assert run_stats.current_run() is None
+
+
+@pytest.mark.asyncio
+async def test_run_stats_collect_requests_bytes_and_pages_from_spawned_tasks():
+    async def body():
+        yield b"x" * 60
+        yield b"x" * 40
+
+    # A streamed body, read by the client like a real transport's
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+
+    async def fetch_page(client):
+        resp = await client.get("https://ats.example.com/jobs")
+        run_stats.record_page()
+        with run_stats.parse_timer():
+            resp.text
+
+    with run_stats.track_run() as stats:
+        async with provider_client("Example", transport=transport) as client:
+            await asyncio.gather(*(fetch_page(client) for _ in range(3)))
+        assert run_stats.current_run() is stats
+
+    assert run_stats.current_run() is None
+    assert (stats.http_requests, stats.bytes_downloaded, stats.pages) == (3, 300, 3)
+    assert stats.parse_seconds > 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_are_isolated():
+    async def run(pages):
+        with run_stats.track_run() as stats:
+            for _ in range(pages):
+                run_stats.record_page()
+                await asyncio.sleep(0)
+        return stats.pages
+
+    assert await asyncio.gather(run(2), run(5)) == [2, 5]
@@ -0,0 +1,83 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.core import tracing
+from app.core.tracing import JsonFileExporter
+from app.providers.http import provider_client
+
+
+@pytest.fixture
+def exporter(tmp_path, monkeypatch):
+    monkeypatch.setattr(tracing.settings, "TRACING_ENABLED", True)
+    exporter = JsonFileExporter(tmp_path, max_files=10)
+    monkeypatch.setattr(tracing, "exporter", exporter)
+    return exporter
+
+
+def _read_trace(exporter):
+    [path] = exporter.directory.glob("*.json")
+    document = json.loads(path.read_text())
+    spans = document["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    return {span["name"]: span for span in spans}, spans, document["summary"]
+
+
+@pytest.mark.asyncio
+async def test_spans_in_spawned_tasks_nest_under_the_run(exporter):
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+
+    async def detail(client, i):
+        with tracing.span("detail", index=i):
+            await client.get(f"https://ats.example.com/jobs/{i}")
+            await asyncio.sleep(0.01)
+
+    with tracing.span("scrape", **{"company.name": "Acme"}) as run:
+        async with provider_client("Example", transport=transport) as client:
+            with tracing.span("detail fan-out"):
+                await asyncio.gather(*(detail(client, i) for i in range(3)))
+
+    by_name, spans, summary = _read_trace(exporter)
+    assert len(spans) == 8
+    assert {span["traceId"] for span in spans} == {run.trace_id}
+    assert by_name["detail fan-out"]["parentSpanId"] == run.span_id
+    assert by_name["detail"]["parentSpanId"] == by_name["detail fan-out"]["spanId"]
+    assert by_name["HTTP GET"]["kind"] == 3
+    assert {"key": "provider", "value": {"stringValue": "Example"}} in by_name["HTTP GET"]["attributes"]
+
+    assert [step["name"] for step in summary["critical_path"]][:3] == ["scrape", "detail fan-out", "detail"]
+    assert summary["stages"]["detail"]["count"] == 3
+    assert summary["stages"]["detail"]["max_concurrency"] == 3
+
+
+def test_failed_span_records_error_status(exporter):
+    with pytest.raises(ValueError):
+        with tracing.span("scrape"):
+            with tracing.span("validate"):
+                raise ValueError("bad payload")
+
+    by_name, _, _ = _read_trace(exporter)
+    assert by_name["validate"]["status"] == {"code": tracing.STATUS_ERROR, "message": "bad payload"}
+    assert {"key": "exception.type", "value": {"stringValue": "ValueError"}} in by_name["validate"]["attributes"]
+
+
+def test_root_span_continues_an_incoming_traceparent(exporter):
+    traceparent = "00-" + "a" * 32 + "-" + "b" * 16 + "-01"
+    with tracing.span("GET /api/jobs", kind="SERVER", traceparent=traceparent) as span:
+        pass
+
+    assert span.trace_id == "a" * 32
+    by_name, _, _ = _read_trace(exporter)
+    assert by_name["GET /api/jobs"]["parentSpanId"] == "b" * 16
+
+
+def test_disabled_tracing_is_a_no_op(tmp_path, monkeypatch):
+    monkeypatch.setattr(tracing.settings, "TRACING_ENABLED", False)
+    monkeypatch.setattr(tracing, "exporter", JsonFileExporter(tmp_path, max_files=10))
+
+    with tracing.span("scrape") as span:
+        span.set_attribute("jobs", 1)
+
+    assert tracing.current_span() is None
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,51 @@
+import pytest
+
+from app.core.exceptions import RepeatedQueryError
+from app.db import query_tracker
+from app.db.query_tracker import fingerprint, record_statement, track_queries
+
+LOOKUP = "SELECT jobs.id FROM jobs WHERE jobs.company_id = $1::UUID AND jobs.external_id = $2::VARCHAR"
+
+
+def test_fingerprint_ignores_parameters_literals_and_list_lengths():
+    assert fingerprint(LOOKUP) == fingerprint(LOOKUP.replace("$1", "$7").replace("$2", "$8"))
+    assert fingerprint("SELECT * FROM jobs WHERE id IN ($1::UUID, $2::UUID)") == fingerprint(
+        "SELECT  *  FROM jobs\nWHERE id IN ($1::UUID, $2::UUID, $3::UUID)"
+    )
+    assert fingerprint("SELECT * FROM t WHERE name = 'a' LIMIT 5") == fingerprint("SELECT * FROM t WHERE name = 'b' LIMIT 10")
+    assert fingerprint(LOOKUP) != fingerprint("SELECT jobs.id FROM jobs WHERE jobs.id = $1::UUID")
+
+
+def test_repeated_shape_is_flagged_once_past_the_threshold(monkeypatch):
+    monkeypatch.setattr(query_tracker.settings, "QUERY_REPEAT_THRESHOLD", 3)
+    monkeypatch.setattr(query_tracker.settings, "QUERY_REPEAT_STRICT", False)
+
+    with track_queries("scrape", "Acme") as stats:
+        for _ in range(6):
+            record_statement(LOOKUP, 0.001)
+        record_statement("COMMIT", 0.001)
+
+    assert stats.statements == 7
+    assert list(stats.repeated) == [fingerprint(LOOKUP)[1]]
+    assert query_tracker.current_unit() is None
+
+
+def test_strict_mode_raises_on_repeated_shape(monkeypatch):
+    monkeypatch.setattr(query_tracker.settings, "QUERY_REPEAT_THRESHOLD", 2)
+    monkeypatch.setattr(query_tracker.settings, "QUERY_REPEAT_STRICT", True)
+
+    with track_queries("request", "GET /api/jobs"):
+        record_statement(LOOKUP, 0.001)
+        record_statement(LOOKUP, 0.001)
+        with pytest.raises(RepeatedQueryError):
+            record_statement(LOOKUP, 0.001)
+
+
+def test_nested_unit_adds_its_totals_to_the_outer_one():
+    with track_queries("request", "POST /api/companies/x/scrape") as outer:
+        record_statement("SELECT 1", 0.5)
+        with track_queries("scrape", "Acme") as inner:
+            record_statement("SELECT 2", 0.25)
+
+    assert (inner.statements, outer.statements) == (1, 2)
+    assert outer.seconds == 0.75
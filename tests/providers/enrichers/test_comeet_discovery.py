@@ -0,0 +1,75 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.core.exceptions import EnrichmentRateLimitError
+from app.providers.enrichers.comeet_enricher import ComeetEnricher, ComeetSourceData
+
+ENRICHER = "app.providers.enrichers.comeet_enricher.ComeetEnricher"
+
+
+@pytest.fixture
+def enricher(monkeypatch):
+    monkeypatch.setattr(ComeetEnricher, "SEARCH_PACING_SECONDS", 0)
+    monkeypatch.setattr(ComeetEnricher, "_cooldown_until", 0.0)
+    with patch(f"{ENRICHER}._get_cached_search", new_callable=AsyncMock, return_value=None), \
+         patch(f"{ENRICHER}._store_search", new_callable=AsyncMock):
+        yield ComeetEnricher()
+
+
+def source(uid):
+    return ComeetSourceData(uid=uid, token="T", career_url=f"https://www.comeet.com/jobs/testcorp/{uid}", logo_url=None)
+
+
+@pytest.mark.asyncio
+async def test_cached_search_skips_ddgs(enricher):
+    with patch(f"{ENRICHER}._get_cached_search", new_callable=AsyncMock) as cached, \
+         patch(f"{ENRICHER}._ddgs_text") as ddgs, \
+         patch(f"{ENRICHER}._scrape_page", new_callable=AsyncMock) as scrape:
+        cached.return_value = ["https://www.comeet.com/jobs/testcorp/12.ABC"]
+        scrape.return_value = source("12.ABC")
+
+        result = await enricher._discover_via_search("testcorp")
+
+        assert result.uid == "12.ABC"
+        ddgs.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_starts_shared_cooldown(enricher):
+    with patch(f"{ENRICHER}._ddgs_text", side_effect=Exception("429 Too Many Requests")) as ddgs:
+        with pytest.raises(EnrichmentRateLimitError):
+            await enricher._discover_via_search("testcorp")
+
+        # A second enricher must not hit the limiter again during the cooldown
+        with pytest.raises(EnrichmentRateLimitError) as exc:
+            await ComeetEnricher()._discover_via_search("othercorp")
+
+        assert ddgs.call_count == 1
+        assert exc.value.retry_after > 0
+
+
+@pytest.mark.asyncio
+async def test_candidates_are_validated_concurrently(enricher):
+    hrefs = {
+        "jobs at testcorp site:comeet.com": [{"href": "https://www.comeet.com/jobs/testcorp/11.AAA"}],
+        "site:comeet.com/jobs/testcorp": [{"href": "https://www.comeet.com/jobs/testcorp/22.BBB"}],
+        "site:comeet.com inurl:jobs testcorp": [],
+    }
+    in_flight = 0
+    max_in_flight = 0
+
+    async def scrape(uid, company_name):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return source(uid) if uid == "22.BBB" else None
+
+    with patch(f"{ENRICHER}._ddgs_text", side_effect=lambda q: hrefs[q]), \
+         patch(f"{ENRICHER}._scrape_page", side_effect=scrape):
+        result = await enricher._discover_via_search("testcorp")
+
+    assert result.uid == "22.BBB"
+    assert max_in_flight == 2
@@ -0,0 +1,53 @@
+from app.providers.scrapers.description import SNIPPET_LENGTH, derive_description, sanitize_html
+
+
+def test_sanitize_html_strips_active_content():
+    html = (
+        "<h4>Description</h4><p style='color:red' onclick='steal()'>Build <a href='javascript:alert(1)'>things</a></p>"
+        "<script>alert(1)</script><!-- tracking --><iframe src='https://evil'></iframe>"
+        "<br><br><h4>Requirements</h4><ul><li><a href='https://example.com'>Python</a></li></ul>"
+    )
+
+    assert sanitize_html(html) == (
+        "<h4>Description</h4><p>Build <a>things</a></p>"
+        "<br><br><h4>Requirements</h4><ul><li><a href=\"https://example.com\">Python</a></li></ul>"
+    )
+
+
+def test_sanitize_html_keeps_only_safe_link_schemes():
+    html = (
+        "<base href='https://evil/'>"
+        "<a href='vbscript:msgbox(1)'>a</a><a href='data:text/html,<script>alert(1)</script>'>b</a>"
+        "<a href='java\tscript:alert(1)'>c</a><a href=' JAVASCRIPT:alert(1)'>d</a>"
+        "<a href='mailto:jobs@example.com'>e</a><a href='/careers/1'>f</a><a href='HTTP://example.com'>g</a>"
+    )
+
+    assert sanitize_html(html) == (
+        "<a>a</a><a>b</a><a>c</a><a>d</a>"
+        "<a href=\"mailto:jobs@example.com\">e</a><a href=\"/careers/1\">f</a><a href=\"HTTP://example.com\">g</a>"
+    )
+
+
+def test_sanitize_html_handles_empty_and_plain_text():
+    assert sanitize_html(None) is None
+    assert sanitize_html("   ") is None
+    assert sanitize_html("<script>x()</script>") is None
+    assert sanitize_html("Just text") == "Just text"
+
+
+def test_derive_description_builds_text_and_snippet():
+    html = "<h4>Description</h4><p>Build&nbsp;APIs</p><br><br><h4>Requirements</h4><ul><li>Python</li><li>SQL</li></ul>"
+
+    derived = derive_description(html)
+
+    assert derived.html == html.replace("&nbsp;", "\xa0")
+    assert derived.text == "Description\nBuild APIs\nRequirements\nPython\nSQL"
+    assert derived.snippet == "Build APIs Python SQL"
+
+
+def test_derive_description_truncates_snippet_on_word_boundary():
+    derived = derive_description("<p>" + "word " * 100 + "</p>")
+
+    assert len(derived.snippet) <= SNIPPET_LENGTH + 1
+    assert derived.snippet.endswith("word…")
+    assert derive_description("") == (None, None, None)
@@ -0,0 +1,38 @@
+from app.providers.scrapers.workable_scraper import WorkableScraper
+from app.schemas.job import validate_jobs
+from app.providers.scrapers.workday_scraper import WorkdayScraper
+
+
+def test_workable_detail_payload_concatenates_sections():
+    scraper = WorkableScraper("TestCorp", {"name": "testcorp"})
+    detail = {
+        "id": 42,
+        "title": "Backend Engineer",
+        "description": "<p>Build</p>",
+        "benefits": "<p>Perks</p>",
+        "location": {"city": "Tel Aviv", "country": "Israel"},
+        "published": "2024-02-14T10:00:00Z",
+    }
+
+    (job,), rejected = validate_jobs([scraper._detail_payload(detail, "ABC123", "Fallback")])
+
+    assert not rejected
+
+    assert job.external_id == "42"
+    assert job.url == "https://apply.workable.com/testcorp/j/ABC123/"
+    assert job.description == "<h4>Description</h4><p>Build</p><h4>Benefits</h4><p>Perks</p>"
+    assert job.city == "Tel Aviv"
+
+
+def test_workday_detail_payload_falls_back_to_built_url():
+    scraper = WorkdayScraper("TestCorp", {"careers_url": "https://acme.myworkdayjobs.com/en-US/acme"})
+    summary = {"title": "Data Scientist", "externalPath": "/job/1", "locationsText": "Haifa, Israel"}
+    detail = {"jobPostingInfo": {"id": "abc", "jobDescription": "<p>Models</p>"}}
+
+    (job,), rejected = validate_jobs([scraper._detail_payload(summary, detail, "https://acme.myworkdayjobs.com/en-US/acme/job/1")])
+
+    assert not rejected
+
+    assert job.external_id == "abc"
+    assert job.url == "https://acme.myworkdayjobs.com/en-US/acme/job/1"
+    assert job.location == "Haifa, Israel"
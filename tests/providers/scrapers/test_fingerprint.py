@@ -0,0 +1,28 @@
+from app.providers.scrapers.fingerprint import MAX_DISTANCE, bands, distance, simhash
+
+DESCRIPTION = (
+    "We are looking for an experienced backend engineer to join a fast growing team. "
+    "You will design, build and operate services used by millions of users, own data "
+    "pipelines end to end and mentor other engineers. Five years with Python and SQL, "
+    "experience with cloud infrastructure and a passion for clean, well tested code."
+)
+
+
+def test_near_duplicates_share_a_band_and_stay_within_distance():
+    original = simhash(f"Backend Engineer\n{DESCRIPTION}")
+    reposted = simhash(f"Backend Engineer\n{DESCRIPTION} Apply now!")
+
+    assert distance(original, reposted) <= MAX_DISTANCE
+    assert set(enumerate(bands(original))) & set(enumerate(bands(reposted)))
+
+
+def test_unrelated_postings_are_far_apart():
+    backend = simhash(f"Backend Engineer\n{DESCRIPTION}")
+    sales = simhash(
+        "Account Executive\nOwn the full sales cycle for enterprise customers in EMEA, "
+        "build pipeline with marketing, negotiate contracts and exceed quarterly quota targets."
+    )
+
+    assert distance(backend, sales) > MAX_DISTANCE
+    assert simhash("") is None
+    assert -(1 << 63) <= backend < (1 << 63)
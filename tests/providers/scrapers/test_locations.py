@@ -0,0 +1,44 @@
+import pytest
+
+from app.providers.scrapers.locations import Gazetteer, normalize_name
+
+
+@pytest.fixture(scope="module")
+def gazetteer() -> Gazetteer:
+    return Gazetteer.from_file()
+
+
+def test_normalize_name_folds_accents_and_punctuation():
+    assert normalize_name("Tel Aviv-Yafo") == "tel aviv yafo"
+    assert normalize_name("Zürich") == "zurich"
+    assert normalize_name("Modi'in") == "modiin"
+
+
+@pytest.mark.parametrize("location, city, expected", [
+    ("IL", "Tel Aviv-Yafo", ("Tel Aviv", "IL")),
+    ("Herzliya, Israel", None, ("Herzliya", "IL")),
+    ("Remote - Boston, MA", None, ("Boston", "US")),
+    ("Petah Tikva, Center District, Israel", None, ("Petah Tikva", "IL")),
+    ("Cambridge, UK", None, ("Cambridge", "GB")),
+    ("Cambridge, MA", None, ("Cambridge", "US")),
+    ("London, Ontario, Canada", None, ("London", "CA")),
+    ("Israel", None, (None, "IL")),
+])
+def test_normalize_resolves_city_and_country(gazetteer, location, city, expected):
+    normalized = gazetteer.normalize(location, city)
+
+    assert (normalized.city, normalized.country_code) == expected
+    assert (normalized.latitude is None) == (normalized.city is None)
+
+
+def test_normalize_returns_none_for_unknown_places(gazetteer):
+    assert gazetteer.normalize("2 Locations") is None
+    assert gazetteer.normalize(None, None) is None
+
+
+def test_within_uses_great_circle_radius(gazetteer):
+    near_tel_aviv = {city.name for city in gazetteer.within(32.0853, 34.7818, 15)}
+
+    assert {"Tel Aviv", "Ramat Gan", "Herzliya"} <= near_tel_aviv
+    assert "Haifa" not in near_tel_aviv  # ~80 km north
+    assert "Haifa" in {city.name for city in gazetteer.within(32.0853, 34.7818, 100)}
@@ -0,0 +1,70 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from httpx import Request, Response
+
+from app.core.exceptions import ContentNotModifiedError
+from app.models.response_validator import ResponseValidator
+from app.providers.scrapers.comeet_scraper import ComeetScraper
+from app.providers.scrapers.response_cache import ResponseValidators, body_digest
+
+BODY = b'[{"name": "Engineer", "uid": "AB.1", "url_active_page": "https://comeet.com/jobs/AB.1"}]'
+
+
+def _response(status_code=200, content=BODY, headers=None):
+    return Response(status_code, content=content, headers=headers, request=Request("GET", "https://mock.com"))
+
+
+def _stored(**fields):
+    return ResponseValidator(endpoint="positions", **{"etag": None, "last_modified": None, "body_digest": "", **fields})
+
+
+def test_request_headers_carry_stored_validators():
+    validators = ResponseValidators([_stored(etag='"v1"', last_modified="Mon, 19 Oct 2026 08:00:00 GMT")])
+
+    assert validators.request_headers("positions") == {
+        "If-None-Match": '"v1"', "If-Modified-Since": "Mon, 19 Oct 2026 08:00:00 GMT",
+    }
+    assert validators.request_headers("jobs") == {}
+
+
+def test_not_modified_on_304_or_matching_digest_and_seen_validators_are_kept():
+    validators = ResponseValidators([_stored(etag='"v1"', body_digest=body_digest(BODY))])
+    assert validators.not_modified("positions", _response(304))
+    assert validators.seen == [{"endpoint": "positions", "etag": '"v1"', "last_modified": None, "body_digest": body_digest(BODY)}]
+
+    assert validators.not_modified("positions", _response(200, headers={"ETag": '"v2"'}))
+    assert not validators.not_modified("positions", _response(200, content=BODY + b" "))
+    assert validators.seen[0]["body_digest"] == body_digest(BODY + b" ")
+
+
+def test_failed_and_unknown_endpoints_are_modified():
+    validators = ResponseValidators()
+    assert not validators.not_modified("positions", _response(200))
+    assert not validators.not_modified("jobs", _response(500))
+    assert [row["endpoint"] for row in validators.seen] == ["positions"]
+
+
+@pytest.mark.asyncio
+async def test_scraper_skips_parsing_unchanged_list():
+    scraper = ComeetScraper(company_name="TestCorp", config={"uid": "123", "token": "abc"})
+    scraper.response_validators = ResponseValidators([_stored(etag='"v1"', body_digest=body_digest(BODY))])
+
+    with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = _response(200)
+        with pytest.raises(ContentNotModifiedError):
+            await scraper.fetch_jobs()
+
+    assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+@pytest.mark.asyncio
+async def test_scraper_parses_changed_list():
+    scraper = ComeetScraper(company_name="TestCorp", config={"uid": "123", "token": "abc"})
+    scraper.response_validators = ResponseValidators([_stored(body_digest="stale")])
+
+    with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = _response(200)
+        jobs = await scraper.fetch_jobs()
+
+    assert [job.external_id for job in jobs] == ["AB.1"]
+    assert scraper.response_validators.seen[0]["body_digest"] == body_digest(BODY)
@@ -0,0 +1,101 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.core.exceptions import RetryableProviderError
+from app.providers.scrapers.validation_cache import ValidationCache, config_fingerprint
+
+
+@pytest.fixture
+def cache():
+    return ValidationCache(positive_ttl=60, negative_ttl=5, max_size=2)
+
+
+def test_fingerprint_is_canonical():
+    assert config_fingerprint("Comeet", {"uid": "1", "token": "a"}) == config_fingerprint("Comeet", {"token": "a", "uid": "1"})
+    assert config_fingerprint("Comeet", {"uid": "1"}) != config_fingerprint("Workday", {"uid": "1"})
+
+
+@pytest.mark.asyncio
+async def test_hit_after_miss(cache):
+    validator = AsyncMock(return_value=True)
+
+    assert await cache.get_or_validate("Comeet", {"uid": "1"}, validator) is True
+    assert await cache.get_or_validate("Comeet", {"uid": "1"}, validator) is True
+
+    validator.assert_awaited_once()
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_negative_results_use_shorter_ttl(cache):
+    validator = AsyncMock(return_value=False)
+
+    with patch("app.providers.scrapers.validation_cache.time.monotonic", return_value=100.0):
+        await cache.get_or_validate("Comeet", {"uid": "1"}, validator)
+    with patch("app.providers.scrapers.validation_cache.time.monotonic", return_value=106.0):
+        await cache.get_or_validate("Comeet", {"uid": "1"}, validator)
+
+    assert validator.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction(cache):
+    validator = AsyncMock(return_value=True)
+    for uid in ["1", "2", "1", "3"]:
+        await cache.get_or_validate("Comeet", {"uid": uid}, validator)
+
+    # "2" was least recently used when "3" was inserted
+    await cache.get_or_validate("Comeet", {"uid": "1"}, validator)
+    await cache.get_or_validate("Comeet", {"uid": "2"}, validator)
+
+    assert cache.evictions >= 1
+    assert validator.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_call(cache):
+    calls = 0
+
+    async def validator():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return True
+
+    results = await asyncio.gather(*[cache.get_or_validate("Comeet", {"uid": "1"}, validator) for _ in range(10)])
+
+    assert results == [True] * 10
+    assert calls == 1
+    assert cache.stats()["coalesced"] == 9
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached(cache):
+    validator = AsyncMock(side_effect=[RetryableProviderError("down", provider="Comeet"), True])
+
+    with pytest.raises(RetryableProviderError):
+        await cache.get_or_validate("Comeet", {"uid": "1"}, validator)
+    assert await cache.get_or_validate("Comeet", {"uid": "1"}, validator) is True
+
+
+@pytest.mark.asyncio
+async def test_cancelled_owner_lets_waiters_validate_again(cache):
+    calls = 0
+
+    async def validator():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return True
+
+    owner = asyncio.create_task(cache.get_or_validate("Comeet", {"uid": "1"}, validator))
+    await asyncio.sleep(0)
+    waiters = [asyncio.create_task(cache.get_or_validate("Comeet", {"uid": "1"}, validator)) for _ in range(3)]
+    await asyncio.sleep(0)
+    owner.cancel()
+
+    assert await asyncio.gather(*waiters) == [True] * 3
+    assert owner.cancelled()
+    assert calls == 2
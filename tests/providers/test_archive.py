@@ -0,0 +1,81 @@
+import gzip
+import json
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from app.providers.archive import ResponseArchive
+from app.providers.http import provider_client, use_transport
+
+POSITIONS = json.dumps([{"uid": "AB.1", "name": "Engineer"}]).encode()
+
+
+def _provider(request: httpx.Request) -> httpx.Response:
+    if request.method == "POST":
+        return httpx.Response(200, json={"offset": json.loads(request.content)["offset"]})
+    # Compressed on the wire, like most provider responses
+    return httpx.Response(200, content=gzip.compress(POSITIONS), headers={"Content-Encoding": "gzip", "ETag": '"v1"'})
+
+
+async def _record(archive, company_id, complete=True):
+    run_id = uuid4()
+    with archive.recording(run_id, company_id, "Acme", "comeet") as recording:
+        async with provider_client("Comeet", transport=httpx.MockTransport(_provider)) as client:
+            await client.get("https://ats.example.com/positions", params={"token": "t"})
+            await client.post("https://ats.example.com/jobs", json={"offset": 0})
+            await client.post("https://ats.example.com/jobs", json={"offset": 20})
+        recording.complete = complete
+    return run_id
+
+
+@pytest.mark.asyncio
+async def test_recorded_run_replays_without_provider_traffic(tmp_path):
+    archive = ResponseArchive(tmp_path, runs_per_company=3)
+    company_id = uuid4()
+    run_id = await _record(archive, company_id)
+
+    manifest = archive.latest(company_id)
+    assert manifest["run_id"] == str(run_id)
+    assert archive.companies() == [company_id]
+
+    replay = archive.replay_transport(manifest)
+    with use_transport(lambda: replay):
+        async with provider_client("Comeet") as client:
+            positions = await client.get("https://ats.example.com/positions", params={"token": "t"})
+            second_page = await client.post("https://ats.example.com/jobs", json={"offset": 20})
+            with pytest.raises(httpx.ConnectError):
+                await client.post("https://ats.example.com/jobs", json={"offset": 40})
+
+    assert positions.content == POSITIONS
+    assert positions.headers["etag"] == '"v1"'
+    assert second_page.json() == {"offset": 20}
+
+
+@pytest.mark.asyncio
+async def test_retention_keeps_newest_runs_and_newest_complete_run(tmp_path):
+    archive = ResponseArchive(tmp_path, runs_per_company=2)
+    company_id = uuid4()
+    complete_run = await _record(archive, company_id)
+    for _ in range(3):
+        await _record(archive, company_id, complete=False)
+
+    manifests = list((tmp_path / "runs" / str(company_id)).glob("*.json"))
+    assert len(manifests) == 3
+    assert archive.latest(company_id)["run_id"] == str(complete_run)
+    # Identical bodies are stored once
+    assert len(list((tmp_path / "objects").glob("*/*.z"))) == 3
+
+
+@pytest.mark.asyncio
+async def test_collect_garbage_removes_unreferenced_bodies(tmp_path):
+    archive = ResponseArchive(tmp_path, runs_per_company=1)
+    company_id = uuid4()
+    await _record(archive, company_id)
+    orphan = tmp_path / "objects" / "ff" / ("f" * 64 + ".z")
+    orphan.parent.mkdir(exist_ok=True)
+    orphan.write_bytes(b"")
+
+    assert archive.collect_garbage() == 1
+    assert not orphan.exists()
+    assert archive.latest(company_id) is not None
@@ -0,0 +1,124 @@
+"""
+Scraper and enricher runs replayed from cassettes. The scraper cassettes in
+tests/providers/cassettes are recorded from the mock ATS with
+`python -m benchmarks.cassettes --record`.
+"""
+import json
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.core import run_stats
+from app.core.exceptions import ProviderError
+from app.providers.cassettes import SCRUBBED, use_cassette
+from app.providers.enrichers.comeet_enricher import ComeetEnricher
+from app.providers.http import provider_client
+from app.providers.scrapers.comeet_scraper import ComeetScraper
+from app.providers.scrapers.workable_scraper import WorkableScraper
+from app.providers.scrapers.workday_scraper import WorkdayScraper
+
+CASSETTES = Path(__file__).parent / "cassettes"
+ENRICHER = "app.providers.enrichers.comeet_enricher.ComeetEnricher"
+
+
+@pytest.mark.asyncio
+async def test_workday_multi_page_scrape_replays():
+    scraper = WorkdayScraper("Acme", {"careers_url": "https://acme.wd3.myworkdayjobs.com/en-US/workday0"})
+    scraper.pacing = False
+
+    with use_cassette(CASSETTES / "workday_acme.json", mode="replay"), run_stats.track_run() as stats:
+        jobs = await scraper.fetch_jobs()
+
+    assert len(jobs) == 45
+    assert len({job.external_id for job in jobs}) == 45
+    # Landing page, three list pages and a detail per job
+    assert (stats.http_requests, stats.pages) == (49, 3)
+    assert all(job.description for job in jobs)
+
+
+@pytest.mark.asyncio
+async def test_workable_scrape_replays():
+    with use_cassette(CASSETTES / "workable_acme.json", mode="replay"):
+        jobs = await WorkableScraper("Acme", {"name": "workable0"}).fetch_jobs()
+
+    assert len(jobs) == 15
+    assert jobs[0].title
+
+
+@pytest.mark.asyncio
+async def test_replay_matches_requests_whatever_the_real_token():
+    with use_cassette(CASSETTES / "comeet_acme.json", mode="replay"):
+        jobs = await ComeetScraper("Acme", {"uid": "comeet0", "token": "another-token"}).fetch_jobs()
+
+    assert len(jobs) == 30
+
+
+@pytest.mark.asyncio
+async def test_unrecorded_request_fails_like_a_connection_error():
+    with use_cassette(CASSETTES / "workable_acme.json", mode="replay"):
+        with pytest.raises(ProviderError):
+            await WorkableScraper("Acme", {"name": "unknown-tenant"}).fetch_jobs()
+
+
+@pytest.mark.asyncio
+async def test_replay_simulates_recorded_latency():
+    recorded = json.loads((CASSETTES / "comeet_acme.json").read_text())["interactions"][0]["elapsed_ms"]
+
+    with use_cassette(CASSETTES / "comeet_acme.json", mode="replay", latency_scale=2):
+        start = time.perf_counter()
+        await ComeetScraper("Acme", {"uid": "comeet0", "token": "t"}).fetch_jobs()
+
+    assert time.perf_counter() - start >= 2 * recorded / 1000
+
+
+def _careers_site(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/positions"):
+        return httpx.Response(200, json=[])
+    page = '<script>var config = {token: "live-secret-token"};</script>'
+    return httpx.Response(200, text=page, headers={"Set-Cookie": "session=abc"})
+
+
+@pytest.mark.asyncio
+async def test_enricher_discovery_records_secret_free_and_replays_without_search(tmp_path, monkeypatch):
+    monkeypatch.setattr(ComeetEnricher, "SEARCH_PACING_SECONDS", 0)
+    monkeypatch.setattr(ComeetEnricher, "_cooldown_until", 0.0)
+    path = tmp_path / "comeet_discovery.json"
+    results = [{"href": "https://www.comeet.com/jobs/testcorp/12.ABC"}]
+
+    with patch(f"{ENRICHER}._get_cached_search", new_callable=AsyncMock, return_value=None), \
+            patch(f"{ENRICHER}._store_search", new_callable=AsyncMock):
+        with patch(f"{ENRICHER}._ddgs_search", return_value=results), \
+                use_cassette(path, mode="record", transport_factory=lambda: httpx.MockTransport(_careers_site)):
+            recorded = await ComeetEnricher()._discover_via_search("testcorp")
+
+        with patch(f"{ENRICHER}._ddgs_search", side_effect=AssertionError("live search")), \
+                use_cassette(path, mode="replay"):
+            replayed = await ComeetEnricher()._discover_via_search("testcorp")
+
+    text = path.read_text()
+    assert "live-secret-token" not in text and "session=abc" not in text
+    assert recorded.token == "live-secret-token"
+    assert (replayed.uid, replayed.token) == ("12.ABC", SCRUBBED)
+
+
+def _echo_site(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"owner": "Zoë Müller", "count": 1, "note": "key=1 is not a secret"})
+
+
+@pytest.mark.asyncio
+async def test_record_scrubs_fields_and_ignores_short_secrets(tmp_path):
+    path = tmp_path / "echo.json"
+
+    with use_cassette(path, mode="record", secrets=["Zoë Müller"], transport_factory=lambda: httpx.MockTransport(_echo_site)):
+        async with provider_client("echo") as client:
+            await client.get("https://echo.example/api", params={"key": "1"})
+
+    document = json.loads(path.read_text())
+    interaction, = document["interactions"]
+    assert interaction["request"]["url"] == f"https://echo.example/api?key={SCRUBBED}"
+    # The short key value was not replaced in unrelated text, and the escaped non-ASCII secret was
+    assert json.loads(interaction["response"]["body"]) == {"owner": SCRUBBED, "count": 1, "note": "key=1 is not a secret"}
+    assert "Zo" not in path.read_text()
@@ -0,0 +1,30 @@
+from app.schemas.job import validate_jobs
+
+
+def _payload(external_id, **overrides):
+    return {
+        "title": "Backend Engineer",
+        "external_id": external_id,
+        "url": f"https://example.com/jobs/{external_id}",
+        "raw_data": {"id": external_id},
+        **overrides,
+    }
+
+
+def test_validate_jobs_normalizes_empty_optional_fields():
+    jobs, rejected = validate_jobs([_payload("1", city="", published_at="", description="")])
+
+    assert rejected == []
+    assert jobs[0].city is None
+    assert jobs[0].published_at is None
+    assert jobs[0].description is None
+
+
+def test_validate_jobs_rejects_only_invalid_payloads():
+    payloads = [_payload("1"), _payload("2", title=""), _payload("3"), _payload("4", url=None)]
+
+    jobs, rejected = validate_jobs(payloads)
+
+    assert [job.external_id for job in jobs] == ["1", "3"]
+    assert [payload["external_id"] for payload, _ in rejected] == ["2", "4"]
+    assert rejected[0][1].startswith("title:")
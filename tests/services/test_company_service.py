@@ -0,0 +1,220 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import BackgroundTasks
+
+from app.models.company import Company, CompanyStatus, ATSProvider
+from app.schemas.company import CompanyCreate, CompanyUpdate
+from app.services import company_service
+from app.providers.scrapers.validation_cache import config_fingerprint
+
+
+CONFIG = {"uid": "12.ABC", "token": "XYZ"}
+
+
+@pytest.fixture
+def db():
+    return AsyncMock()
+
+
+@pytest.fixture
+def company():
+    return Company(
+        name="TestCorp",
+        ats_provider=ATSProvider.COMEET,
+        metadata_config=dict(CONFIG),
+        status=CompanyStatus.ACTIVE,
+        config_fingerprint=config_fingerprint(ATSProvider.COMEET, CONFIG),
+        is_config_valid=True,
+    )
+
+
+def test_fingerprint_ignores_key_order():
+    assert config_fingerprint(ATSProvider.COMEET, {"uid": "1", "token": "a"}) == \
+        config_fingerprint(ATSProvider.COMEET, {"token": "a", "uid": "1"})
+    assert config_fingerprint(ATSProvider.COMEET, CONFIG) != config_fingerprint(ATSProvider.WORKABLE, CONFIG)
+
+
+@pytest.mark.asyncio
+async def test_update_unchanged_config_skips_validation(db, company):
+    """A logo-only PATCH should not hit the provider"""
+    with patch("app.services.company_service.company_repo") as repo, \
+         patch("app.services.company_service._check_config_validity", new_callable=AsyncMock) as check:
+        repo.get_by_id = AsyncMock(return_value=company)
+        repo.update = AsyncMock(side_effect=lambda db, c: c)
+        tasks = BackgroundTasks()
+
+        result = await company_service.update_company(db, company.id, CompanyUpdate(logo_url="logo.png"), tasks)
+
+        check.assert_not_called()
+        assert result.status == CompanyStatus.ACTIVE
+        assert result.logo_url == "logo.png"
+        assert not tasks.tasks
+
+
+@pytest.mark.asyncio
+async def test_update_changed_config_is_deferred(db, company):
+    with patch("app.services.company_service.company_repo") as repo, \
+         patch("app.services.company_service._check_config_validity", new_callable=AsyncMock) as check:
+        repo.get_by_id = AsyncMock(return_value=company)
+        repo.update = AsyncMock(side_effect=lambda db, c: c)
+        tasks = BackgroundTasks()
+
+        result = await company_service.update_company(
+            db, company.id, CompanyUpdate(metadata_config={"uid": "NEW", "token": "XYZ"}), tasks
+        )
+
+        check.assert_not_called()
+        assert result.status == CompanyStatus.PENDING_VALIDATION
+        assert result.is_config_valid is None
+        assert len(tasks.tasks) == 1
+        db.commit.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_create_without_config_resolves_inline(db):
+    with patch("app.services.company_service.company_repo") as repo:
+        repo.get_by_name_and_provider = AsyncMock(return_value=None)
+        repo.create = AsyncMock(side_effect=lambda db, c: c)
+        tasks = BackgroundTasks()
+
+        result = await company_service.create_company(db, CompanyCreate(name="NoConfig"), tasks)
+
+        assert result.status == CompanyStatus.UNCONFIGURED
+        assert result.is_config_valid is False
+        assert not tasks.tasks
+
+
+@pytest.mark.asyncio
+async def test_background_validation_resolves_status(company):
+    company.status = CompanyStatus.PENDING_VALIDATION
+    company.is_config_valid = None
+    company.pending_base_status = company.pending_requested_status = CompanyStatus.ACTIVE
+    session = AsyncMock()
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=session)
+    session_cm.__aexit__ = AsyncMock(return_value=False)
+
+    with patch("app.services.company_service.AsyncSessionLocal", return_value=session_cm), \
+         patch("app.services.company_service.company_repo") as repo, \
+         patch("app.services.company_service._check_config_validity", new_callable=AsyncMock) as check:
+        repo.get_by_id = AsyncMock(return_value=company)
+        repo.update = AsyncMock(side_effect=lambda db, c: c)
+        check.return_value = False
+
+        await company_service.validate_company_config(company.id, company.config_fingerprint)
+
+        assert company.is_config_valid is False
+        assert company.status == CompanyStatus.UNCONFIGURED
+        assert company.pending_base_status is None
+        session.commit.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_errored_validation_is_not_stored(db, company):
+    """A provider outage must not pin the config as invalid: the next ACTIVE request validates again"""
+    company.status = CompanyStatus.PENDING_VALIDATION
+    company.is_config_valid = None
+    company.pending_base_status = company.pending_requested_status = CompanyStatus.ACTIVE
+
+    await company_service._finish_validation(company, None)
+    assert company.is_config_valid is None
+    assert company.status == CompanyStatus.UNCONFIGURED
+
+    with patch("app.services.company_service.company_repo") as repo, \
+         patch("app.services.company_service._check_config_validity", new_callable=AsyncMock) as check:
+        repo.get_by_id = AsyncMock(return_value=company)
+        repo.update = AsyncMock(side_effect=lambda db, c: c)
+        check.return_value = True
+
+        await company_service.update_company(db, company.id, CompanyUpdate(status=CompanyStatus.ACTIVE))
+
+        check.assert_awaited_once()
+        assert company.is_config_valid is True
+        assert company.status == CompanyStatus.ACTIVE
+
+
+@pytest.mark.asyncio
+async def test_active_request_revalidates_invalid_verdict(db, company):
+    company.status = CompanyStatus.UNCONFIGURED
+    company.is_config_valid = False
+    with patch("app.services.company_service.company_repo") as repo:
+        repo.get_by_id = AsyncMock(return_value=company)
+        repo.update = AsyncMock(side_effect=lambda db, c: c)
+        tasks = BackgroundTasks()
+
+        await company_service.update_company(db, company.id, CompanyUpdate(status=CompanyStatus.ACTIVE), tasks)
+
+    assert company.status == CompanyStatus.PENDING_VALIDATION
+    assert company.pending_requested_status == CompanyStatus.ACTIVE
+    assert len(tasks.tasks) == 1
+
+
+@pytest.mark.asyncio
+async def test_second_config_change_keeps_status_requested_by_first(db, company):
+    company.status = CompanyStatus.INACTIVE
+    with patch("app.services.company_service.company_repo") as repo:
+        repo.get_by_id = AsyncMock(return_value=company)
+        repo.update = AsyncMock(side_effect=lambda db, c: c)
+        tasks = BackgroundTasks()
+
+        await company_service.update_company(
+            db, company.id, CompanyUpdate(metadata_config={"uid": "NEW", "token": "XYZ"}, status=CompanyStatus.ACTIVE), tasks
+        )
+        await company_service.update_company(
+            db, company.id, CompanyUpdate(metadata_config={"uid": "NEWER", "token": "XYZ"}), tasks
+        )
+
+    assert company.status == CompanyStatus.PENDING_VALIDATION
+    assert company.pending_base_status == CompanyStatus.INACTIVE
+    assert company.pending_requested_status == CompanyStatus.ACTIVE
+
+    await company_service._finish_validation(company, True)
+    assert company.status == CompanyStatus.ACTIVE
+
+
+def test_parse_csv_import_rows():
+    body = (
+        "name,ats_provider,metadata_config.uid,metadata_config.token,logo_url\n"
+        "Acme,COMEET,12.ABC,XYZ,\n"
+        "Globex,,,,\n"
+    ).encode()
+
+    rows = company_service.parse_import_rows("text/csv; charset=utf-8", body)
+
+    assert rows == [
+        {"name": "Acme", "ats_provider": "COMEET", "metadata_config": {"uid": "12.ABC", "token": "XYZ"}},
+        {"name": "Globex"},
+    ]
+
+
+def test_parse_jsonl_import_rows():
+    rows = company_service.parse_import_rows("application/x-ndjson", b'{"name": "Acme"}\n\n{"name": "Globex"}\n')
+    assert [row["name"] for row in rows] == ["Acme", "Globex"]
+
+
+@pytest.mark.asyncio
+async def test_import_reports_every_row(db):
+    rows = [
+        {"name": "Existing", "ats_provider": "COMEET"},
+        {"name": "Fresh", "ats_provider": "COMEET", "metadata_config": CONFIG},
+        {"name": "Fresh", "ats_provider": "COMEET"},
+        {"name": "NoConfig"},
+        {"ats_provider": "COMEET"},
+    ]
+
+    with patch("app.services.company_service.company_repo") as repo, \
+         patch("app.services.company_service._check_config_validity", new_callable=AsyncMock) as check:
+        repo.get_identity_keys = AsyncMock(return_value=[("Existing", ATSProvider.COMEET, None)])
+        repo.create_many = AsyncMock(side_effect=lambda db, companies, batch_size: companies)
+        check.return_value = False
+        tasks = BackgroundTasks()
+
+        report = await company_service.import_companies(db, rows, tasks)
+
+    assert [row.result for row in report.rows] == ["duplicate", "created", "duplicate", "created", "invalid"]
+    assert report.rows[1].status == CompanyStatus.PENDING_VALIDATION
+    assert report.rows[3].status == CompanyStatus.UNCONFIGURED
+    assert report.pending_validation == 1
+    repo.get_identity_keys.assert_awaited_once()
+    repo.create_many.assert_awaited_once()
+    assert len(tasks.tasks) == 1
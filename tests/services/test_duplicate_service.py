@@ -0,0 +1,105 @@
+from collections import namedtuple
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.models.job import Job
+from app.providers.scrapers.fingerprint import BANDS, simhash
+from app.services import duplicate_service
+from app.workers.cpu_stage import CPUStage
+
+Row = namedtuple(
+    "Row", "id simhash duplicate_of_id created_at company_id url location location_key", defaults=(None,) * 4
+)
+TEXT = "Senior Data Engineer\nBuild streaming pipelines with Kafka and Spark for analytics teams across the company."
+
+
+@pytest.mark.asyncio
+async def test_new_job_links_to_oldest_match_in_cluster():
+    now = datetime(2026, 1, 1)
+    canonical = Row(uuid4(), simhash(TEXT), None, now - timedelta(days=3))
+    earlier_duplicate = Row(uuid4(), simhash(TEXT), canonical.id, now - timedelta(days=1))
+    unrelated = Row(uuid4(), simhash("Office Manager\nRun the office."), None, now - timedelta(days=5))
+    job = Job(id=uuid4(), title="Senior Data Engineer", description_text=TEXT.split("\n")[1])
+
+    with patch.object(duplicate_service, "job_repo") as repo, \
+         patch.object(duplicate_service, "cpu_stage", CPUStage(workers=0, batch_size=10, max_pending=1)):
+        repo.replace_simhash_bands = AsyncMock()
+        repo.get_simhash_candidates = AsyncMock(return_value=[
+            earlier_duplicate, unrelated, canonical, Row(job.id, simhash(TEXT), None, now),
+        ])
+
+        flagged = await duplicate_service.index_job_fingerprints(AsyncMock(), [job])
+
+    assert flagged == 1
+    assert job.simhash == simhash(TEXT)
+    assert job.duplicate_of_id == canonical.id
+    assert len(repo.replace_simhash_bands.call_args.args[2]) == BANDS
+
+
+@pytest.mark.asyncio
+async def test_job_without_matches_is_canonical():
+    job = Job(id=uuid4(), title="Only One", description_text="Nothing else like it", duplicate_of_id=uuid4())
+
+    with patch.object(duplicate_service, "job_repo") as repo, \
+         patch.object(duplicate_service, "cpu_stage", CPUStage(workers=0, batch_size=10, max_pending=1)):
+        repo.replace_simhash_bands = AsyncMock()
+        repo.get_simhash_candidates = AsyncMock(return_value=[
+            Row(job.id, simhash("Only One\nNothing else like it"), job.duplicate_of_id, datetime(2026, 1, 1)),
+        ])
+
+        flagged = await duplicate_service.index_job_fingerprints(AsyncMock(), [job])
+
+    assert flagged == 0
+    assert job.duplicate_of_id is None
+
+
+@pytest.mark.asyncio
+async def test_archived_canonical_promotes_oldest_live_member():
+    now = datetime(2026, 1, 1)
+    canonical_id = uuid4()
+    older = Job(id=uuid4(), title="Senior Data Engineer", description_text=TEXT.split("\n")[1],
+                simhash=simhash(TEXT), duplicate_of_id=canonical_id)
+    newer = Job(id=uuid4(), title="Senior Data Engineer", description_text=TEXT.split("\n")[1],
+                simhash=simhash(TEXT), duplicate_of_id=canonical_id)
+
+    with patch.object(duplicate_service, "job_repo") as repo, \
+         patch.object(duplicate_service, "cpu_stage", CPUStage(workers=0, batch_size=10, max_pending=1)):
+        repo.replace_simhash_bands = AsyncMock()
+        repo.get_cluster_members = AsyncMock(return_value=[newer, older])
+        # The archived canonical is no longer a candidate
+        repo.get_simhash_candidates = AsyncMock(return_value=[
+            Row(newer.id, simhash(TEXT), canonical_id, now),
+            Row(older.id, simhash(TEXT), canonical_id, now - timedelta(days=1)),
+        ])
+
+        flagged = await duplicate_service.index_job_fingerprints(AsyncMock(), [], archived_ids=[canonical_id])
+
+    assert flagged == 0
+    assert repo.get_cluster_members.call_args.args[1] == [canonical_id]
+    assert older.duplicate_of_id is None
+    assert newer.duplicate_of_id == older.id
+
+
+@pytest.mark.asyncio
+async def test_same_company_postings_for_other_cities_are_not_duplicates():
+    now = datetime(2026, 1, 1)
+    company_id = uuid4()
+    tel_aviv = Row(uuid4(), simhash(TEXT), None, now - timedelta(days=3), company_id, "https://x/1", location_key="IL:Tel Aviv")
+    other_company = Row(uuid4(), simhash(TEXT), None, now - timedelta(days=1), uuid4(), "https://y/1", location_key="IL:Haifa")
+    job = Job(id=uuid4(), title="Senior Data Engineer", description_text=TEXT.split("\n")[1],
+              company_id=company_id, url="https://x/2", location_key="IL:Haifa")
+
+    with patch.object(duplicate_service, "job_repo") as repo, \
+         patch.object(duplicate_service, "cpu_stage", CPUStage(workers=0, batch_size=10, max_pending=1)):
+        repo.replace_simhash_bands = AsyncMock()
+        repo.get_simhash_candidates = AsyncMock(return_value=[
+            tel_aviv, other_company, Row(job.id, simhash(TEXT), None, now, company_id, job.url, location_key="IL:Haifa"),
+        ])
+
+        flagged = await duplicate_service.index_job_fingerprints(AsyncMock(), [job])
+
+    assert flagged == 1
+    assert job.duplicate_of_id == other_company.id
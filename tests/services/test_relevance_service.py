@@ -0,0 +1,116 @@
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import BackgroundTasks
+
+from app.models.job import Job, UserVerdict
+from app.schemas.job import JobVerdictUpdate
+from app.services import relevance_service
+from app.services.relevance_service import RelevanceModel
+
+RELEVANT = [
+    "Backend Engineer\nPython, PostgreSQL and asyncio services",
+    "Senior Python Developer\nFastAPI microservices and data pipelines",
+    "Data Engineer\nPython, Spark and SQL pipelines",
+]
+IRRELEVANT = [
+    "Account Executive\nEnterprise sales, quota and negotiation",
+    "Office Manager\nFacilities, vendors and events",
+    "Recruiter\nSourcing candidates and hiring pipelines",
+]
+
+
+def test_model_is_untrained_until_first_verdicts(tmp_path):
+    model = RelevanceModel(str(tmp_path / "model.joblib"))
+
+    assert model.score(["anything"]) is None
+    assert not model.is_trained
+
+
+def test_model_ranks_relevant_jobs_higher_and_persists(tmp_path):
+    path = str(tmp_path / "model.joblib")
+    model = RelevanceModel(path)
+    for _ in range(5):
+        model.partial_fit(RELEVANT + IRRELEVANT, [1, 1, 1, 0, 0, 0], [1.0] * 6)
+
+    python_job, sales_job = model.score(["Python Engineer\nasyncio services", "Sales Manager\nquota and negotiation"])
+    assert python_job > sales_job
+
+    reloaded = RelevanceModel(path)
+    assert reloaded.score(["Python Engineer\nasyncio services"]) == [python_job]
+
+
+@pytest.mark.asyncio
+async def test_record_verdicts_schedules_incremental_training():
+    job = Job(id=uuid4(), title="Backend Engineer")
+    db = AsyncMock()
+
+    with patch.object(relevance_service, "job_repo") as repo:
+        repo.get_by_ids = AsyncMock(return_value=[job])
+        tasks = BackgroundTasks()
+
+        result = await relevance_service.record_verdicts(
+            db, [JobVerdictUpdate(job_id=job.id, user_verdict=UserVerdict.GOOD), JobVerdictUpdate(job_id=uuid4())], tasks
+        )
+
+    assert result == [job]
+    assert job.user_verdict == UserVerdict.GOOD
+    db.commit.assert_awaited_once()
+    assert tasks.tasks[0].func is relevance_service.train_on_jobs
+    assert tasks.tasks[0].args == ([job.id],)
+
+
+@pytest.mark.asyncio
+async def test_changed_or_cleared_verdict_schedules_a_retrain(monkeypatch):
+    retrain = AsyncMock(return_value=2)
+    monkeypatch.setattr(relevance_service, "retrain", retrain)
+    monkeypatch.setattr(relevance_service.settings, "RELEVANCE_RETRAIN_DELAY", 0.01)
+    changed = Job(id=uuid4(), title="Backend Engineer", user_verdict=UserVerdict.GOOD)
+    cleared = Job(id=uuid4(), title="Recruiter", user_verdict=UserVerdict.IRRELEVANT)
+
+    with patch.object(relevance_service, "job_repo") as repo:
+        repo.get_by_ids = AsyncMock(return_value=[changed, cleared])
+        tasks = BackgroundTasks()
+
+        await relevance_service.record_verdicts(
+            AsyncMock(),
+            [JobVerdictUpdate(job_id=changed.id, user_verdict=UserVerdict.PERFECT_MATCH), JobVerdictUpdate(job_id=cleared.id)],
+            tasks,
+        )
+        await relevance_service._retrain_task
+
+    assert tasks.tasks[0].args == ([changed.id],)
+    retrain.assert_awaited_once()
+
+
+def test_model_reloads_a_file_replaced_by_another_process_and_does_not_overwrite_it(tmp_path):
+    path = str(tmp_path / "model.joblib")
+    api = RelevanceModel(path)
+    api.partial_fit(IRRELEVANT, [0, 0, 0], [1.0] * 3)
+
+    retrained = RelevanceModel(str(tmp_path / "staging.joblib"))
+    for _ in range(5):
+        retrained.partial_fit(RELEVANT + IRRELEVANT, [1, 1, 1, 0, 0, 0], [1.0] * 6)
+    expected, = retrained.score(["Python Engineer\nasyncio services"])
+    RelevanceModel(path).replace(retrained)
+
+    python_job, = api.score(["Python Engineer\nasyncio services"])
+    assert python_job == expected
+
+    api.partial_fit(RELEVANT[:1], [1], [1.0])
+    # The verdict batch was applied on top of the retrained model
+    assert RelevanceModel(path).score(["Python Engineer\nasyncio services"])[0] >= python_job
+
+
+@pytest.mark.asyncio
+async def test_verdict_batches_share_one_rescore(monkeypatch):
+    rescore = AsyncMock(return_value=3)
+    monkeypatch.setattr(relevance_service, "rescore_new_jobs", rescore)
+    monkeypatch.setattr(relevance_service.settings, "RELEVANCE_RESCORE_DELAY", 0.01)
+
+    for _ in range(3):
+        relevance_service.schedule_rescore()
+    await relevance_service._rescore_task
+
+    rescore.assert_awaited_once()
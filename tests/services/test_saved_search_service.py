@@ -0,0 +1,104 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.company import Company, CompanyStatus
+from app.models.job import Job, JobStatus
+from app.models.saved_search import SavedSearch
+from app.services import saved_search_service
+from app.schemas.saved_search import SavedSearchCreate
+from app.services.saved_search_service import MATCH_ALL, search_anchor
+
+
+def make_search(**kwargs) -> SavedSearch:
+    options = {"keywords": [], "title_only": False, "city": None, "company_id": None, "active_companies_only": True, **kwargs}
+    return SavedSearch(
+        id=uuid4(), user_id="dana", name="alert",
+        anchor=search_anchor(options["keywords"], options["city"], options["company_id"]), **options,
+    )
+
+
+def test_search_anchor_prefers_longest_keyword_then_city_then_company():
+    company_id = uuid4()
+
+    assert search_anchor(["Backend", "go"], "Tel Aviv", company_id) == "kw:backend"
+    assert search_anchor([], " tel  AVIV ", company_id) == "city:tel aviv"
+    assert search_anchor([], None, company_id) == f"company:{company_id}"
+    assert search_anchor([], None, None) == MATCH_ALL
+
+
+@pytest.mark.asyncio
+async def test_saved_search_city_is_stored_as_gazetteer_name():
+    with patch.object(saved_search_service, "saved_search_repo") as repo:
+        repo.create = AsyncMock(side_effect=lambda db, search: search)
+        search = await saved_search_service.create_saved_search(
+            AsyncMock(), SavedSearchCreate(user_id="dana", name="alert", city="Tel-Aviv, Israel")
+        )
+
+    assert search.city == "Tel Aviv"
+    assert search.anchor == "city:tel aviv"
+    job = Job(id=uuid4(), company_id=uuid4(), title="Engineer", city="Tel Aviv", status=JobStatus.NEW)
+    assert saved_search_service.matches(search, job, saved_search_service._JobTerms(job), company_active=True)
+
+
+@pytest.mark.asyncio
+async def test_percolate_matches_only_candidate_searches_and_records_notifications():
+    active, inactive = Company(id=uuid4(), status=CompanyStatus.ACTIVE), Company(id=uuid4(), status=CompanyStatus.INACTIVE)
+    backend_ta = Job(id=uuid4(), company_id=active.id, title="Backend Engineer", city="Tel Aviv", status=JobStatus.NEW)
+    backend_haifa = Job(id=uuid4(), company_id=active.id, title="Backend Engineer", city="Haifa", status=JobStatus.NEW)
+    backend_inactive = Job(id=uuid4(), company_id=inactive.id, title="Backend Developer", city="Tel Aviv", status=JobStatus.NEW)
+    archived = Job(id=uuid4(), company_id=active.id, title="Backend Engineer", city="Tel Aviv", status=JobStatus.ARCHIVED)
+
+    search = make_search(keywords=["backend"], city="tel aviv")
+    title_only = make_search(keywords=["python"], title_only=True)
+
+    with patch.object(saved_search_service, "saved_search_repo") as repo, \
+            patch.object(saved_search_service, "company_repo") as company_repo:
+        repo.get_by_anchors = AsyncMock(return_value=[search, title_only])
+        repo.add_notifications = AsyncMock(return_value=1)
+        company_repo.get_by_ids = AsyncMock(return_value=[active, inactive])
+
+        added = await saved_search_service.percolate_jobs(
+            AsyncMock(), [backend_ta, backend_haifa, backend_inactive, archived]
+        )
+
+    assert added == 1
+    anchors = repo.get_by_anchors.await_args.args[1]
+    assert {"kw:backend", "city:tel aviv", MATCH_ALL} <= set(anchors)
+    repo.add_notifications.assert_awaited_once_with(
+        repo.add_notifications.await_args.args[0],
+        [{"user_id": "dana", "saved_search_id": search.id, "job_id": backend_ta.id}],
+    )
+
+
+@pytest.mark.asyncio
+async def test_percolate_skips_lookup_without_candidates():
+    job = Job(id=uuid4(), company_id=uuid4(), title="Designer", status=JobStatus.NEW)
+
+    with patch.object(saved_search_service, "saved_search_repo") as repo, \
+            patch.object(saved_search_service, "company_repo") as company_repo:
+        repo.get_by_anchors = AsyncMock(return_value=[])
+        company_repo.get_by_ids = AsyncMock()
+
+        assert await saved_search_service.percolate_jobs(AsyncMock(), [job]) == 0
+
+    company_repo.get_by_ids.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_acknowledging_a_later_notification_leaves_an_earlier_late_commit_pending():
+    # Notification 5 committed and was acknowledged before the transaction holding 4 committed
+    db = AsyncMock()
+    db.execute.return_value = MagicMock(all=MagicMock(return_value=[(5,)]))
+
+    assert await saved_search_service.acknowledge_notifications(db, "dana", [5]) == 1
+    await saved_search_service.get_pending_notifications(db, "dana")
+
+    ack, pending = (call.args[0].compile(dialect=postgresql.dialect()) for call in db.execute.await_args_list)
+    assert ack.params["id_1"] == [5]
+    assert "search_notifications.delivered_at IS NULL" in str(ack)
+    # Delivery is per row, not an id cursor that 4 would fall behind
+    assert "search_notifications.delivered_at IS NULL" in str(pending)
+    assert "search_notifications.id >" not in str(pending)
@@ -0,0 +1,63 @@
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.core.exceptions import StaleArchivedRunError
+from app.models.job import Job
+from app.providers.scrapers.description import content_hash
+from app.schemas.job import JobSchema
+from app.services import scraping_service
+from app.workers.cpu_stage import CPUStage
+
+
+def _job(external_id, description):
+    return JobSchema(title="Engineer", external_id=external_id, url="https://example.com", description=description, raw_data={})
+
+
+@pytest.mark.asyncio
+async def test_derive_descriptions_skips_unchanged_content(monkeypatch):
+    monkeypatch.setattr(scraping_service, "cpu_stage", CPUStage(workers=0, batch_size=10, max_pending=1))
+    unchanged = _job("1", "<p>Same</p>")
+    changed = _job("2", "<p>New <script>x()</script></p>")
+    new = _job("3", "<p>Fresh</p>")
+
+    await scraping_service._derive_descriptions(
+        [unchanged, changed, new],
+        {"1": content_hash("<p>Same</p>"), "2": content_hash("<p>Old</p>")},
+    )
+
+    assert unchanged.description_text is None
+    assert unchanged.description_hash == content_hash("<p>Same</p>")
+    assert (changed.description, changed.description_text) == ("<p>New </p>", "New")
+    assert new.description_snippet == "Fresh"
+
+
+def test_update_job_reports_location_only_changes():
+    stored = Job(title="Engineer", url="https://example.com", description_hash=content_hash("<p>Same</p>"))
+    job_data = _job("1", "<p>Same</p>")
+    job_data.description_hash = content_hash("<p>Same</p>")
+
+    assert scraping_service._update_job(stored, job_data) is None
+
+    job_data.city, job_data.location_key = "Tel Aviv", "IL:Tel Aviv"
+    assert scraping_service._update_job(stored, job_data) is stored
+    assert stored.city == "Tel Aviv"
+
+
+@pytest.mark.asyncio
+async def test_reparse_refuses_archive_older_than_last_applied_scrape(monkeypatch):
+    company = SimpleNamespace(id=uuid4(), name="Acme")
+    store = MagicMock()
+    store.latest.return_value = {"run_id": str(uuid4()), "started_at": datetime(2026, 1, 1).isoformat()}
+    monkeypatch.setattr(scraping_service, "get_company_by_id", AsyncMock(return_value=company))
+    monkeypatch.setattr(scraping_service.scrape_run_repo, "get_last_applied", AsyncMock(
+        return_value=SimpleNamespace(id=uuid4(), started_at=datetime(2026, 1, 2))
+    ))
+
+    with pytest.raises(StaleArchivedRunError):
+        await scraping_service.reparse_company(AsyncMock(), company.id, store)
+
+    store.replay_transport.assert_not_called()
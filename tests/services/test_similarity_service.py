@@ -0,0 +1,132 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.models.job import Job, JobStatus
+from app.providers.scrapers.embedding import embed
+from app.services import similarity_service
+from app.services.similarity_service import JobVectorIndex
+from app.workers.cpu_stage import CPUStage
+
+TEXTS = [
+    "Backend Engineer\nPython, PostgreSQL and asyncio services",
+    "Senior Python Developer\nPython asyncio services and PostgreSQL",
+    "Account Executive\nEnterprise sales, quota and negotiation",
+    "Sales Manager\nQuota, pipeline and enterprise negotiation",
+]
+
+
+def make_index(tmp_path, **kwargs) -> JobVectorIndex:
+    options = {"nprobe": 2, "train_threshold": 1000, "save_every": 1000, **kwargs}
+    return JobVectorIndex(str(tmp_path / "index.npz"), **options)
+
+
+def test_embeddings_are_unit_vectors_and_similar_texts_score_higher():
+    python, python_2, sales, _ = embed(TEXTS)
+
+    assert np.allclose(np.linalg.norm(embed(TEXTS), axis=1), 1.0, atol=1e-5)
+    assert python @ python_2 > python @ sales
+    assert not embed([""]).any()
+
+
+def test_search_returns_nearest_live_jobs_and_persists(tmp_path):
+    index = make_index(tmp_path)
+    ids = [uuid4() for _ in TEXTS]
+    index.upsert(ids, embed(TEXTS))
+
+    hits = index.search(index.vector_of(ids[0]), k=2, exclude=[ids[0]])
+    assert [job_id for job_id, _ in hits][0] == ids[1]
+
+    index.remove([ids[1]])
+    assert ids[1] not in [job_id for job_id, _ in index.search(index.vector_of(ids[0]), k=3)]
+    assert index.dirty
+
+    index.save()
+    reloaded = make_index(tmp_path)
+    assert len(reloaded) == 3
+    assert np.array_equal(reloaded.vector_of(ids[2]), index.vector_of(ids[2]))
+
+
+def test_trained_index_probes_partitions(tmp_path):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(400, embed(["x"]).shape[1])).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    ids = [uuid4() for _ in range(len(vectors))]
+
+    index = make_index(tmp_path, train_threshold=100, nprobe=20)
+    index.upsert(ids, vectors)
+
+    assert index._centroids is not None
+    (nearest, score), = index.search(vectors[7], k=1)
+    assert nearest == ids[7] and score == pytest.approx(1.0, abs=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_get_similar_jobs_skips_archived_and_unknown_jobs(tmp_path):
+    jobs = [Job(id=uuid4(), title=text.split("\n")[0], description_text=text, status=JobStatus.NEW) for text in TEXTS]
+    jobs[1].status = JobStatus.ARCHIVED
+    index = make_index(tmp_path)
+    index.upsert([job.id for job in jobs], embed(TEXTS))
+
+    with patch.object(similarity_service, "similarity_index", index), patch.object(similarity_service, "job_repo") as repo:
+        repo.get_by_ids = AsyncMock(return_value=jobs[1:3])
+        similar = await similarity_service.get_similar_jobs(AsyncMock(), jobs[0], k=3)
+
+    assert [job for job, _ in similar] == [jobs[2]]
+
+
+def test_index_reloads_when_another_process_saves(tmp_path):
+    ids = [uuid4() for _ in TEXTS]
+    reader = make_index(tmp_path)
+    assert len(reader) == 0
+
+    writer = make_index(tmp_path)
+    writer.upsert(ids, embed(TEXTS))
+    writer.save()
+
+    assert len(reader) == len(TEXTS)
+    assert np.array_equal(reader.vector_of(ids[0]), writer.vector_of(ids[0]))
+
+
+def test_concurrent_saves_merge_instead_of_overwriting(tmp_path):
+    ids = [uuid4() for _ in TEXTS]
+    vectors = embed(TEXTS)
+    first, second = make_index(tmp_path), make_index(tmp_path)
+    first.upsert(ids[:2], vectors[:2])
+    first.save()
+
+    assert len(second) == 2
+    second.upsert(ids[2:], vectors[2:])
+    first.upsert(ids[:1], vectors[3:])
+    first.remove([ids[1]])
+    first.save()
+    second.save()
+
+    merged = make_index(tmp_path)
+    assert len(merged) == 3
+    assert merged.vector_of(ids[1]) is None
+    assert np.array_equal(merged.vector_of(ids[0]), vectors[3])
+    assert np.array_equal(merged.vector_of(ids[3]), vectors[3])
+
+
+@pytest.mark.asyncio
+async def test_index_updates_wait_for_commit(tmp_path, monkeypatch):
+    monkeypatch.setattr(similarity_service, "cpu_stage", CPUStage(workers=0, batch_size=10, max_pending=1))
+    jobs = [Job(id=uuid4(), title=text.split("\n")[0], description_text=text) for text in TEXTS]
+    index = make_index(tmp_path)
+    committed, rolled_back = SimpleNamespace(info={}), SimpleNamespace(info={})
+
+    with patch.object(similarity_service, "similarity_index", index):
+        await similarity_service.index_jobs(committed, jobs[:2])
+        await similarity_service.unindex_jobs(committed, [jobs[1].id])
+        await similarity_service.index_jobs(rolled_back, jobs[2:])
+        assert len(index) == 0
+
+        await similarity_service.apply_index_updates(committed)
+
+    assert len(index) == 1
+    assert index.vector_of(jobs[0].id) is not None
+    assert "similarity_updates" not in committed.info
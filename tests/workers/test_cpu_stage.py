@@ -0,0 +1,27 @@
+import pytest
+
+from app.providers.scrapers.description import derive_batch
+from app.workers.cpu_stage import CPUStage
+
+
+def _double(batch):
+    return [item * 2 for item in batch]
+
+
+@pytest.mark.asyncio
+async def test_inline_stage_preserves_order_across_batches():
+    stage = CPUStage(workers=0, batch_size=3, max_pending=2)
+
+    assert await stage.map(_double, list(range(10))) == [i * 2 for i in range(10)]
+    assert await stage.map(_double, []) == []
+
+
+@pytest.mark.asyncio
+async def test_process_stage_runs_batches_in_worker_processes():
+    stage = CPUStage(workers=1, batch_size=2, max_pending=1)
+    try:
+        result = await stage.map(derive_batch, ["<p>a</p><script>x()</script>", None, "<b onclick='x()'>b</b>"])
+    finally:
+        stage.stop()
+
+    assert [derived.html for derived in result] == ["<p>a</p>", None, "<b>b</b>"]
@@ -0,0 +1,85 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from app.core.exceptions import EnrichmentRateLimitError
+from app.models.company import Company, CompanyStatus
+from app.workers.enrichment_worker import EnrichmentWorkerPool
+from app.workers.rate_limiter import AsyncRateLimiter
+
+
+@pytest.fixture
+def session():
+    session = AsyncMock()
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=session)
+    session_cm.__aexit__ = AsyncMock(return_value=False)
+    with patch("app.workers.enrichment_worker.AsyncSessionLocal", return_value=session_cm):
+        yield session
+
+
+@pytest.fixture
+def pool():
+    pool = EnrichmentWorkerPool(
+        concurrency=1,
+        limiter=AsyncRateLimiter(rate=1000, per=1.0),
+        cooldown=30,
+        max_attempts=2,
+    )
+    pool._queue = asyncio.Queue()
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_pause_blocks_acquire():
+    limiter = AsyncRateLimiter(rate=1000, per=1.0)
+    limiter.pause(0.05)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await limiter.acquire()
+
+    assert loop.time() - started >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_process_records_success(pool, session):
+    task_id, company_id = uuid4(), uuid4()
+    company = Company(name="TestCorp", status=CompanyStatus.ACTIVE)
+
+    with patch("app.workers.enrichment_worker.run_enrichment_for_company", new_callable=AsyncMock) as enrich, \
+         patch("app.workers.enrichment_worker.task_repo") as repo:
+        enrich.return_value = company
+        repo.mark_running = AsyncMock()
+        repo.record_result = AsyncMock()
+
+        await pool._process(task_id, company_id, 1)
+
+        repo.record_result.assert_awaited_once_with(
+            session, task_id, company_id, {"status": "done", "company_status": "ACTIVE"}, True
+        )
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_company_is_requeued_then_failed(pool, session):
+    task_id, company_id = uuid4(), uuid4()
+
+    with patch("app.workers.enrichment_worker.run_enrichment_for_company", new_callable=AsyncMock) as enrich, \
+         patch("app.workers.enrichment_worker.task_repo") as repo:
+        enrich.side_effect = EnrichmentRateLimitError("429")
+        repo.mark_running = AsyncMock()
+        repo.record_result = AsyncMock()
+
+        await pool._process(task_id, company_id, 1)
+
+        assert pool._queue.get_nowait() == (task_id, company_id, 2)
+        assert pool.limiter.paused_for > 0
+        repo.record_result.assert_not_awaited()
+
+        pool.limiter = AsyncRateLimiter(rate=1000, per=1.0)
+        await pool._process(task_id, company_id, 2)
+
+        args = repo.record_result.await_args.args
+        assert args[3]["status"] == "failed"
+        assert args[4] is False